@@ -1,8 +1,10 @@
 import streamlit as st # type: ignore
-import pandas as pd
 import plotly.express as px # type: ignore
 import os
 
+from beyondgdp import COUNTRY, load_cube, map_locations, profiling
+from beyondgdp.maps import animated_choropleth
+
 # CONFIGURATION DE LA PAGE
 
 st.set_page_config(
@@ -10,36 +12,23 @@ st.set_page_config(
     page_icon="🌍",
     layout="wide"
 )
+profiling.start("Page principale")
 
 # CHEMINS DYNAMIQUES
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 ROOT_DIR = os.path.dirname(BASE_DIR)  # Remonte d’un dossier
-DATA_PATH = os.path.join(BASE_DIR, "data_dashboard_BeyondGDP.csv")
 IMG_PATH = os.path.join(BASE_DIR, "images")
 if not os.path.exists(IMG_PATH):
     IMG_PATH = os.path.join(BASE_DIR, "DataVisualisation", "images")
 
-# IMPORTATION ET NETTOYAGE
-
-@st.cache_data
-def load_data():
-    df = pd.read_csv(DATA_PATH)
-    df.columns = [c.strip() for c in df.columns]
-    df = df.rename(columns={
-        "Country Name": "country",
-        "Indicator Name": "indicator",
-        "Year": "year",
-        "Value": "value"
-    })
+# IMPORTATION (cube partagé entre toutes les pages)
 
-    # Filtrer uniquement le PIB
-    df_gdp = df[df["indicator"] == "GDP per capita (current US$)"].copy()
-    df_gdp = df_gdp.dropna(subset=["value"])
-    df_gdp["year"] = df_gdp["year"].astype(int)
-    return df_gdp
+cube = load_cube()
+profiling.lap("chargement")
 
-df = load_data()
+# Uniquement le PIB
+GDP = "GDP per capita (current US$)"
 
 # =================
 # TITRE ET BANNIÈRE
@@ -128,23 +117,41 @@ st.image(
 # ===================================
 st.markdown("---")
 st.subheader("🌐 Carte mondiale du PIB par habitant")
+profiling.lap("textes et images")
 
-years = sorted(df["year"].unique())
-year_selected = st.slider("Choisir une année :", int(min(years)), int(max(years)), 2020)
-
-df_year = df[df["year"] == year_selected]
-
-fig_map = px.choropleth(
-    df_year,
-    locations="country",
-    locationmode="country names",
-    color="value",
-    hover_name="country",
-    color_continuous_scale="Plasma",  
-    title=f"PIB par habitant (USD courants) en {year_selected}",
-    projection="natural earth"
+map_mode = st.radio(
+    "Mode d'affichage :",
+    ["Année unique", "Animation (toutes les années)"],
+    horizontal=True,
+    help="L'animation envoie toutes les années en une fois : le défilement se fait dans le navigateur."
 )
+
+if map_mode == "Animation (toutes les années)":
+    # Figure construite une seule fois par processus, partagée entre les sessions
+    rounded = st.checkbox("Arrondir les valeurs à l'unité (graphique plus léger)", value=True)
+    fig_map = animated_choropleth(
+        cube, GDP,
+        title="PIB par habitant (USD courants) en {year}",
+        decimals=0 if rounded else None,
+        start_year=2020
+    )
+else:
+    year_selected = st.slider("Choisir une année :", int(cube.years.min()), int(cube.years.max()), 2020)
+
+    df_year = cube.frame(indicators=[GDP], years=[year_selected], kind=COUNTRY)
+
+    fig_map = px.choropleth(
+        df_year,
+        **map_locations(cube),  # jointure exacte sur le code ISO3
+        color="value",
+        hover_name="country",
+        color_continuous_scale="Plasma",
+        title=f"PIB par habitant (USD courants) en {year_selected}",
+        projection="natural earth"
+    )
+profiling.lap("carte : filtre et figure")
 st.plotly_chart(fig_map, use_container_width=True)
+profiling.lap("carte : affichage")
 
 # ===================================
 # SECTION 4 : ÉVOLUTION TEMPORELLE DU PIB
@@ -152,14 +159,15 @@ st.plotly_chart(fig_map, use_container_width=True)
 st.markdown("---")
 st.subheader("📈 Évolution temporelle du PIB par habitant")
 
-countries = sorted(df["country"].unique())
+countries = cube.countries_with_data([GDP], kind=COUNTRY)
 selected_countries = st.multiselect(
     "Sélectionner un ou plusieurs pays :",
     countries,
-    default=["France", "United States", "China"]
+    default=[c for c in ["France", "United States", "China"] if c in countries]
 )
 
-df_sel = df[df["country"].isin(selected_countries)]
+df_sel = cube.frame(countries=selected_countries, indicators=[GDP])
+profiling.lap("évolution : filtre")
 
 fig_line = px.line(
     df_sel,
@@ -169,7 +177,9 @@ fig_line = px.line(
     labels={"value": "PIB par habitant (USD courants)", "year": "Année"},
     title="Évolution du PIB par habitant dans le temps"
 )
+profiling.lap("évolution : figure")
 st.plotly_chart(fig_line, use_container_width=True)
+profiling.lap("évolution : affichage")
 
 # Bannière bas de page
 
@@ -197,3 +207,5 @@ st.markdown(
     """,
     unsafe_allow_html=True
 )
+profiling.lap("pied de page")
+profiling.finish()
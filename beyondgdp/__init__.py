@@ -0,0 +1,10 @@
+"""Couche d'accès aux données partagée par les pages du dashboard Beyond GDP."""
+
+from beyondgdp.cube import IndicatorCube, load_cube, map_locations
+from beyondgdp.data import DATA_PATH, iso3_lookup, load_data, read_dataset
+from beyondgdp.entities import COUNTRY, ENTITY_TYPES, entity_type
+
+__all__ = [
+    "COUNTRY", "DATA_PATH", "ENTITY_TYPES", "IndicatorCube", "entity_type", "iso3_lookup",
+    "load_cube", "load_data", "map_locations", "read_dataset"
+]
@@ -0,0 +1,256 @@
+"""Alias français / anglais reconnus par l'assistant.
+
+Clés en minuscules : libellé tel qu'il peut apparaître dans une question ;
+valeurs : nom exact de l'indicateur ou du pays dans le jeu de données.
+"""
+
+# ========================
+# Dictionnaire indicateurs
+# ========================
+
+INDICATOR_ALIASES = {
+    # ========================
+    #  ÉCONOMIE & PRODUCTIVITÉ
+    # ========================
+    # PIB / GDP per capita
+    "pib": "GDP per capita (current US$)",
+    "pib par habitant": "GDP per capita (current US$)",
+    "pib/habitant": "GDP per capita (current US$)",
+    "gdp": "GDP per capita (current US$)",
+    "gdp per capita": "GDP per capita (current US$)",
+    "revenu par habitant": "GDP per capita (current US$)",
+    "richesse par habitant": "GDP per capita (current US$)",
+    "productivité moyenne": "GDP per capita (current US$)",
+
+    # Formation brute de capital
+    "formation brute de capital": "Gross capital formation (% of GDP)",
+    "investissement": "Gross capital formation (% of GDP)",
+    "investissements": "Gross capital formation (% of GDP)",
+    "capital formation": "Gross capital formation (% of GDP)",
+    "gfcf": "Gross capital formation (% of GDP)",
+    "formation capital": "Gross capital formation (% of GDP)",
+    "brut capital": "Gross capital formation (% of GDP)",
+
+    # Inflation
+    "inflation": "Inflation, consumer prices (annual %)",
+    "hausse des prix": "Inflation, consumer prices (annual %)",
+    "prix à la consommation": "Inflation, consumer prices (annual %)",
+    "variation des prix": "Inflation, consumer prices (annual %)",
+
+
+    # ==================
+    #  SANTÉ & BIEN-ÊTRE
+    # ==================
+    # Espérance de vie
+    "espérance de vie": "Life expectancy at birth (years)",
+    "esperance de vie": "Life expectancy at birth (years)",
+    "life expectancy": "Life expectancy at birth (years)",
+    "vie": "Life expectancy at birth (years)",
+    "longevité": "Life expectancy at birth (years)",
+
+    # Dépenses de santé (% PIB)
+    "dépenses de santé": "Current health expenditure (% of GDP)",
+    "depenses de sante": "Current health expenditure (% of GDP)",
+    "santé (% pib)": "Current health expenditure (% of GDP)",
+    "health expenditure": "Current health expenditure (% of GDP)",
+    "dépenses médicales": "Current health expenditure (% of GDP)",
+
+    # Mortalité des -5 ans
+    "mortalité des enfants": "Mortality rate, under-5 (per 1,000 live births)",
+    "mortalité moins de 5 ans": "Mortality rate, under-5 (per 1,000 live births)",
+    "taux mortalité enfant": "Mortality rate, under-5 (per 1,000 live births)",
+    "under 5 mortality": "Mortality rate, under-5 (per 1,000 live births)",
+    "u5mr": "Mortality rate, under-5 (per 1,000 live births)",
+
+
+    # ===========================
+    #  ÉDUCATION & CAPITAL HUMAIN
+    # ===========================
+    # Dépenses publiques d’éducation
+    "dépenses éducation": "Government expenditure on education (% of GDP)",
+    "depenses education": "Government expenditure on education (% of GDP)",
+    "éducation (% pib)": "Government expenditure on education (% of GDP)",
+    "education spending": "Government expenditure on education (% of GDP)",
+
+    # Scolarisation secondaire
+    "scolarisation secondaire": "School enrollment, secondary (% gross)",
+    "taux scolarisation secondaire": "School enrollment, secondary (% gross)",
+    "école secondaire": "School enrollment, secondary (% gross)",
+    "lycée": "School enrollment, secondary (% gross)",
+    "secondary enrollment": "School enrollment, secondary (% gross)",
+
+    # Indice de capital humain
+    "capital humain": "Human capital index (0–1 scale)",
+    "hci": "Human capital index (0–1 scale)",
+    "indice hci": "Human capital index (0–1 scale)",
+    "human capital": "Human capital index (0–1 scale)",
+
+
+    # ========================
+    #  ENVIRONNEMENT & ÉNERGIE
+    # ========================
+    # CO₂ per capita
+    "co2": "CO₂ emissions per capita (t/person, AR5)",
+    "co₂": "CO₂ emissions per capita (t/person, AR5)",
+    "émissions co2": "CO₂ emissions per capita (t/person, AR5)",
+    "émissions carbone": "CO₂ emissions per capita (t/person, AR5)",
+    "pollution carbone": "CO₂ emissions per capita (t/person, AR5)",
+    "carbon emissions": "CO₂ emissions per capita (t/person, AR5)",
+
+    # Renouvelables
+    "énergies renouvelables": "Renewable energy consumption (% of total final energy)",
+    "energies renouvelables": "Renewable energy consumption (% of total final energy)",
+    "renouvelables": "Renewable energy consumption (% of total final energy)",
+    "renewables": "Renewable energy consumption (% of total final energy)",
+    "renewable consumption": "Renewable energy consumption (% of total final energy)",
+
+    # PM2.5
+    "pm2.5": "PM2.5 air pollution (µg/m³)",
+    "pollution pm25": "PM2.5 air pollution (µg/m³)",
+    "pollution particules": "PM2.5 air pollution (µg/m³)",
+    "particules fines": "PM2.5 air pollution (µg/m³)",
+    "air quality": "PM2.5 air pollution (µg/m³)",
+
+
+    # ======================
+    #  INÉGALITÉS & PAUVRETÉ
+    # ======================
+    # Indice de Gini
+    "gini": "Gini index",
+    "indice de gini": "Gini index",
+    "inégalités": "Gini index",
+    "inegalites": "Gini index",
+
+    # Pauvreté monétaire
+    "pauvreté": "Poverty headcount ratio at $3.65/day (2021 PPP)",
+    "pauvrete": "Poverty headcount ratio at $3.65/day (2021 PPP)",
+    "pauvreté extrême": "Poverty headcount ratio at $3.65/day (2021 PPP)",
+    "pauvreté monétaire": "Poverty headcount ratio at $3.65/day (2021 PPP)",
+
+
+    # =========================
+    #  SOCIÉTÉ & INFRASTRUCTURE
+    # =========================
+    # Population urbaine
+    "population urbaine": "Urban population (% of total population)",
+    "urbain": "Urban population (% of total population)",
+    "urbanisation": "Urban population (% of total population)",
+    "urban population": "Urban population (% of total population)",
+
+    # Eau potable
+    "eau potable": "Access to basic drinking water (% of population)",
+    "eau": "Access to basic drinking water (% of population)",
+    "eau propre": "Access to basic drinking water (% of population)",
+    "drinking water": "Access to basic drinking water (% of population)",
+}
+
+# =================
+# Dictionnaire pays
+# =================
+
+COUNTRY_ALIASES = {
+    # Europe
+    "france": "France",
+    "allemagne": "Germany",
+    "royaume-uni": "United Kingdom",
+    "royaume uni": "United Kingdom",
+    "angleterre": "United Kingdom",
+    "etats-unis": "United States",
+    "états-unis": "United States",
+    "usa": "United States",
+    "états unis": "United States",
+    "chine": "China",
+    "inde": "India",
+    "japon": "Japan",
+    "russie": "Russian Federation",
+    "espagne": "Spain",
+    "italie": "Italy",
+    "belgique": "Belgium",
+    "suisse": "Switzerland",
+    "autriche": "Austria",
+    "pologne": "Poland",
+    "portugal": "Portugal",
+    "pays-bas": "Netherlands",
+    "pays bas": "Netherlands",
+    "irlande": "Ireland",
+    "islande": "Iceland",
+    "norvege": "Norway",
+    "norvège": "Norway",
+    "suede": "Sweden",
+    "suède": "Sweden",
+    "danemark": "Denmark",
+    "finlande": "Finland",
+
+    # Afrique
+    "algérie": "Algeria",
+    "algerie": "Algeria",
+    "maroc": "Morocco",
+    "tunisie": "Tunisia",
+    "egypte": "Egypt, Arab Rep.",
+    "égypte": "Egypt, Arab Rep.",
+    "afrique du sud": "South Africa",
+    "nigeria": "Nigeria",
+    "ethiopie": "Ethiopia",
+    "éthiopie": "Ethiopia",
+    "kenya": "Kenya",
+    "cameroun": "Cameroon",
+    "côte d'ivoire": "Cote d'Ivoire",
+    "cote d'ivoire": "Cote d'Ivoire",
+    "senegal": "Senegal",
+    "sénégal": "Senegal",
+    "mali": "Mali",
+    "ghana": "Ghana",
+
+    # Amériques
+    "canada": "Canada",
+    "mexique": "Mexico",
+    "argentine": "Argentina",
+    "brésil": "Brazil",
+    "bresil": "Brazil",
+    "chili": "Chile",
+    "pérou": "Peru",
+    "perou": "Peru",
+    "colombie": "Colombia",
+    "venezuela": "Venezuela, RB",
+    "uruguay": "Uruguay",
+    "paraguay": "Paraguay",
+
+    # Asie
+    "indonésie": "Indonesia",
+    "indonesie": "Indonesia",
+    "corée du sud": "Korea, Rep.",
+    "corée": "Korea, Rep.",
+    "coree": "Korea, Rep.",
+    "turquie": "Turkiye",
+    "saoudite": "Saudi Arabia",
+    "arabie saoudite": "Saudi Arabia",
+    "émirats arabes unis": "United Arab Emirates",
+    "emirats arabes unis": "United Arab Emirates",
+    "qatar": "Qatar",
+    "pakistan": "Pakistan",
+    "bangladesh": "Bangladesh",
+    "vietnam": "Viet Nam",
+    "thaïlande": "Thailand",
+    "thailande": "Thailand",
+    "iran": "Iran, Islamic Rep.",
+    "irak": "Iraq",
+
+    # Océanie
+    "australie": "Australia",
+    "nouvelle-zélande": "New Zealand",
+    "nouvelle zelande": "New Zealand",
+
+    # Europe de l'Est / Balkans
+    "ukraine": "Ukraine",
+    "serbie": "Serbia",
+    "croatie": "Croatia",
+    "roumanie": "Romania",
+    "bulgarie": "Bulgaria",
+    "hongrie": "Hungary",
+    "tchéquie": "Czechia",
+    "slovaquie": "Slovak Republic",
+    "slovénie": "Slovenia",
+    "lettonie": "Latvia",
+    "lituanie": "Lithuania",
+    "estonie": "Estonia",
+}
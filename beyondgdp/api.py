@@ -0,0 +1,292 @@
+"""Service HTTP sans interface autour du moteur de l'assistant.
+
+Le cube est chargé une fois ; un pool de threads de taille fixe traite les
+requêtes en partageant ce cube et les caches de l'assistant (intentions,
+réponses, index). Toutes les réponses sont en JSON ; les figures sont
+renvoyées sous forme de spécification Plotly (``data`` / ``layout``).
+
+Utilisation :
+
+    python -m beyondgdp.api --port 8502 --workers 8
+
+Points d'accès (GET, paramètres dans l'URL) :
+
+    /health                                   état du service et du cache des réponses
+    /ask?q=...[&figure=0]                     question en langage naturel (aussi en POST {"question": ...},
+                                              corps de MAX_BODY octets au plus)
+    /suggest?q=...                            suggestions de saisie
+    /series?country=...&indicator=...         série temporelle d'un pays
+    /panel?country=...&indicator=...&start=...&end=...
+                                              panel long (paramètres répétables ; au moins un pays
+                                              ou un indicateur, PANEL_MAX_CELLS cellules au plus)
+    /countries, /indicators                   libellés disponibles
+    /memory[?sizes=0]                         mémoire du processus et des caches (``beyondgdp.memory``)
+
+Pays et indicateurs acceptent les noms exacts du jeu de données ou les alias
+de l'assistant (« Allemagne », « pib »).
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from beyondgdp.assistant import cache_stats, cached_execute, parse_question
+from beyondgdp.autocomplete import suggest
+from beyondgdp.caching import sampled_lru_cache
+from beyondgdp.cube import load_cube
+from beyondgdp.entities import COUNTRY
+from beyondgdp.matcher import INDICATOR, entity_patterns, normalise
+from beyondgdp.memory import memory_report
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8502
+DEFAULT_WORKERS = min(16, 2 * (os.cpu_count() or 1))
+PAYLOAD_CACHE_SIZE = 256
+PANEL_MAX_CELLS = 1_000_000     # pays × indicateurs × années d'une réponse /panel
+MAX_BODY = 64 * 2**10           # corps d'une requête POST (octets)
+IDLE_TIMEOUT = 1.0              # attente max. d'une requête sur une connexion persistante (s)
+
+
+class NotFound(KeyError):
+    """Pays ou indicateur inconnu : réponse 404."""
+
+
+# =============
+# Sérialisation
+# =============
+def _dumps(payload):
+    return json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+
+
+@sampled_lru_cache(maxsize=PAYLOAD_CACHE_SIZE)
+def answer_payload(intent, cube, figure=True):
+    """Réponse JSON encodée d'une intention, mise en cache comme la réponse elle-même."""
+    answer = cached_execute(intent, cube)
+    payload = dict(
+        text=answer.text,
+        intent=intent._asdict(),
+        table=answer.records() if answer.table is not None else None,
+    )
+    if figure:
+        payload["figure"] = json.loads(answer.figure.to_json()) if answer.figure is not None else None
+    return _dumps(payload)
+
+
+def _records(frame):
+    return frame.astype(object).where(frame.notna(), None).to_dict(orient="records")
+
+
+# ===============
+# Points d'accès
+# ===============
+def _resolve(cube, name, kind):
+    """Nom exact du jeu de données, à partir d'un nom exact ou d'un alias."""
+    index = cube.country_index if kind == COUNTRY else cube.indicator_index
+    if name in index:
+        return name
+    found = entity_patterns(cube).get(normalise(name.strip()))
+    if found is None or found[0] != kind:
+        raise NotFound(f"{'Pays' if kind == COUNTRY else 'Indicateur'} inconnu : {name}")
+    return found[1]
+
+
+def _kind(cube, params, default=None):
+    kind = params.get("kind", [default])[0]
+    if kind is not None and kind not in cube.entity_positions:
+        raise ValueError(f"Type d'entité inconnu : {kind} ({', '.join(cube.entity_positions)})")
+    return kind
+
+
+def _year(params, name):
+    value = params.get(name, [None])[0]
+    return int(value) if value not in (None, "") else None
+
+
+def ask(cube, params):
+    question = params.get("q", [""])[0]
+    figure = params.get("figure", ["1"])[0] not in ("0", "false", "non")
+    return answer_payload(parse_question(question, cube), cube, figure)
+
+
+def complete(cube, params):
+    position, suggestions = suggest(params.get("q", [""])[0], cube)
+    return _dumps(dict(position=position, suggestions=[s._asdict() for s in suggestions]))
+
+
+def series(cube, params):
+    country = _resolve(cube, params.get("country", [""])[0], COUNTRY)
+    indicator = _resolve(cube, params.get("indicator", [""])[0], INDICATOR)
+    values = cube.series(country, indicator)
+    start, end = _year(params, "start"), _year(params, "end")
+    if start is not None:
+        values = values[values.index >= start]
+    if end is not None:
+        values = values[values.index <= end]
+    return _dumps(dict(
+        country=country, indicator=indicator,
+        years=values.index.tolist(), values=values.tolist()
+    ))
+
+
+def panel(cube, params):
+    countries = [_resolve(cube, name, COUNTRY) for name in params.get("country", [])] or None
+    indicators = [_resolve(cube, name, INDICATOR) for name in params.get("indicator", [])] or None
+    if countries is None and indicators is None:
+        raise ValueError("Préciser au moins un pays (country) ou un indicateur (indicator)")
+    start, end = _year(params, "start"), _year(params, "end")
+    years = None
+    if start is not None or end is not None:
+        years = [y for y in cube.years.tolist()
+                 if (start is None or y >= start) and (end is None or y <= end)]
+    kind = _kind(cube, params)
+
+    cells = (len(countries) if countries else len(cube.country_positions(kind=kind))) \
+        * (len(indicators) if indicators else len(cube.indicators)) \
+        * (len(years) if years is not None else len(cube.years))
+    if cells > PANEL_MAX_CELLS:
+        raise ValueError(f"Panel trop volumineux ({cells:,} cellules, {PANEL_MAX_CELLS:,} au plus) : "
+                         "restreindre les pays, les indicateurs ou les années")
+    return _dumps(_records(cube.frame(countries, indicators, years, kind=kind)))
+
+
+def health(cube, params):
+    return _dumps(dict(status="ok", countries=len(cube.countries), indicators=len(cube.indicators),
+                       years=[int(cube.years[0]), int(cube.years[-1])], answer_cache=cache_stats()))
+
+
+ROUTES = {
+    "/health": health,
+    "/ask": ask,
+    "/suggest": complete,
+    "/series": series,
+    "/panel": panel,
+    "/countries": lambda cube, params: _dumps(cube.entities(_kind(cube, params, COUNTRY))),
+    "/indicators": lambda cube, params: _dumps(list(cube.indicators)),
+    "/memory": lambda cube, params: _dumps(memory_report(params.get("sizes", ["1"])[0] not in ("0", "false", "non"), cube)),
+}
+
+
+# =======
+# Serveur
+# =======
+class QueryHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"       # connexions persistantes
+    disable_nagle_algorithm = True      # en-têtes et corps envoyés sans attendre l'acquittement
+    # Chaque connexion occupe un worker : un client inactif ou lent le libère vite
+    timeout = IDLE_TIMEOUT
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        self._dispatch(url.path, parse_qs(url.query))
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True        # corps non lu : la connexion n'est plus utilisable
+            return self._send(400, _dumps(dict(error="En-tête Content-Length invalide")))
+        if length > MAX_BODY:
+            self.close_connection = True
+            return self._send(413, _dumps(dict(error=f"Corps limité à {MAX_BODY} octets")))
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return self._send(400, _dumps(dict(error="Corps JSON invalide")))
+        if not isinstance(body, dict):
+            return self._send(400, _dumps(dict(error="Le corps JSON doit être un objet ({\"question\": ...})")))
+        params = parse_qs(url.query)
+        if "question" in body:
+            params["q"] = [str(body["question"])]
+        self._dispatch(url.path, params)
+
+    def _dispatch(self, path, params):
+        route = ROUTES.get(path.rstrip("/") or "/")
+        if route is None:
+            return self._send(404, _dumps(dict(error=f"Point d'accès inconnu : {path}")))
+        try:
+            self._send(200, route(self.server.cube, params))
+        except NotFound as exc:
+            self._send(404, _dumps(dict(error=exc.args[0])))
+        except ValueError as exc:
+            self._send(400, _dumps(dict(error=str(exc))))
+        except Exception as exc:
+            self.log_error("%s : %r", path, exc)
+            self._send(500, _dumps(dict(error="Erreur interne")))
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_request(self, code="-", size="-"):
+        # Erreurs toujours journalisées ; requêtes réussies seulement en mode verbeux
+        if self.server.verbose:
+            super().log_request(code, size)
+
+
+class PooledHTTPServer(HTTPServer):
+    """Serveur HTTP dont les connexions sont traitées par un pool de threads borné."""
+
+    request_queue_size = 128
+
+    def __init__(self, address, cube, workers=DEFAULT_WORKERS, verbose=False):
+        super().__init__(address, QueryHandler)
+        self.cube = cube
+        self.verbose = verbose
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="beyondgdp-api")
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._process, request, client_address)
+
+    def _process(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+def make_server(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=DEFAULT_WORKERS, verbose=False):
+    """Serveur prêt à l'emploi, cube et index de l'assistant déjà chargés."""
+    cube = load_cube()
+    parse_question("", cube)        # construit automates et index avant la première requête
+    suggest("a", cube)
+    return PooledHTTPServer((host, port), cube, workers, verbose)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Service HTTP JSON de l'assistant Beyond GDP")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="adresse d'écoute (défaut : %(default)s)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port (défaut : %(default)s)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="requêtes traitées en parallèle (défaut : %(default)s)")
+    parser.add_argument("--verbose", action="store_true", help="journalise chaque requête")
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port, args.workers, args.verbose)
+    print(f"Service disponible sur http://{args.host}:{server.server_port} ({args.workers} workers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
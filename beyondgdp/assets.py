@@ -0,0 +1,41 @@
+"""Bannières des pages thématiques, préparées une fois par processus.
+
+Les Ruban*.png d'origine pèsent 0,3 à 0,65 Mo pour un affichage de 55 px de
+haut. Chaque image est redimensionnée à la hauteur affichée (×2 pour les
+écrans haute densité), réduite à une palette de 256 couleurs puis encodée en
+base64 une seule fois : quelques Ko par bannière au lieu de plusieurs centaines.
+"""
+
+import base64
+import io
+import os
+
+from PIL import Image # type: ignore
+
+from beyondgdp.caching import sampled_lru_cache
+from beyondgdp.data import BASE_DIR
+
+IMG_PATH = os.path.join(BASE_DIR, "images")
+
+BANNER_HEIGHT = 55      # hauteur affichée (px CSS)
+PIXEL_RATIO = 2         # écrans haute densité
+
+
+def banner_png(path, height=BANNER_HEIGHT * PIXEL_RATIO):
+    """Octets PNG de l'image redimensionnée à ``height`` px de haut, en palette."""
+    with Image.open(path) as img:
+        img = img.convert("RGBA")
+        width = max(1, round(img.width * height / img.height))
+        img = img.resize((width, height), Image.LANCZOS)
+        img = img.quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+@sampled_lru_cache(maxsize=None)
+def banner_src(filename):
+    """URI ``data:`` de la bannière ``images/<filename>``, prête pour une balise ``<img>``."""
+    png = banner_png(os.path.join(IMG_PATH, filename))
+    return "data:image/png;base64," + base64.b64encode(png).decode()
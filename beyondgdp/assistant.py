@@ -0,0 +1,422 @@
+"""Assistant d'analyse locale : question → intention structurée → réponse.
+
+L'analyse d'une question (``parse_question``) et son exécution (``execute``)
+sont séparées. L'analyse produit une ``Intent`` — pays, indicateurs, années,
+agrégation, limite — sans toucher aux données ; le planificateur l'exécute
+ensuite par lectures vectorisées dans le cube partagé. Une même lecture sert
+ainsi les questions multi-pays, multi-indicateurs et multi-années.
+"""
+
+import re
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+import plotly.express as px # type: ignore
+
+from beyondgdp.caching import sampled_lru_cache
+from beyondgdp.entities import COUNTRY
+from beyondgdp.fuzzy import fuzzy_matcher
+from beyondgdp.matcher import INDICATOR, entity_matcher, normalise
+from beyondgdp.ranking import decile, percentile, quartile, rank_tables
+from beyondgdp.search import indicator_search
+
+# Les motifs ci-dessous portent sur le texte normalisé (minuscules, sans accents)
+YEAR = re.compile(r"\b(?:19|20)\d{2}\b")
+
+# Périodes : « entre 2000 et 2020 », « de 2000 à 2020 », « 2000-2020 », « depuis 1990 »
+_Y = r"((?:19|20)\d{2})"
+PERIOD = re.compile(rf"(?:\bentre\s+{_Y}\s+et\s+{_Y}|\bde\s+{_Y}\s+a\s+{_Y}|\b{_Y}\s*[-–]\s*{_Y}\b)")
+SINCE = re.compile(rf"\b(?:depuis|a partir de|apres)\s+(?:l'an\s+)?{_Y}\b")
+
+SERIES_WORDS = ("evolution", "tendance", "trajectoire", "historique", "au fil du temps")
+
+# Unité d'un indicateur cité juste avant : « (% PIB) », « en % du PIB »
+UNIT_PREFIX = re.compile(r"%\s*(?:du\s+|de\s+la\s+|de\s+|d')?$")
+
+# Agrégations reconnues
+MIN = "min"         # k pays aux valeurs les plus faibles
+MAX = "max"         # k pays aux valeurs les plus élevées
+RANK = "rank"       # rang / percentile des pays cités
+
+LOWEST_WORDS = ("plus faible", "plus bas", "minimum", "derniers", "dernieres", "bottom")
+HIGHEST_WORDS = ("plus eleve", "maximum", "plus haut", "premiers", "premieres", "meilleurs")
+
+# « top 10 », « les 5 premiers », « les premiers 5 », « 20 pays »
+TOP_K = re.compile(r"\btop\s*(\d{1,3})\b|\b(\d{1,3})\s+(?:premiers|premieres|derniers|dernieres|meilleurs|pays)\b"
+                   r"|\b(?:premiers|premieres|derniers|dernieres|meilleurs)\s+(\d{1,3})\b")
+RANK_WORDS = re.compile(r"\b(?:rang|position|classement|classee?)\b")
+QUANTILES = {"decile": 10, "quartile": 4, "centile": 100, "percentile": 100}
+QUANTILE_WORDS = re.compile(r"\b(" + "|".join(QUANTILES) + r")s?\b")
+DEFAULT_RANKING_SIZE = 10
+
+NO_DATA = "Aucune donnée trouvée."
+NO_INDICATOR = "Quel indicateur souhaitez-vous analyser ?"
+NOT_UNDERSTOOD = "Je comprends la question, mais j’ai besoin d’un pays, d’une année ou d’un indicateur."
+
+
+class Intent(NamedTuple):
+    """Intention extraite d'une question (hachable, comparable, sans données)."""
+    countries: tuple = ()
+    indicators: tuple = ()
+    years: tuple = ()
+    period: Optional[tuple] = None      # (début, fin) ; fin ``None`` = jusqu'à la dernière année
+    series: bool = False                # réponse attendue sous forme de série temporelle
+    aggregation: Optional[str] = None
+    limit: Optional[int] = None
+    quantile: Optional[int] = None      # 10 : décile, 4 : quartile, 100 : percentile
+
+
+class Answer:
+    """Réponse de l'assistant : une phrase, éventuellement un tableau et une figure."""
+
+    def __init__(self, text, table=None, figure=None):
+        self.text = text
+        self.table = table
+        self.figure = figure
+
+    def records(self):
+        """Lignes du tableau (index nommé, ex. ``year``, remis en colonne), valeurs manquantes à ``None``.
+
+        Les colonnes à plusieurs niveaux (indicateur, pays) des séries
+        multi-indicateurs sont aplaties en clés texte « indicateur | pays ».
+        """
+        if self.table is None:
+            return []
+        table = self.table
+        if isinstance(table.columns, pd.MultiIndex):
+            table = table.set_axis([" | ".join(map(str, key)) for key in table.columns], axis=1)
+        if table.index.name is not None:
+            table = table.reset_index()
+        return table.astype(object).where(table.notna(), None).to_dict(orient="records")
+
+
+# ===========================
+# Analyse : question → Intent
+# ===========================
+def parse_question(question, cube):
+    """Intention normalisée d'une question.
+
+    Pays et indicateurs sont triés : deux formulations d'une même demande
+    (« France et Japon » / « Japon et France ») donnent la même ``Intent``,
+    qui sert de clé au cache des réponses.
+    """
+    q = normalise(question)
+
+    # Pays et indicateurs cités : un seul passage de l'automate d'alias, puis
+    # correction des mots restés inconnus (« Allemangne ») par l'index trigramme ;
+    # « % du PIB » qualifie l'indicateur qui précède et n'en ajoute pas un second
+    exact = entity_matcher(cube).find(q)
+    fuzzy = fuzzy_matcher(cube).find(q, [(start, end) for start, end, _ in exact])
+    mentions = _drop_unit_qualifiers(q, sorted(exact + fuzzy, key=lambda hit: hit[0]))
+    countries = tuple(dict.fromkeys(name for kind, name in mentions if kind == COUNTRY))
+    indicators = tuple(dict.fromkeys(name for kind, name in mentions if kind == INDICATOR))
+
+    # Repli : recherche dans les noms anglais officiels (index inversé pondéré par IDF)
+    if not indicators:
+        indicators = tuple(ind for ind, _ in indicator_search(cube).search(q, limit=1))
+
+    period = _parse_period(q)
+    years = () if period else tuple(sorted({int(y) for y in YEAR.findall(q)}))
+    series = period is not None or any(word in q for word in SERIES_WORDS)
+
+    aggregation, limit, quantile = _parse_ranking(q, countries)
+
+    return Intent(tuple(sorted(countries)), tuple(sorted(indicators)), years, period, series,
+                  aggregation, limit, quantile)
+
+
+def _drop_unit_qualifiers(q, hits):
+    """(type, nom) des mentions, sans les indicateurs cités comme unité d'un autre (« % du PIB »)."""
+    indicators = sum(1 for _, _, (kind, _) in hits if kind == INDICATOR)
+    mentions = []
+    for start, _, (kind, name) in hits:
+        if kind == INDICATOR and indicators > 1 and UNIT_PREFIX.search(q, 0, start):
+            indicators -= 1
+            continue
+        mentions.append((kind, name))
+    return mentions
+
+
+def _parse_ranking(q, countries):
+    """(agrégation, limite, quantile) d'une question de classement, ``None`` sinon."""
+    top = TOP_K.search(q)
+    k = int(top.group(1) or top.group(2) or top.group(3)) if top else None
+    quantile = QUANTILE_WORDS.search(q)
+    quantile = QUANTILES[quantile.group(1)] if quantile else None
+    ranked = RANK_WORDS.search(q) is not None
+    lowest = any(word in q for word in LOWEST_WORDS)
+    highest = any(word in q for word in HIGHEST_WORDS)
+
+    # « Rang de la France », « décile de l'Inde » : position des pays cités
+    if countries and (ranked or quantile):
+        return RANK, None, quantile
+    if not (k or quantile or ranked or lowest or highest):
+        return None, None, None
+
+    aggregation = MIN if lowest else MAX
+    if k:
+        return aggregation, k, None
+    if quantile:
+        return aggregation, None, quantile          # taille déduite du nombre de pays classés
+    return aggregation, DEFAULT_RANKING_SIZE if ranked else 1, None
+
+
+def _parse_period(q):
+    """Période (début, fin) citée dans la question, ``None`` s'il n'y en a pas."""
+    match = PERIOD.search(q)
+    if match:
+        start, end = sorted(int(y) for y in match.groups() if y)
+        return start, end
+    match = SINCE.search(q)
+    if match:
+        return int(match.group(1)), None
+    return None
+
+
+# ===========================
+# Exécution : Intent → Answer
+# ===========================
+def execute(intent, cube):
+    """Exécute une intention contre le cube."""
+    indicators = [ind for ind in intent.indicators if ind in cube.indicator_index]
+    if not indicators:
+        return Answer(NO_INDICATOR)
+
+    if intent.aggregation == RANK:
+        return _ranks(intent, cube, indicators)
+    if intent.countries:
+        return _lookup(intent, cube, indicators)
+    if intent.aggregation in (MIN, MAX):
+        return _top(intent, cube, indicators)
+    return Answer(NOT_UNDERSTOOD)
+
+
+def _requested_years(intent, cube):
+    """Années du cube couvertes par la question (liste vide : aucune précisée ou aucune connue)."""
+    if intent.period:
+        start, end = intent.period
+        end = int(cube.years.max()) if end is None else end
+        return [int(y) for y in cube.years if start <= y <= end]
+    return [y for y in intent.years if y in cube.year_index]
+
+
+def _asked_years(intent):
+    return bool(intent.years or intent.period)
+
+
+def _latest_year(panel, cube):
+    """Dernière année renseignée d'un panel (pays, indicateurs, toutes années), ``None`` si vide."""
+    filled = np.flatnonzero(~np.isnan(panel).all(axis=(0, 1)))
+    return int(cube.years[filled[-1]]) if len(filled) else None
+
+
+def _lookup(intent, cube, indicators):
+    """Valeurs des pays demandés ; sans année précisée, la dernière année renseignée
+    (ou toute la série pour une question d'évolution)."""
+    years = _requested_years(intent, cube)
+    if not years:
+        if _asked_years(intent):
+            return Answer(NO_DATA)
+        if intent.series:
+            return _series(intent, cube, indicators, years=None)
+        latest = _latest_year(cube.panel(intent.countries, indicators), cube)
+        if latest is None:
+            return Answer(NO_DATA)
+        years = [latest]
+
+    if intent.series:
+        return _series(intent, cube, indicators, years)
+
+    d = cube.frame(countries=intent.countries, indicators=indicators, years=years)
+    if d.empty:
+        return Answer(NO_DATA)
+
+    if len(d) == 1:
+        return Answer(_sentence(d.iloc[0]), table=d)
+
+    # Un indicateur, une année, plusieurs pays → tableau + nuage de points
+    if len(indicators) == 1 and len(years) == 1 and d["country"].nunique() > 1:
+        ind, year = indicators[0], years[0]
+        pivot = d.pivot(index="year", columns="country", values="value")
+        fig = px.scatter(
+            d,
+            x="country",
+            y="value",
+            color="country",
+            hover_data={"year": True, "country": True, "value": True},
+            size="value",
+            size_max=40,
+            title=f"{ind} en {year}"
+        )
+        return Answer("Voici la comparaison demandée :", table=pivot, figure=fig)
+
+    return Answer("Voici les données correspondant à votre requête :", table=d)
+
+
+def _series(intent, cube, indicators, years):
+    """Séries temporelles des pays demandés : une seule lecture du cube, tableau + courbes."""
+    d = cube.frame(countries=intent.countries, indicators=indicators, years=years)
+    if d.empty:
+        return Answer(NO_DATA)
+
+    first, last = int(d["year"].min()), int(d["year"].max())
+    if len(indicators) == 1:
+        table = d.pivot(index="year", columns="country", values="value")
+        title = f"{indicators[0]} ({first}–{last})"
+    else:
+        table = d.pivot(index="year", columns=["indicator", "country"], values="value")
+        title = f"Évolution {first}–{last}"
+
+    fig = px.line(
+        d,
+        x="year",
+        y="value",
+        color="country",
+        facet_row="indicator" if len(indicators) > 1 else None,
+        markers=True,
+        labels={"year": "Année", "value": "Valeur", "country": "Pays", "indicator": "Indicateur"},
+        title=title
+    )
+    if len(indicators) > 1:
+        fig.update_yaxes(matches=None)          # échelles propres à chaque indicateur
+
+    return Answer(f"Voici l'évolution demandée ({first}–{last}) :", table=table, figure=fig)
+
+
+def _ranked_years(intent, cube, filled):
+    """Couples (indicateur, année) à classer, d'après ``filled`` (indicateurs, années du cube).
+
+    Sans année précisée : la dernière année renseignée de chaque indicateur,
+    ou toutes les années pour une question d'évolution.
+    """
+    years = _requested_years(intent, cube)
+    if years:
+        keep = np.zeros_like(filled)
+        keep[:, cube.year_positions(years)] = True
+        return filled & keep
+    if _asked_years(intent):                # années demandées mais absentes du cube
+        return np.zeros_like(filled)
+    if intent.series:
+        return filled
+
+    last = filled.shape[1] - 1 - np.argmax(filled[:, ::-1], axis=1)
+    keep = np.zeros_like(filled)
+    keep[np.arange(len(filled)), last] = True
+    return filled & keep
+
+
+def _top(intent, cube, indicators):
+    """k pays aux valeurs les plus élevées (ou faibles), lus dans les classements précalculés.
+
+    Les agrégats régionaux sont exclus du classement. Pour les valeurs les plus
+    faibles, ``rank`` compte à partir de la plus faible (rang 1 = minimum).
+    """
+    tables = rank_tables(cube)
+    ii = cube.indicator_positions(indicators)
+    pairs = _ranked_years(intent, cube, tables.counts[ii] > 0)
+
+    rows = []
+    for i, y in zip(*np.nonzero(pairs)):
+        ind, year = indicators[i], int(cube.years[y])
+        n = int(tables.counts[ii[i], y])
+        k = intent.limit or -(-n // intent.quantile)               # quantile : ⌈n / q⌉ pays
+        lowest = intent.aggregation == MIN
+        for position in tables.top(ind, year, k, lowest=lowest):
+            rank = int(tables.ranks[position, ii[i], y])
+            if lowest:
+                rank = n - rank + 1
+            rows.append((rank, cube.countries[position], ind, year, float(cube.values[position, ii[i], y])))
+
+    if not rows:
+        return Answer(NO_DATA)
+
+    d = pd.DataFrame(rows, columns=["rank", "country", "indicator", "year", "value"])
+    if len(d) == 1:
+        return Answer(_sentence(d.iloc[0]), table=d)
+
+    fig = None
+    if d[["indicator", "year"]].drop_duplicates().shape[0] == 1:
+        fig = px.bar(
+            d,
+            x="value",
+            y="country",
+            orientation="h",
+            text="rank",
+            labels={"value": d["indicator"].iloc[0], "country": ""},
+            title=f"{d['indicator'].iloc[0]} en {d['year'].iloc[0]}"
+        )
+        fig.update_yaxes(categoryorder="array", categoryarray=d["country"].tolist()[::-1])
+    return Answer("Voici le classement demandé :", table=d, figure=fig)
+
+
+def _ranks(intent, cube, indicators):
+    """Rang et percentile des pays cités parmi les pays réels, avec le quartile ou le
+    décile demandé (décile par défaut ; rien de plus pour un percentile)."""
+    tables = rank_tables(cube)
+    ii = cube.indicator_positions(indicators)
+    # (colonne, libellé, calcul) du quantile demandé ; un percentile est déjà dans le tableau
+    if intent.quantile == 100:
+        quantile = None
+    elif intent.quantile == 4:
+        quantile = ("quartile", "quartile", quartile)
+    else:
+        quantile = ("decile", "décile", decile)
+
+    rows = []
+    for country in intent.countries:
+        c = cube.country_index[country]
+        # Années où ce pays est classé, pour chaque indicateur
+        pairs = _ranked_years(intent, cube, tables.ranks[c, ii] > 0)
+        for i, y in zip(*np.nonzero(pairs)):
+            rank, n = int(tables.ranks[c, ii[i], y]), int(tables.counts[ii[i], y])
+            row = (country, indicators[i], int(cube.years[y]), float(cube.values[c, ii[i], y]),
+                   rank, n, round(percentile(rank, n), 1))
+            rows.append(row + ((quantile[2](rank, n),) if quantile else ()))
+
+    if not rows:
+        return Answer(NO_DATA)
+
+    columns = ["country", "indicator", "year", "value", "rank", "out_of", "percentile"]
+    d = pd.DataFrame(rows, columns=columns + ([quantile[0]] if quantile else []))
+    if len(d) == 1:
+        row = d.iloc[0]
+        detail = f", {quantile[1]} {row[quantile[0]]}" if quantile else ""
+        return Answer(
+            f"En **{row['year']}**, **{row['country']}** est classé **{row['rank']}ᵉ sur {row['out_of']}** "
+            f"pour **{row['indicator']}** (valeur {row['value']:,.2f}, percentile {row['percentile']}{detail}).",
+            table=d
+        )
+    return Answer("Voici les rangs demandés :", table=d)
+
+
+def _sentence(row):
+    return (f"En **{row['year']}**, la valeur de **{row['indicator']}** "
+            f"pour **{row['country']}** est **{row['value']:,.2f}**.")
+
+
+# ===========================
+# Cache des réponses
+# ===========================
+RESULT_CACHE_SIZE = 256
+
+
+@sampled_lru_cache(maxsize=RESULT_CACHE_SIZE)
+def cached_execute(intent, cube):
+    """``execute`` mis en cache par intention (LRU borné, partagé par toutes les sessions).
+
+    Les réponses (tableaux, figures) sont partagées : elles ne doivent pas
+    être modifiées par l'appelant.
+    """
+    return execute(intent, cube)
+
+
+def cache_stats():
+    """Compteurs du cache des réponses : succès, échecs, taille courante et maximale."""
+    info = cached_execute.cache_info()
+    return dict(hits=info.hits, misses=info.misses, size=info.currsize, maxsize=info.maxsize)
+
+
+def smart_query(question, cube):
+    """Analyse puis exécute une question en langage naturel (réponses en cache par intention)."""
+    return cached_execute(parse_question(question, cube), cube)
@@ -0,0 +1,145 @@
+"""Suggestions de saisie pour la question de l'assistant.
+
+Les libellés reconnus par l'assistant (alias français des pays et des
+indicateurs, noms de pays du jeu de données, années couvertes) sont rangés
+une fois par processus dans un arbre de préfixes. Chaque nœud conserve ses
+meilleures complétions, déjà triées : une suggestion ne coûte qu'une descente
+dans l'arbre, de la longueur du mot en cours de saisie, quel que soit le
+nombre de libellés.
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+from beyondgdp.aliases import COUNTRY_ALIASES, INDICATOR_ALIASES
+from beyondgdp.entities import COUNTRY
+from beyondgdp.matcher import INDICATOR, normalise
+
+YEAR = "year"
+
+MAX_SUGGESTIONS = 8
+MAX_WORDS = 4           # libellés de quatre mots au plus (« formation brute de capital »)
+
+WORD = re.compile(r"[\w'’./%₂-]+")
+ELISION = re.compile(r"\b\w['’](?=\w)")   # « l'espérance », « d'émissions »
+CAPITAL = re.compile(r"(^|[\s-])(\w+)")
+SMALL_WORDS = {"d", "de", "des", "du", "et", "l", "la", "le", "les"}
+
+
+class Suggestion(NamedTuple):
+    label: str      # texte inséré dans la question
+    kind: str       # COUNTRY, INDICATOR ou YEAR
+    name: str       # pays ou indicateur du jeu de données, année
+
+
+class PrefixTrie:
+    """Arbre de préfixes ``clé normalisée → suggestions``.
+
+    Les entrées doivent être insérées par ordre de préférence : chaque nœud
+    garde les ``size`` premières entrées passant par lui, une seule par pays
+    ou indicateur visé.
+    """
+
+    def __init__(self, size=MAX_SUGGESTIONS):
+        self.size = size
+        self.children = [{}]
+        self.best = [[]]
+
+    def insert(self, key, suggestion):
+        state = 0
+        for char in key:
+            nxt = self.children[state].get(char)
+            if nxt is None:
+                nxt = len(self.children)
+                self.children[state][char] = nxt
+                self.children.append({})
+                self.best.append([])
+            state = nxt
+            best = self.best[state]
+            if len(best) < self.size and all(s[1:] != suggestion[1:] for s in best):
+                best.append(suggestion)
+
+    def complete(self, prefix, limit=MAX_SUGGESTIONS):
+        """Meilleures suggestions commençant par ``prefix`` (normalisé)."""
+        state = 0
+        for char in prefix:
+            state = self.children[state].get(char)
+            if state is None:
+                return []
+        return self.best[state][:limit]
+
+
+def _capitalise(alias):
+    """« royaume-uni » → « Royaume-Uni », « corée du sud » → « Corée du Sud »."""
+    return CAPITAL.sub(
+        lambda m: m.group(0) if m.group(2) in SMALL_WORDS else m.group(1) + m.group(2).capitalize(),
+        alias
+    )
+
+
+def _accented(label):
+    return normalise(label) != label.lower()
+
+
+@lru_cache(maxsize=None)
+def completion_trie(cube):
+    """Arbre partagé des libellés de pays, d'indicateurs et des années du cube."""
+    labels = {}     # forme sans tiret → (suggestion, formes normalisées saisissables, origine)
+
+    def add(label, kind, name, origin):
+        # Une seule suggestion par libellé (« états-unis » / « etats unis »), accentuée de préférence
+        key = normalise(label)
+        folded = key.replace("-", " ")
+        suggestion, keys, first = labels.get(folded, (None, set(), origin))
+        if suggestion is None or (_accented(label) and not _accented(suggestion.label)):
+            suggestion = Suggestion(label, kind, name)
+        labels[folded] = (suggestion, keys | {key, folded}, first)
+
+    for alias, name in COUNTRY_ALIASES.items():
+        if name in cube.country_index:
+            add(_capitalise(alias), COUNTRY, name, 0)
+    for name in cube.entities(COUNTRY):
+        add(name, COUNTRY, name, 1)
+    for alias, name in INDICATOR_ALIASES.items():
+        if name in cube.indicator_index:
+            add(alias, INDICATOR, name, 0)
+
+    trie = PrefixTrie()
+    # Libellés courts d'abord, alias français avant noms anglais du jeu de données
+    for folded in sorted(labels, key=lambda folded: (len(folded), labels[folded][2], folded)):
+        suggestion, keys, _ = labels[folded]
+        for key in sorted(keys):
+            trie.insert(key, suggestion)
+    for year in sorted(cube.years, reverse=True):                           # années récentes d'abord
+        trie.insert(str(year), Suggestion(str(year), YEAR, str(year)))
+    return trie
+
+
+def suggest(text, cube, limit=MAX_SUGGESTIONS):
+    """(position, suggestions) pour la fin de ``text`` en cours de saisie.
+
+    Les derniers mots sont essayés du plus long au plus court fragment
+    (« espérance de » avant « de ») ; un fragment peut aussi commencer après
+    une élision (« l'espérance de » → « espérance de »). ``position`` est le
+    début du fragment complété dans ``text``, à remplacer par ``Suggestion.label``.
+    """
+    if not text or text[-1].isspace():
+        return len(text), []
+
+    trie = completion_trie(cube)
+    words = list(WORD.finditer(text))[-MAX_WORDS:]
+    starts = [
+        start for match in words
+        for start in [match.start()] + [match.start() + m.end() for m in ELISION.finditer(match.group())]
+    ]
+    for start in starts:
+        found = trie.complete(normalise(text[start:]), limit)
+        if found:
+            return start, found
+    return len(text), []
+
+
+def apply_suggestion(text, position, suggestion):
+    """Question complétée par la suggestion retenue, prête pour le mot suivant."""
+    return f"{text[:position]}{suggestion.label} "
@@ -0,0 +1,191 @@
+"""Mode lot de l'assistant : un fichier de questions → un fichier de réponses.
+
+Chaque question suit le chemin de ``smart_query``, comme sur la page de
+l'assistant (mêmes alias, même cache de réponses). Les questions sont
+exécutées en parallèle contre le cube partagé et chaque réponse est écrite
+dès qu'elle est prête, dans l'ordre d'achèvement : la colonne ``index``
+donne la ligne de la question dans le fichier d'entrée.
+
+Utilisation :
+
+    python -m beyondgdp.batch questions.txt reponses.csv --workers 8
+    python -m beyondgdp.batch questions.txt reponses.parquet --executor process
+
+Le fichier d'entrée contient une question par ligne ; les lignes vides et
+celles commençant par ``#`` sont ignorées. L'écriture Parquet nécessite
+``pyarrow``.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+import numpy as np
+
+from beyondgdp.assistant import cache_stats, cached_execute, parse_question
+from beyondgdp.cube import load_cube
+
+COLUMNS = ["index", "question", "status", "answer", "countries", "indicators", "years", "table", "seconds"]
+
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+PARQUET_BATCH = 256     # lignes accumulées avant chaque écriture Parquet
+
+
+def read_questions(path):
+    """(numéro de ligne, question) des lignes non vides du fichier."""
+    with open(path, encoding="utf-8") as f:
+        return [
+            (number, line.strip()) for number, line in enumerate(f, start=1)
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+
+
+def answer_row(index, question, cube=None):
+    """Ligne de résultat d'une question ; une erreur est consignée, pas propagée."""
+    cube = cube if cube is not None else load_cube()
+    start = time.perf_counter()
+    try:
+        # Équivalent de smart_query, l'intention servant aussi aux colonnes de sortie
+        intent = parse_question(question, cube)
+        answer = cached_execute(intent, cube)
+        table = json.dumps(answer.records(), ensure_ascii=False) if answer.table is not None else ""
+        period = f"{intent.period[0]}-{intent.period[1] or ''}" if intent.period else None
+        row = dict(
+            status="ok", answer=answer.text,
+            countries="; ".join(intent.countries), indicators="; ".join(intent.indicators),
+            years=period or "; ".join(map(str, intent.years)),
+            table=table,
+        )
+    except Exception as exc:    # une question mal formée ne doit pas interrompre le lot
+        row = dict(status="erreur", answer=f"{type(exc).__name__}: {exc}",
+                   countries="", indicators="", years="", table="")
+    return dict(row, index=index, question=question, seconds=time.perf_counter() - start)
+
+
+def _warm_up():
+    """Initialisation d'un processus de travail : cube et index chargés une fois."""
+    parse_question("", load_cube())
+
+
+class CsvSink:
+    def __init__(self, path):
+        self.file = open(path, "w", encoding="utf-8", newline="")
+        self.writer = csv.DictWriter(self.file, fieldnames=COLUMNS)
+        self.writer.writeheader()
+
+    def write(self, row):
+        self.writer.writerow(row)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetSink:
+    def __init__(self, path):
+        try:
+            import pyarrow as pa                # type: ignore
+            import pyarrow.parquet as pq        # type: ignore
+        except ImportError as exc:
+            raise SystemExit("L'écriture Parquet nécessite pyarrow (pip install pyarrow).") from exc
+        self.pa = pa
+        self.schema = pa.schema([
+            (name, pa.int64() if name == "index" else pa.float64() if name == "seconds" else pa.string())
+            for name in COLUMNS
+        ])
+        self.writer = pq.ParquetWriter(path, self.schema)
+        self.rows = []
+
+    def write(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= PARQUET_BATCH:
+            self.flush()
+
+    def flush(self):
+        if self.rows:
+            self.writer.write_table(self.pa.Table.from_pylist(self.rows, schema=self.schema))
+            self.rows = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+
+def open_sink(path):
+    """Destination des résultats, selon l'extension (``.csv`` ou ``.parquet``)."""
+    output_dir = os.path.dirname(path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    return ParquetSink(path) if path.lower().endswith((".parquet", ".pq")) else CsvSink(path)
+
+
+def run_batch(questions, output_path, workers=DEFAULT_WORKERS, executor="thread", log=sys.stdout):
+    """Exécute les questions en parallèle et écrit chaque réponse dès qu'elle est prête.
+
+    Renvoie le résumé du lot (nombre de questions, erreurs, durée, débit, latences).
+    """
+    start = time.perf_counter()
+    sink = open_sink(output_path)
+    latencies, errors = [], 0
+    try:
+        if executor == "process":
+            # Chaque processus charge son propre cube (une fois, à l'initialisation)
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_warm_up)
+            futures = [pool.submit(answer_row, index, question) for index, question in questions]
+        else:
+            # Threads : un seul cube et un seul cache de réponses, partagés
+            cube = load_cube()
+            pool = ThreadPoolExecutor(max_workers=workers)
+            futures = [pool.submit(answer_row, index, question, cube) for index, question in questions]
+
+        with pool:
+            for future in as_completed(futures):
+                row = future.result()
+                sink.write(row)
+                latencies.append(row["seconds"])
+                errors += row["status"] != "ok"
+                if log is not None:
+                    print(f"{row['seconds'] * 1000:9.1f} ms  [{row['status']}] {row['question']}", file=log)
+    finally:
+        sink.close()
+
+    elapsed = time.perf_counter() - start
+    latencies = np.array(latencies) * 1000
+    return dict(
+        questions=len(latencies), errors=errors, seconds=elapsed,
+        throughput=len(latencies) / elapsed if elapsed else 0.0,
+        p50_ms=float(np.percentile(latencies, 50)) if len(latencies) else 0.0,
+        p95_ms=float(np.percentile(latencies, 95)) if len(latencies) else 0.0,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pose à l'assistant toutes les questions d'un fichier")
+    parser.add_argument("input_path", help="fichier texte, une question par ligne")
+    parser.add_argument("output_path", help="résultats (.csv ou .parquet)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="questions traitées en parallèle (défaut : %(default)s)")
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread",
+                        help="threads partageant le cube, ou processus séparés (défaut : %(default)s)")
+    parser.add_argument("--quiet", action="store_true", help="n'affiche pas le temps de chaque question")
+    args = parser.parse_args(argv)
+
+    questions = read_questions(args.input_path)
+    summary = run_batch(questions, args.output_path, args.workers, args.executor,
+                        log=None if args.quiet else sys.stdout)
+
+    print(f"Résultats sauvegardés : {args.output_path}")
+    print(f"{summary['questions']} questions ({summary['errors']} erreurs) en {summary['seconds']:.2f} s"
+          f" — {summary['throughput']:.1f} questions/s")
+    print(f"Latence : p50 {summary['p50_ms']:.1f} ms, p95 {summary['p95_ms']:.1f} ms")
+    if args.executor == "thread":
+        stats = cache_stats()
+        print(f"Cache des réponses : {stats['hits']} succès, {stats['misses']} échecs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""Banc d'essai des chemins critiques du dashboard.
+
+Trois familles de mesures, chacune répétée et résumée par ses percentiles :
+
+- chargement : ``read_dataset`` à froid (CSV relu, caches vidés), puis
+  ``load_data`` / ``load_cube`` à chaud ;
+- pages : exécution complète de Home.py et de chaque page (``AppTest`` de
+  Streamlit, sans navigateur), pour une série de pays et d'années ;
+- assistant : ``smart_query`` sur un corpus de questions en français, cache
+  des réponses vidé (à froid) puis rempli (à chaud).
+
+Pour chaque cas : nombre de mesures, latences p50 / p95 / moyenne / max en
+millisecondes, pic d'allocation Python (``tracemalloc``, mesuré sur une
+exécution supplémentaire) et mémoire résidente maximale du processus. Une
+page qui lève une exception est notée en erreur (``page.<nom>`` → ``error``)
+sans interrompre les autres mesures ; le code de sortie est alors non nul.
+
+Utilisation :
+
+    python -m beyondgdp.benchmark --output bench.json
+    python -m beyondgdp.benchmark --quick --compare bench.json
+
+Le fichier JSON produit peut être comparé à celui d'une version précédente
+avec ``--compare``.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from beyondgdp.assistant import cached_execute, parse_question, smart_query
+from beyondgdp.cube import load_cube
+from beyondgdp.data import BASE_DIR, DATA_PATH, load_data, read_dataset
+
+PAGES = [
+    "Home.py",
+    "pages/1_Economie.py",
+    "pages/2_Sante.py",
+    "pages/3_Education.py",
+    "pages/4_Environnement.py",
+    "pages/5_Inegalites.py",
+    "pages/6_Societe.py",
+    "pages/7_AssistantIA.py",
+]
+
+COUNTRIES = ["France", "United States", "China", "India", "Brazil", "Japan", "Germany", "South Africa"]
+YEARS = [1990, 2000, 2010, 2020]
+
+QUESTIONS = [
+    "PIB par habitant en France en 2010",
+    "Quel est le PIB par habitant de l'Allemagne en 2019 ?",
+    "Comparaison de l'espérance de vie entre France, Japon et États-Unis en 2005",
+    "Quel pays a le Gini le plus faible en 2020 ?",
+    "Dépenses de santé (% PIB) en Allemagne en 2018",
+    "Population urbaine en Inde en 1990",
+    "Quel pays a les émissions de CO₂ les plus élevées en 2015 ?",
+    "Évolution du PIB par habitant de la Chine entre 2000 et 2020",
+    "Espérance de vie au Japon et en Inde depuis 1990",
+    "Top 10 des pays pour le PIB par habitant en 2020",
+    "Rang de la France pour les émissions de CO₂ en 2018",
+    "Taux d'inflation au Brésil en 2015",
+    "Mortalité infantile en Afrique du Sud en 2000",
+    "Accès à l'eau potable en Inde et en Chine en 2010",
+    "Part des énergies renouvelables en Allemagne depuis 2005",
+    "Pollution aux particules fines en Chine en 2017",
+    "Scolarisation secondaire au Brésil entre 1995 et 2015",
+    "Les 5 pays avec l'espérance de vie la plus faible en 2010",
+    "Dans quel décile se situe l'Inde pour le PIB par habitant en 2020 ?",
+    "Indice de capital humain au Japon en 2020",
+    "Investissement en % du PIB en Chine en 2008",
+    "Taux de pauvreté en Inde en 2011",
+    "Dépenses d'éducation en France et en Allemagne en 2015",
+    "Émissions de CO2 par habitant des États-Unis depuis 1990",
+    "Quel pays a le PIB par habitant le plus élevé en 2000 ?",
+    "Allemangne PIB 2010",
+    "esperence de vie au japon en 2015",
+    "Gini du Brésil entre 2000 et 2020",
+    "Classement de la Chine pour la pollution de l'air en 2015",
+    "Population urbaine au Japon, en France et au Brésil en 2020",
+]
+
+
+# ======
+# Mesure
+# ======
+def _rss_mb():
+    """Mémoire résidente maximale du processus depuis son lancement (Mo)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10   # octets sous macOS, Ko ailleurs
+
+
+def _peak_mb(func):
+    """Pic d'allocation Python (Mo) pendant un appel de ``func``."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def summarise(durations, peak_mb):
+    ms = np.asarray(durations) * 1000
+    return dict(
+        n=len(ms),
+        p50_ms=float(np.percentile(ms, 50)), p95_ms=float(np.percentile(ms, 95)),
+        mean_ms=float(ms.mean()), max_ms=float(ms.max()),
+        peak_mb=round(peak_mb, 2), rss_mb=round(_rss_mb(), 1),
+    )
+
+
+def measure(calls, setup=None):
+    """Durée (s) de chaque appel de ``calls`` ; ``setup`` est exécuté avant chacun, hors mesure."""
+    durations = []
+    for call in calls:
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        call()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+# ===========
+# Chargement
+# ===========
+def _clear_data_caches():
+    load_data.cache_clear()
+    load_cube.cache_clear()
+
+
+def bench_load(repeat):
+    read = lambda: read_dataset(DATA_PATH)     # noqa: E731
+    cube = lambda: (load_data(), load_cube())  # noqa: E731
+    return {
+        "load.read_dataset_cold": summarise(measure([read] * repeat), _peak_mb(read)),
+        "load.load_cube_cold": summarise(measure([cube] * repeat, setup=_clear_data_caches),
+                                         _peak_mb(lambda: (_clear_data_caches(), cube()))),
+        "load.load_cube_warm": summarise(measure([cube] * (repeat * 100)), _peak_mb(cube)),
+    }
+
+
+# =====
+# Pages
+# =====
+def _page_runs(page, countries, years):
+    """Exécutions successives d'une page, en balayant pays puis années.
+
+    Renvoie la durée de la première exécution et celles du balayage.
+    """
+    from streamlit.testing.v1 import AppTest    # type: ignore
+
+    at = AppTest.from_file(os.path.join(BASE_DIR, page), default_timeout=120)
+    first = measure([at.run])[0]
+    if at.exception:
+        raise RuntimeError(f"{page} : {at.exception[0].message}")
+
+    sweep = []
+
+    def step(change):
+        change()
+        sweep.extend(measure([at.run]))
+        if at.exception:
+            raise RuntimeError(f"{page} : {at.exception[0].message}")
+
+    if at.selectbox:
+        for country in countries:
+            if country in at.selectbox[0].options:
+                step(lambda: at.selectbox[0].set_value(country))
+    if at.slider:
+        for year in years:
+            if at.slider[0].min <= year <= at.slider[0].max:
+                step(lambda: at.slider[0].set_value(year))
+    if page == "Home.py":
+        # Carte ouverte en « Année unique » : l'animation est mesurée en dernier
+        step(lambda: at.radio[0].set_value("Animation (toutes les années)"))
+    return first, sweep
+
+
+def bench_pages(countries, years, pages=PAGES):
+    from streamlit import logger    # type: ignore
+
+    logger.set_log_level("error")   # avertissements de dépréciation répétés à chaque exécution
+    results = {}
+    for page in pages:
+        name = os.path.splitext(os.path.basename(page))[0]
+        try:
+            first, sweep = _page_runs(page, countries, years)
+            peak = _peak_mb(lambda: _page_runs(page, countries[:1], years[:1]))
+        except Exception as exc:    # page en erreur : les autres sont mesurées quand même
+            results[f"page.{name}"] = dict(error=str(exc))
+            continue
+        results[f"page.{name}.first"] = summarise([first], peak)
+        if sweep:
+            results[f"page.{name}.sweep"] = summarise(sweep, peak)
+    return results
+
+
+# =========
+# Assistant
+# =========
+def bench_assistant(questions, repeat):
+    cube = load_cube()
+    calls = [lambda q=q: smart_query(q, cube) for q in questions]
+    parses = [lambda q=q: parse_question(q, cube) for q in questions]
+
+    cold = []
+    for _ in range(repeat):
+        cached_execute.cache_clear()
+        cold += measure(calls)
+    warm = measure(calls * repeat)
+
+    def cold_pass():
+        cached_execute.cache_clear()
+        for call in calls:
+            call()
+
+    return {
+        "assistant.parse": summarise(measure(parses * repeat), _peak_mb(lambda: [p() for p in parses])),
+        "assistant.smart_query_cold": summarise(cold, _peak_mb(cold_pass)),
+        "assistant.smart_query_warm": summarise(warm, _peak_mb(lambda: [c() for c in calls])),
+    }
+
+
+# =========
+# Rapport
+# =========
+def environment(data=True):
+    """Version du code et des bibliothèques ; ``data=False`` évite de charger le jeu de données."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    import streamlit  # type: ignore
+
+    info = dict(
+        date=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        commit=commit, python=platform.python_version(), platform=platform.platform(),
+        pandas=pd.__version__, numpy=np.__version__, streamlit=streamlit.__version__,
+        data_path=DATA_PATH,
+    )
+    if data:
+        info["data_rows"] = len(load_data())
+    return info
+
+
+def compare(results, previous):
+    """Affiche le rapport p50 actuel / précédent des cas communs aux deux exécutions."""
+    print(f"\n{'cas':<40}{'p50 avant':>12}{'p50 après':>12}{'rapport':>10}")
+    for name, case in results.items():
+        before = previous.get(name)
+        if before and before.get("p50_ms") and "p50_ms" in case:
+            print(f"{name:<40}{before['p50_ms']:>12.2f}{case['p50_ms']:>12.2f}"
+                  f"{case['p50_ms'] / before['p50_ms']:>9.2f}×")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banc d'essai du dashboard Beyond GDP")
+    parser.add_argument("--output", default="benchmark.json", help="fichier JSON produit (défaut : %(default)s)")
+    parser.add_argument("--repeat", type=int, default=5, help="répétitions par mesure (défaut : %(default)s)")
+    parser.add_argument("--quick", action="store_true", help="balayage réduit (2 pays, 2 années, 1 répétition)")
+    parser.add_argument("--skip-pages", action="store_true", help="n'exécute pas les pages Streamlit")
+    parser.add_argument("--compare", help="résultats JSON d'une exécution précédente")
+    args = parser.parse_args(argv)
+
+    repeat = 1 if args.quick else args.repeat
+    countries = COUNTRIES[:2] if args.quick else COUNTRIES
+    years = YEARS[-2:] if args.quick else YEARS
+
+    results = {}
+    results.update(bench_load(repeat))
+    if not args.skip_pages:
+        results.update(bench_pages(countries, years))
+    results.update(bench_assistant(QUESTIONS, repeat))
+
+    print(f"{'cas':<40}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'pic Mo':>9}")
+    for name, case in results.items():
+        if "error" in case:
+            print(f"{name:<40}  erreur : {case['error']}")
+        else:
+            print(f"{name:<40}{case['n']:>6}{case['p50_ms']:>10.2f}{case['p95_ms']:>10.2f}{case['peak_mb']:>9.1f}")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(dict(environment=environment(), results=results), f, ensure_ascii=False, indent=2)
+    print(f"\nRésultats sauvegardés : {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(results, json.load(f)["results"])
+
+    failed = [name for name, case in results.items() if "error" in case]
+    if failed:
+        raise SystemExit(f"\n{len(failed)} cas en erreur : {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Caches ``lru_cache`` partagés, avec un échantillon de valeurs pour mesurer leur taille.
+
+Les réponses de l'assistant, les figures et les matrices de corrélation sont
+mises en cache par question, pays ou jeu d'indicateurs. ``sampled_lru_cache``
+garde en plus les dernières valeurs distinctes renvoyées, à partir desquelles
+``beyondgdp.memory`` estime la taille de chaque cache sans lire le contenu
+interne de ``lru_cache``.
+"""
+
+import threading
+from collections import deque
+from functools import lru_cache, wraps
+
+# Valeurs gardées pour estimer la taille du cache
+SAMPLE_SIZE = 5
+
+
+def sampled_lru_cache(maxsize=128):
+    """``lru_cache`` qui garde en plus ses ``SAMPLE_SIZE`` dernières valeurs distinctes.
+
+    ``beyondgdp.memory.cache_report`` estime la taille du cache à partir de cet échantillon
+    (``samples``), sans lire le contenu interne de ``lru_cache``. Au plus
+    ``SAMPLE_SIZE`` valeurs sorties du cache restent ainsi en mémoire.
+    """
+    def decorator(function):
+        cached = lru_cache(maxsize=maxsize)(function)
+        samples, lock = deque(maxlen=SAMPLE_SIZE), threading.Lock()
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            value = cached(*args, **kwargs)
+            with lock:
+                if not any(sample is value for sample in samples):
+                    samples.append(value)
+            return value
+
+        def cache_clear():
+            with lock:
+                cached.cache_clear()
+                samples.clear()
+
+        def current_samples():
+            with lock:
+                return list(samples)
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_parameters = cached.cache_parameters
+        wrapper.cache_clear = cache_clear
+        wrapper.samples = current_samples
+        return wrapper
+    return decorator
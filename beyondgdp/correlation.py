@@ -0,0 +1,105 @@
+"""Matrices de corrélation de tous les pays pour un ensemble d'indicateurs.
+
+Pour un jeu d'indicateurs (celui d'une page thématique), les coefficients de
+Pearson — ou de Spearman — sont calculés pour tous les pays en une seule passe
+vectorisée sur le cube, en « pairwise-complete » comme ``DataFrame.corr()`` :
+chaque paire d'indicateurs n'utilise que les années où les deux sont
+renseignés. Le nombre d'années communes est conservé pour chaque coefficient.
+
+Le résultat est mis en cache par jeu d'indicateurs : changer de pays dans
+« Matrice de corrélation » se résume à lire une tranche de tableau.
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from beyondgdp.caching import sampled_lru_cache
+
+METHODS = ("pearson", "spearman")
+
+
+class CorrelationMatrices:
+    """Coefficients ``r`` (pays, k, k) et années communes ``n`` (pays, k, k)."""
+
+    def __init__(self, cube, indicators, method, r, n):
+        self.cube = cube
+        self.indicators = list(indicators)
+        self.method = method
+        self.r = r
+        self.n = n
+
+    def frames(self, country):
+        """Matrice des coefficients et matrice des années communes d'un pays."""
+        c = self.cube.country_index[country]
+        corr = pd.DataFrame(self.r[c], index=self.indicators, columns=self.indicators)
+        overlap = pd.DataFrame(self.n[c], index=self.indicators, columns=self.indicators)
+        return corr, overlap
+
+
+def _standardise(panel):
+    """Centre et réduit chaque série : limite les pertes de précision des sommes de carrés."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)    # séries entièrement vides
+        mean = np.nanmean(panel, axis=2, keepdims=True)
+        scale = np.nanmax(np.abs(panel - mean), axis=2, keepdims=True)
+    scale = np.where(scale > 0, scale, 1.0)
+    return (panel - mean) / scale
+
+
+def _pearson(panel):
+    """Pearson pairwise-complete pour un panel (pays, k, années) contenant des NaN."""
+    present = ~np.isnan(panel)
+    m = present.astype(np.float64)
+    x = np.where(present, _standardise(panel), 0.0)
+
+    n = np.einsum("cky,cly->ckl", m, m)
+    sx = np.einsum("cky,cly->ckl", x, m)            # Σ x_k sur les années communes à (k, l)
+    sxx = np.einsum("cky,cly->ckl", x * x, m)
+    sxy = np.einsum("cky,cly->ckl", x, x)
+    sy = sx.transpose(0, 2, 1)
+    syy = sxx.transpose(0, 2, 1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = sxy - sx * sy / n
+        var_x = sxx - sx * sx / n
+        var_y = syy - sy * sy / n
+        r = cov / np.sqrt(var_x * var_y)
+
+    r[(n < 2) | ~(var_x > 0) | ~(var_y > 0)] = np.nan
+    return np.clip(r, -1.0, 1.0), n
+
+
+def _spearman(panel):
+    """Spearman pairwise-complete : rangs recalculés sur les années communes de chaque paire."""
+    n_countries, k, _ = panel.shape
+    r = np.full((n_countries, k, k), np.nan)
+    n = np.zeros((n_countries, k, k))
+
+    for a in range(k):
+        for b in range(a, k):
+            both = ~np.isnan(panel[:, a]) & ~np.isnan(panel[:, b])
+            ranks = np.stack([
+                pd.DataFrame(np.where(both, panel[:, i], np.nan)).rank(axis=1).to_numpy()
+                for i in (a, b)
+            ], axis=1)
+            r_pair, n_pair = _pearson(ranks)
+            r[:, a, b] = r[:, b, a] = r_pair[:, 0, 1]
+            n[:, a, b] = n[:, b, a] = n_pair[:, 0, 1]
+    return r, n
+
+
+@sampled_lru_cache(maxsize=None)
+def correlation_matrices(cube, indicators, method="pearson"):
+    """Matrices de corrélation de tous les pays du cube, mises en cache par (indicateurs, méthode).
+
+    ``indicators`` doit être un tuple (clé de cache), dans l'ordre d'affichage.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Méthode de corrélation inconnue : {method!r} (attendu : {', '.join(METHODS)})")
+
+    indicators = tuple(ind for ind in indicators if ind in cube.indicator_index)
+    panel = cube.panel(indicators=indicators).astype(np.float64)
+    r, n = _pearson(panel) if method == "pearson" else _spearman(panel)
+    return CorrelationMatrices(cube, indicators, method, r.astype(np.float32), n.astype(np.int16))
@@ -0,0 +1,205 @@
+"""Cube dense pays × indicateur × année pour des lectures par indexation directe.
+
+Le DataFrame long est converti une seule fois en un tableau NumPy float32 de
+forme (pays, indicateurs, années), NaN pour les valeurs manquantes. Une série,
+une coupe annuelle ou un panel s'obtiennent alors par simple indexation, sans
+parcourir les ~115 000 lignes à chaque interaction.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from beyondgdp.data import DATA_PATH, iso3_lookup, load_data
+from beyondgdp.entities import ENTITY_TYPES, classify_entities
+
+
+class IndicatorCube:
+    """Valeurs (pays, indicateurs, années) et tables d'index des trois axes.
+
+    ``iso3`` donne le code ISO3 de chaque pays (aligné sur ``countries``),
+    ``None`` lorsque le CSV ne contient pas les codes. ``entity_types`` classe
+    chaque entité (pays réel ou agrégat WDI, voir ``beyondgdp.entities``) et
+    ``entity_positions`` en donne les positions précalculées par type.
+
+    ``series_min`` / ``series_max`` (pays, indicateurs) et ``normalised``
+    (même forme que ``values``) contiennent la normalisation min-max de chaque
+    série pays × indicateur, calculée une seule fois à la construction.
+
+    ``path`` est le CSV d'origine lorsque le cube vient de ``load_cube``.
+    """
+
+    def __init__(self, values, countries, indicators, years, iso3=None, path=None):
+        self.values = values
+        self.path = path
+        self.countries = list(countries)
+        self.indicators = list(indicators)
+        self.years = np.asarray(years, dtype=np.int16)
+        self.iso3 = list(iso3) if iso3 is not None else [None] * len(self.countries)
+
+        self.country_index = {c: i for i, c in enumerate(self.countries)}
+        self.iso3_index = {code: i for i, code in enumerate(self.iso3) if code}
+        self.indicator_index = {ind: i for i, ind in enumerate(self.indicators)}
+        self.year_index = {int(y): i for i, y in enumerate(self.years)}
+
+        # Pays réels vs agrégats régionaux / de revenu / de prêt
+        self.entity_types = np.asarray(classify_entities(self.countries, self.iso3))
+        self.entity_positions = {
+            kind: np.flatnonzero(self.entity_types == kind) for kind in ENTITY_TYPES
+        }
+
+        self.series_min, self.series_max, self.normalised = _minmax_normalise(values)
+
+        # Cubes en lecture seule : ils sont partagés par toutes les sessions
+        for array in (self.values, self.series_min, self.series_max, self.normalised):
+            array.setflags(write=False)
+
+    @classmethod
+    def from_frame(cls, df, path=None):
+        """Construit le cube depuis le DataFrame long typé de ``load_data()`` (lu depuis ``path``)."""
+        countries = df["country"].cat.categories
+        indicators = df["indicator"].cat.categories
+        year_min, year_max = int(df["year"].min()), int(df["year"].max())
+        years = np.arange(year_min, year_max + 1)
+
+        values = np.full((len(countries), len(indicators), len(years)), np.nan, dtype=np.float32)
+        values[
+            df["country"].cat.codes.to_numpy(),
+            df["indicator"].cat.codes.to_numpy(),
+            df["year"].to_numpy() - year_min
+        ] = df["value"].to_numpy()
+
+        codes = iso3_lookup(df)
+        return cls(values, countries, indicators, years, iso3=[codes.get(c) for c in countries], path=path)
+
+    @property
+    def has_iso3(self):
+        return bool(self.iso3_index)
+
+    # -------------------------------
+    # Conversion libellés → positions
+    # -------------------------------
+    def _positions(self, index, keys):
+        if keys is None:
+            return np.arange(len(index))
+        return np.array([index[k] for k in keys if k in index], dtype=np.intp)
+
+    def country_positions(self, countries=None, kind=None):
+        """Positions des pays demandés ; ``kind`` restreint à un type d'entité."""
+        if countries is None and kind is not None:
+            return self.entity_positions[kind]
+        positions = self._positions(self.country_index, countries)
+        if kind is not None:
+            positions = positions[self.entity_types[positions] == kind]
+        return positions
+
+    def entities(self, kind):
+        """Noms des entités d'un type donné (ex. ``"country"``), par ordre alphabétique."""
+        return [self.countries[i] for i in self.entity_positions[kind]]
+
+    def indicator_positions(self, indicators=None):
+        return self._positions(self.indicator_index, indicators)
+
+    def year_positions(self, years=None):
+        if years is None:
+            return np.arange(len(self.years))
+        return self._positions(self.year_index, [int(y) for y in years])
+
+    # -------------------------------
+    # Lectures
+    # -------------------------------
+    def series(self, country, indicator):
+        """Série temporelle d'un pays pour un indicateur (années sans valeur exclues)."""
+        row = self.values[self.country_index[country], self.indicator_index[indicator]]
+        keep = ~np.isnan(row)
+        return pd.Series(row[keep], index=pd.Index(self.years[keep], name="year"), name=indicator)
+
+    def cross_section(self, indicator, year, kind=None):
+        """Valeurs de toutes les entités (ou d'un seul type) pour un indicateur et une année."""
+        ci = self.country_positions(kind=kind)
+        col = self.values[ci, self.indicator_index[indicator], self.year_index[int(year)]]
+        keep = ~np.isnan(col)
+        return pd.Series(col[keep], index=pd.Index(np.asarray(self.countries, dtype=object)[ci[keep]], name="country"),
+                         name=indicator)
+
+    def panel(self, countries=None, indicators=None, years=None):
+        """Sous-cube (pays, indicateurs, années) ; ``None`` sélectionne tout l'axe."""
+        return self.values[np.ix_(
+            self.country_positions(countries),
+            self.indicator_positions(indicators),
+            self.year_positions(years)
+        )]
+
+    def countries_with_data(self, indicators=None, kind=None):
+        """Entités ayant au moins une valeur pour l'un des indicateurs, par ordre alphabétique."""
+        ci = self.country_positions(kind=kind)
+        sub = self.values[np.ix_(ci, self.indicator_positions(indicators))]
+        has_data = ~np.isnan(sub).all(axis=(1, 2))
+        return [self.countries[i] for i in ci[has_data]]
+
+    def frame(self, countries=None, indicators=None, years=None, kind=None, normalised=False):
+        """Panel au format long (country, indicator, year, value), valeurs manquantes exclues.
+
+        Les lignes sont ordonnées pays, puis indicateur (dans l'ordre demandé), puis année.
+        Une colonne ``iso3`` est ajoutée lorsque les codes pays sont connus ;
+        ``kind`` restreint le résultat à un type d'entité (ex. pays réels).
+        ``normalised=True`` ajoute la colonne précalculée ``value_norm`` (0–1).
+        """
+        ci = self.country_positions(countries, kind)
+        ii = self.indicator_positions(indicators)
+        yi = self.year_positions(years)
+
+        sub = self.values[np.ix_(ci, ii, yi)]
+        c, i, y = np.nonzero(~np.isnan(sub))
+
+        out = pd.DataFrame({
+            "country": np.asarray(self.countries, dtype=object)[ci[c]],
+            "indicator": np.asarray(self.indicators, dtype=object)[ii[i]],
+            "year": self.years[yi[y]],
+            "value": sub[c, i, y]
+        })
+        if self.has_iso3:
+            out.insert(1, "iso3", np.asarray(self.iso3, dtype=object)[ci[c]])
+        if normalised:
+            out["value_norm"] = self.normalised[np.ix_(ci, ii, yi)][c, i, y]
+        return out
+
+
+def _minmax_normalise(values):
+    """Min, max et valeurs normalisées (0–1) de chaque série, le long de l'axe des années.
+
+    Une série constante est normalisée à 0, comme l'ancien ``groupby().transform``
+    des pages thématiques.
+    """
+    missing = np.isnan(values)
+    lo = np.where(missing, np.inf, values).min(axis=2)
+    hi = np.where(missing, -np.inf, values).max(axis=2)
+
+    empty = np.isinf(lo)
+    lo[empty] = np.nan
+    hi[empty] = np.nan
+
+    span = (hi - lo)[:, :, None]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        normalised = np.where(span > 0, (values - lo[:, :, None]) / span, 0)
+    normalised[missing] = np.nan
+
+    return lo.astype(np.float32), hi.astype(np.float32), normalised.astype(np.float32)
+
+
+@lru_cache(maxsize=None)
+def load_cube(path=DATA_PATH):
+    """Cube partagé, construit au premier appel du processus depuis ``load_data()``."""
+    return IndicatorCube.from_frame(load_data(path), path)
+
+
+def map_locations(cube):
+    """Arguments ``px.choropleth`` de localisation : jointure exacte sur le code ISO3.
+
+    Repli sur la résolution approximative par nom de pays uniquement si le
+    CSV a été produit sans la colonne "Country Code".
+    """
+    if cube.has_iso3:
+        return dict(locations="iso3", locationmode="ISO-3")
+    return dict(locations="country", locationmode="country names")
@@ -0,0 +1,90 @@
+"""Chargement unique et typé de data_dashboard_BeyondGDP.csv.
+
+Toutes les pages importent ``load_data()`` depuis ce module : le CSV est lu
+une seule fois par processus, et chaque session reçoit le même DataFrame
+(aucune copie picklée comme avec ``st.cache_data``). Le DataFrame partagé
+ne doit donc jamais être modifié en place par une page.
+"""
+
+import os
+import weakref
+from functools import lru_cache
+
+import pandas as pd
+
+# CHEMINS D’ACCÈS
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# BEYONDGDP_DATA permet de pointer vers un autre fichier (ex. jeu synthétique de beyondgdp.synthetic)
+DATA_PATH = os.environ.get("BEYONDGDP_DATA") or os.path.join(BASE_DIR, "data_dashboard_BeyondGDP.csv")
+
+# Colonnes du CSV produit par le notebook → noms utilisés dans les pages
+COLUMNS = {
+    "Country Name": "country",
+    "Country Code": "iso3",
+    "Indicator Name": "indicator",
+    "Year": "year",
+    "Value": "value"
+}
+
+# Représentation colonnaire : libellés en catégories, année sur 16 bits,
+# valeurs en float32 (précision largement suffisante pour l'affichage)
+DTYPES = {
+    "country": "category",
+    "iso3": "category",
+    "indicator": "category",
+    "year": "int16",
+    "value": "float32"
+}
+
+
+def read_dataset(path=DATA_PATH):
+    """Lit le CSV et renvoie un DataFrame long typé (country, iso3, indicator, year, value).
+
+    La colonne ``iso3`` est absente si le CSV a été produit par une version
+    du notebook qui supprimait "Country Code".
+    """
+    # Les en-têtes peuvent contenir des espaces parasites : on les lit d'abord
+    header = pd.read_csv(path, nrows=0).columns
+    names = {raw: COLUMNS[raw.strip()] for raw in header if raw.strip() in COLUMNS}
+
+    df = pd.read_csv(
+        path,
+        usecols=list(names),
+        dtype={raw: DTYPES[name] for raw, name in names.items() if name != "year"}
+    )
+    df = df.rename(columns=names)
+
+    df = df.dropna(subset=["value"])
+    columns = [c for c in DTYPES if c in df.columns]
+    df = df.astype({c: DTYPES[c] for c in columns})
+    for col in df.select_dtypes("category").columns:
+        df[col] = df[col].cat.remove_unused_categories()
+
+    return df[columns].reset_index(drop=True)
+
+
+def iso3_lookup(df):
+    """Table pays → code ISO3 (vide si le CSV ne contient pas les codes)."""
+    if "iso3" not in df.columns:
+        return {}
+    pairs = df[["country", "iso3"]].drop_duplicates("country").dropna()
+    return dict(zip(pairs["country"].astype(str), pairs["iso3"].astype(str)))
+
+
+# DataFrames déjà chargés par ``load_data``, par chemin ; la référence faible
+# ne retient pas un DataFrame sorti du cache (``load_data.cache_clear()``)
+_loaded = weakref.WeakValueDictionary()
+
+
+@lru_cache(maxsize=None)
+def load_data(path=DATA_PATH):
+    """Renvoie le jeu de données partagé, chargé au premier appel du processus."""
+    df = read_dataset(path)
+    _loaded[path] = df
+    return df
+
+
+def loaded_data(path=DATA_PATH):
+    """DataFrame déjà chargé par ``load_data(path)``, ``None`` sinon ; ne lit jamais le CSV."""
+    return _loaded.get(path)
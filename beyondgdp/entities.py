@@ -0,0 +1,95 @@
+"""Classification des entités WDI : pays réels et agrégats.
+
+Le fichier WDI mélange les 217 économies avec des agrégats régionaux, de
+revenu ou de prêt (« Africa Eastern and Southern », « High income »,
+« IDA total »…). La classification est faite une fois à l'ingestion/au
+chargement, à partir du code ISO3 lorsqu'il est connu, sinon du libellé.
+"""
+
+# Types d'entités
+COUNTRY = "country"
+REGION = "region"
+INCOME = "income"
+LENDING = "lending"
+OTHER = "other"          # agrégats analytiques (OCDE, PMA, petits États…)
+
+ENTITY_TYPES = [COUNTRY, REGION, INCOME, LENDING, OTHER]
+
+# ===========================
+# Agrégats WDI : code → (nom, type)
+# ===========================
+WDI_AGGREGATES = {
+    # Régions géographiques
+    "AFE": ("Africa Eastern and Southern", REGION),
+    "AFW": ("Africa Western and Central", REGION),
+    "ARB": ("Arab World", REGION),
+    "CEB": ("Central Europe and the Baltics", REGION),
+    "EAP": ("East Asia & Pacific (excluding high income)", REGION),
+    "EAS": ("East Asia & Pacific", REGION),
+    "ECA": ("Europe & Central Asia (excluding high income)", REGION),
+    "ECS": ("Europe & Central Asia", REGION),
+    "EMU": ("Euro area", REGION),
+    "EUU": ("European Union", REGION),
+    "LAC": ("Latin America & Caribbean (excluding high income)", REGION),
+    "LCN": ("Latin America & Caribbean", REGION),
+    "MEA": ("Middle East & North Africa", REGION),
+    "MNA": ("Middle East & North Africa (excluding high income)", REGION),
+    "NAC": ("North America", REGION),
+    "SAS": ("South Asia", REGION),
+    "SSA": ("Sub-Saharan Africa (excluding high income)", REGION),
+    "SSF": ("Sub-Saharan Africa", REGION),
+    "TEA": ("East Asia & Pacific (IDA & IBRD countries)", REGION),
+    "TEC": ("Europe & Central Asia (IDA & IBRD countries)", REGION),
+    "TLA": ("Latin America & the Caribbean (IDA & IBRD countries)", REGION),
+    "TMN": ("Middle East & North Africa (IDA & IBRD countries)", REGION),
+    "TSA": ("South Asia (IDA & IBRD)", REGION),
+    "TSS": ("Sub-Saharan Africa (IDA & IBRD countries)", REGION),
+    "WLD": ("World", REGION),
+
+    # Groupes de revenu
+    "HIC": ("High income", INCOME),
+    "LIC": ("Low income", INCOME),
+    "LMC": ("Lower middle income", INCOME),
+    "LMY": ("Low & middle income", INCOME),
+    "MIC": ("Middle income", INCOME),
+    "UMC": ("Upper middle income", INCOME),
+    "INX": ("Not classified", INCOME),
+
+    # Groupes de prêt (Banque mondiale)
+    "IBD": ("IBRD only", LENDING),
+    "IBT": ("IDA & IBRD total", LENDING),
+    "IDA": ("IDA total", LENDING),
+    "IDB": ("IDA blend", LENDING),
+    "IDX": ("IDA only", LENDING),
+
+    # Autres agrégats analytiques
+    "CSS": ("Caribbean small states", OTHER),
+    "EAR": ("Early-demographic dividend", OTHER),
+    "FCS": ("Fragile and conflict affected situations", OTHER),
+    "HPC": ("Heavily indebted poor countries (HIPC)", OTHER),
+    "LDC": ("Least developed countries: UN classification", OTHER),
+    "LTE": ("Late-demographic dividend", OTHER),
+    "OED": ("OECD members", OTHER),
+    "OSS": ("Other small states", OTHER),
+    "PRE": ("Pre-demographic dividend", OTHER),
+    "PSS": ("Pacific island small states", OTHER),
+    "PST": ("Post-demographic dividend", OTHER),
+    "SST": ("Small states", OTHER),
+}
+
+# Repli par libellé (CSV sans codes ISO3)
+AGGREGATE_NAMES = {name: kind for name, kind in WDI_AGGREGATES.values()}
+AGGREGATE_NAMES["Middle East, North Africa, Afghanistan & Pakistan"] = REGION
+
+
+def entity_type(name, iso3=None):
+    """Type d'une entité WDI (``country``, ``region``, ``income``, ``lending`` ou ``other``)."""
+    if iso3 and iso3 in WDI_AGGREGATES:
+        return WDI_AGGREGATES[iso3][1]
+    return AGGREGATE_NAMES.get(name, COUNTRY)
+
+
+def classify_entities(names, iso3=None):
+    """Liste des types alignée sur ``names`` (``iso3`` éventuel aligné lui aussi)."""
+    codes = iso3 if iso3 is not None else [None] * len(names)
+    return [entity_type(name, code) for name, code in zip(names, codes)]
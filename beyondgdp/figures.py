@@ -0,0 +1,105 @@
+"""Figures communes aux pages thématiques, construites une fois par processus.
+
+Courbes normalisées et matrices de corrélation ne dépendent que du jeu
+d'indicateurs d'un thème et du pays choisi : elles sont mises en cache sur ces
+arguments (tuples hachables) et partagées par toutes les sessions. Les figures
+renvoyées ne doivent donc pas être modifiées après coup.
+"""
+
+import numpy as np
+import plotly.express as px # type: ignore
+
+from beyondgdp.caching import sampled_lru_cache
+from beyondgdp.correlation import correlation_matrices
+
+# ===========================
+# Gabarits de mise en forme
+# ===========================
+CENTERED_TITLE = dict(x=0.5, xanchor="center", xref="paper")
+
+LINE_LAYOUT = dict(legend_title_text="", margin=dict(t=80, b=30))
+
+HEATMAP_LAYOUT = dict(margin=dict(l=20, r=20, t=110, b=20), coloraxis_showscale=True)
+
+HEATMAP_HOVER = "%{y} × %{x}<br>r = %{z}<br>%{customdata} années communes<extra></extra>"
+
+
+@sampled_lru_cache(maxsize=512)
+def evolution_figure(cube, indicators, colors, title, country):
+    """Courbes normalisées (0–1) des indicateurs d'un pays.
+
+    ``indicators`` est un tuple de libellés, ``colors`` un tuple de paires
+    (libellé, couleur) ; les indicateurs sans couleur gardent celle de Plotly.
+    """
+    # Normalisation min-max précalculée dans le cube pour rendre les échelles comparables
+    df_sel = cube.frame(countries=[country], indicators=indicators, normalised=True)
+
+    fig = px.line(
+        df_sel,
+        x="year",
+        y="value_norm",
+        color="indicator",
+        labels={"value_norm": "Valeur normalisée (0–1)", "year": "Année", "indicator": "Indicateur"}
+    )
+
+    color_map = dict(colors)
+    for trace in fig.data:
+        trace.line.color = color_map.get(trace.name, None)
+
+    fig.update_layout(
+        title=dict(text=f"{title} – {country}", font=dict(size=16), **CENTERED_TITLE),
+        **LINE_LAYOUT
+    )
+    return fig
+
+
+@sampled_lru_cache(maxsize=512)
+def correlation_figure(cube, labels, country):
+    """Triangle inférieur de la matrice de corrélation d'un pays.
+
+    ``labels`` est un tuple de paires (libellé WDI, libellé court) dans l'ordre
+    d'affichage ; chaque case indique en survol le nombre d'années communes.
+    """
+    indicators = tuple(ind for ind, _ in labels)
+    rename_dict = dict(labels)
+
+    # Matrices précalculées pour tous les pays (coefficients + années communes)
+    corr, overlap = correlation_matrices(cube, indicators).frames(country)
+    corr = corr.round(2).rename(index=rename_dict, columns=rename_dict)
+    overlap = overlap.rename(index=rename_dict, columns=rename_dict)
+
+    # Garder le triangle inférieur
+    mask = np.tril(np.ones_like(corr, dtype=bool))
+    corr_tri = corr.where(mask)
+    overlap_tri = overlap.loc[corr.index, corr.columns].where(mask)
+
+    fig = px.imshow(
+        corr_tri,
+        text_auto=True,
+        color_continuous_scale="RdBu_r",
+        zmin=-1,
+        zmax=1,
+        aspect="auto"
+    )
+    fig.update_traces(customdata=overlap_tri, hovertemplate=HEATMAP_HOVER)
+
+    fig.update_layout(
+        title=dict(text=f"{country}", x=0.5, xanchor="center", font=dict(size=18)),
+        xaxis=dict(
+            tickmode="array",
+            tickvals=list(range(len(corr.columns))),
+            ticktext=corr.columns,
+            tickangle=45,
+            side="top",
+            title=None,
+            automargin=True
+        ),
+        yaxis=dict(
+            tickmode="array",
+            tickvals=list(range(len(corr.index))),
+            ticktext=corr.index,
+            title=None
+        ),
+        **HEATMAP_LAYOUT
+    )
+    return fig
@@ -0,0 +1,139 @@
+"""Résolution tolérante aux fautes de frappe des pays et indicateurs.
+
+Les mots d'une question que l'automate d'alias n'a pas reconnus, et qui
+n'appartiennent à aucun libellé connu (« allemangne »), sont rapprochés des
+libellés par un index de trigrammes de caractères construit une fois par
+processus. Les quelques candidats partageant le plus de trigrammes sont
+ensuite vérifiés par une distance d'édition bornée : une faute par mot court,
+deux ou trois pour les libellés plus longs.
+"""
+
+import re
+from collections import Counter
+from functools import lru_cache
+
+from beyondgdp.matcher import entity_patterns, normalise
+from beyondgdp.search import STOPWORDS
+
+WORD = re.compile(r"\w+")
+
+# Mots courants des questions, jamais corrigés
+FILLER = STOPWORDS | {
+    "annee", "annees", "avec", "combien", "comparaison", "comparer", "dans", "depuis", "donne",
+    "entre", "est", "evolution", "moins", "niveau", "pays", "plus", "quelle", "quelles", "quels",
+    "sont", "taux", "valeur", "valeurs", "classement", "rang", "premiers", "derniers",
+}
+
+MIN_WORD_LENGTH = 4     # mots plus courts : trop ambigus pour être corrigés
+MIN_SIMILARITY = 0.4    # coefficient de Dice minimal sur les trigrammes
+CANDIDATES = 5          # candidats vérifiés par distance d'édition
+MAX_WINDOW = 3          # libellés de trois mots au plus (« corée du sud »)
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def max_distance(text):
+    """Nombre de fautes tolérées selon la longueur du libellé."""
+    return 1 if len(text) <= 5 else 2 if len(text) <= 12 else 3
+
+
+def edit_distance(a, b, limit):
+    """Distance de Levenshtein, abandonnée dès qu'elle dépasse ``limit`` (renvoie ``limit + 1``)."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        current = [i]
+        for j, cb in enumerate(b, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class FuzzyIndex:
+    """Index trigramme → libellés, sur un dictionnaire ``libellé normalisé → valeur``.
+
+    Les mots des libellés et de ``words`` (mots d'autres libellés connus,
+    normalisés) forment le vocabulaire : un mot du vocabulaire n'est jamais
+    corrigé (« index » n'est pas une faute pour « inde »).
+    """
+
+    def __init__(self, patterns, words=()):
+        self.patterns = list(patterns.items())
+        self.vocabulary = {word for pattern, _ in self.patterns for word in WORD.findall(pattern)}
+        self.vocabulary.update(words)
+        self.sizes = []
+        self.postings = {}
+        for pid, (pattern, _) in enumerate(self.patterns):
+            grams = trigrams(pattern)
+            self.sizes.append(len(grams))
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(pid)
+
+    def closest(self, text):
+        """(distance, valeur) du libellé le plus proche de ``text``, ``None`` si aucun n'est assez proche."""
+        grams = trigrams(text)
+        shared = Counter(pid for gram in grams for pid in self.postings.get(gram, ()))
+        scored = sorted(
+            ((2 * n / (len(grams) + self.sizes[pid]), pid) for pid, n in shared.items()),
+            reverse=True
+        )
+        best = None
+        for similarity, pid in scored[:CANDIDATES]:
+            if similarity < MIN_SIMILARITY:
+                break
+            pattern, value = self.patterns[pid]
+            limit = max_distance(pattern)
+            distance = edit_distance(text, pattern, limit)
+            if distance <= limit and (best is None or distance < best[0]):
+                best = (distance, value)
+        return best
+
+    def find(self, text, covered=()):
+        """Mentions approchées (début, fin, valeur) hors des plages ``covered`` déjà reconnues.
+
+        ``text`` doit être normalisé (``beyondgdp.matcher.normalise``).
+        """
+        words = [
+            match for match in WORD.finditer(text)
+            if not any(start < match.end() and match.start() < end for start, end in covered)
+        ]
+
+        candidates = []
+        for w, word in enumerate(words):
+            token = word.group()
+            if (len(token) < MIN_WORD_LENGTH or token.isdigit() or token in FILLER
+                    or token in self.vocabulary):
+                continue
+            # Fenêtres de 1 à 3 mots contigus contenant le mot inconnu
+            for first in range(max(0, w - MAX_WINDOW + 1), w + 1):
+                for last in range(w, min(len(words), first + MAX_WINDOW)):
+                    if any(words[k + 1].start() - words[k].end() > 2 for k in range(first, last)):
+                        continue
+                    start, end = words[first].start(), words[last].end()
+                    found = self.closest(text[start:end])
+                    if found:
+                        distance, value = found
+                        candidates.append((distance, start - end, start, end, value))
+
+        # Meilleures corrections d'abord (moins de fautes, puis fenêtre la plus longue)
+        mentions = []
+        for _, _, start, end, value in sorted(candidates):
+            if all(end <= s or e <= start for s, e, _ in mentions):
+                mentions.append((start, end, value))
+        return sorted(mentions)
+
+
+@lru_cache(maxsize=None)
+def fuzzy_matcher(cube):
+    """Index trigramme partagé des pays et indicateurs du cube : valeurs ``(type, nom)``.
+
+    Les mots des libellés officiels (en anglais) du cube s'ajoutent au vocabulaire.
+    """
+    words = {word for label in cube.indicators + cube.countries for word in WORD.findall(normalise(label))}
+    return FuzzyIndex(entity_patterns(cube), words)
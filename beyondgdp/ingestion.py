@@ -0,0 +1,135 @@
+"""Ingestion du fichier brut WDICSV.csv → data_dashboard_BeyondGDP.csv.
+
+Le dump WDI (1 400+ indicateurs × 200+ économies × 60+ années) est lu par
+morceaux : seules les colonnes d'années 1980–2023 sont parsées, les codes
+d'indicateurs hors sélection sont écartés avant la mise au format long, et
+chaque morceau filtré est ajouté directement au CSV de sortie. La mémoire
+consommée dépend donc de la taille d'un morceau, pas de celle du dump.
+
+Utilisation :
+
+    python -m beyondgdp.ingestion WDICSV.csv data_dashboard_BeyondGDP.csv
+"""
+
+import argparse
+import os
+
+import pandas as pd
+
+# =========================================
+# Sélection d’indicateurs (4 max par catégorie)
+# =========================================
+VARIABLES_SELECTION = {
+    # Économie & Productivité
+    "NY.GDP.PCAP.CD": "GDP per capita (current US$)",
+    "NE.GDI.TOTL.ZS": "Gross capital formation (% of GDP)",
+    "FP.CPI.TOTL.ZG": "Inflation, consumer prices (annual %)",
+
+    # Santé & Bien-être
+    "SP.DYN.LE00.IN": "Life expectancy at birth (years)",
+    "SH.XPD.CHEX.GD.ZS": "Current health expenditure (% of GDP)",
+    "SH.DYN.MORT": "Mortality rate, under-5 (per 1,000 live births)",
+
+    # Éducation & Capital humain
+    "SE.XPD.TOTL.GD.ZS": "Government expenditure on education (% of GDP)",
+    "SE.SEC.ENRR": "School enrollment, secondary (% gross)",
+    "HD.HCI.OVRL": "Human capital index (0–1 scale)",
+
+    # Environnement & Énergie
+    "EN.GHG.CO2.PC.CE.AR5": "CO₂ emissions per capita (t/person, AR5)",
+    "EG.FEC.RNEW.ZS": "Renewable energy consumption (% of total final energy)",
+    "EN.ATM.PM25.MC.M3": "PM2.5 air pollution (µg/m³)",
+
+    # Inégalités & Pauvreté
+    "SI.POV.GINI": "Gini index",
+    "SI.POV.DDAY": "Poverty headcount ratio at $3.65/day (2021 PPP)",
+    # "EG.ELC.ACCS.ZS": "Access to electricity (% of population)",
+
+    # Société & Infrastructure
+    "SP.URB.TOTL.IN.ZS": "Urban population (% of total population)",
+    "SH.H2O.BASW.ZS": "Access to basic drinking water (% of population)"
+}
+
+YEAR_MIN, YEAR_MAX = 1980, 2023
+
+ID_COLUMNS = ["Country Name", "Country Code", "Indicator Name", "Indicator Code"]
+# Le code ISO3 est conservé : il sert de clé exacte pour les cartes
+OUTPUT_COLUMNS = ["Country Name", "Country Code", "Indicator Name", "Year", "Value"]
+
+# Nombre de lignes (pays × indicateur) lues à la fois dans le dump
+CHUNKSIZE = 20_000
+
+
+def _year_columns(path, year_min, year_max):
+    """Colonnes d'années du dump comprises dans [year_min, year_max]."""
+    header = pd.read_csv(path, nrows=0).columns
+    years = []
+    for col in header:
+        year = pd.to_numeric(col, errors="coerce")
+        if pd.notna(year) and year_min <= year <= year_max:
+            years.append(col)
+    return years
+
+
+def iter_long_chunks(input_path, selection=VARIABLES_SELECTION,
+                     year_min=YEAR_MIN, year_max=YEAR_MAX, chunksize=CHUNKSIZE):
+    """Lit le dump WDI par morceaux et renvoie des morceaux au format long filtrés."""
+    year_cols = _year_columns(input_path, year_min, year_max)
+    codes = set(selection)
+
+    reader = pd.read_csv(
+        input_path,
+        usecols=ID_COLUMNS + year_cols,
+        dtype={**{c: str for c in ID_COLUMNS}, **{c: "float64" for c in year_cols}},
+        chunksize=chunksize
+    )
+    for chunk in reader:
+        # Filtrage AVANT la mise au format long
+        chunk = chunk[chunk["Indicator Code"].isin(codes)]
+        if chunk.empty:
+            continue
+
+        long = chunk.melt(
+            id_vars=ID_COLUMNS,
+            value_vars=year_cols,
+            var_name="Year",
+            value_name="Value"
+        ).dropna(subset=["Value"])
+
+        long["Year"] = long["Year"].astype(int)
+        long["Indicator Name"] = long["Indicator Code"].map(selection)
+        yield long
+
+
+def build_dataset(input_path, output_path, selection=VARIABLES_SELECTION,
+                  year_min=YEAR_MIN, year_max=YEAR_MAX, chunksize=CHUNKSIZE):
+    """Écrit le CSV du dashboard à partir du dump WDI ; renvoie le nombre de lignes."""
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    n_rows = 0
+    with open(output_path, "w", encoding="utf-8", newline="") as out:
+        # En-tête écrit même si aucun indicateur n'est trouvé
+        pd.DataFrame(columns=OUTPUT_COLUMNS).to_csv(out, index=False)
+        for long in iter_long_chunks(input_path, selection, year_min, year_max, chunksize):
+            long[OUTPUT_COLUMNS].to_csv(out, index=False, header=False)
+            n_rows += len(long)
+    return n_rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Construit data_dashboard_BeyondGDP.csv depuis WDICSV.csv")
+    parser.add_argument("input_path", help="fichier brut WDICSV.csv")
+    parser.add_argument("output_path", help="CSV produit pour le dashboard")
+    parser.add_argument("--chunksize", type=int, default=CHUNKSIZE,
+                        help="lignes du dump lues par morceau (défaut : %(default)s)")
+    args = parser.parse_args(argv)
+
+    n_rows = build_dataset(args.input_path, args.output_path, chunksize=args.chunksize)
+    print(f"Nouveau fichier sauvegardé : {args.output_path}")
+    print("Nombre d'observations :", n_rows)
+
+
+if __name__ == "__main__":
+    main()
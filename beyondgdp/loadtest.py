@@ -0,0 +1,496 @@
+"""Test de charge local : N sessions Streamlit simulées contre un serveur de la machine.
+
+Chaque session simulée parle le protocole du navigateur (WebSocket
+``/_stcore/stream``, messages protobuf ``BackMsg`` / ``ForwardMsg``) : elle
+demande l'exécution d'une page avec l'état de ses widgets et attend la fin du
+script. Les sessions enchaînent des scénarios d'analyste, séparés par des
+temps de réflexion aléatoires :
+
+- accueil : déplacement du curseur d'année de la carte, puis passage en mode animation ;
+- thème : une page thématique, puis changement du pays affiché ;
+- assistant : saisie d'une question, puis clic sur « Analyser la question ».
+
+Les paliers de charge (``--sessions 1 5 10 20``) sont joués l'un après
+l'autre contre le même serveur, après une session de préchauffage qui ouvre
+chaque page une fois. Pour chaque palier : débit (exécutions de page par
+seconde), latences p50 / p95 / p99 par action, erreurs, et chronologie de
+l'utilisation CPU et de la mémoire résidente du serveur (lues dans
+``/proc/<pid>``, donc sous Linux).
+
+Utilisation :
+
+    python -m beyondgdp.loadtest --sessions 1 5 10 20 --duration 60 --output loadtest.json
+    python -m beyondgdp.loadtest --url ws://127.0.0.1:8501 --pid 12345 --sessions 10
+
+Sans ``--url``, un serveur ``streamlit run Home.py`` est lancé sur un port
+libre puis arrêté à la fin ; ``BEYONDGDP_DATA`` permet de le faire tourner sur
+un jeu de données synthétique (``beyondgdp.synthetic``). Dépendance
+supplémentaire : ``websockets`` (``pip install -r requirements-dev.txt``).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import numpy as np
+import websockets  # type: ignore
+from streamlit.proto.BackMsg_pb2 import BackMsg  # type: ignore
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg  # type: ignore
+from streamlit.proto.WidgetStates_pb2 import WidgetState  # type: ignore
+
+from beyondgdp.benchmark import COUNTRIES, QUESTIONS, YEARS, environment
+from beyondgdp.data import BASE_DIR
+
+HOME = "Home"
+THEME_PAGES = ["Economie", "Sante", "Education", "Environnement", "Inegalites", "Societe"]
+YEAR_PAGES = ["Inegalites", "Societe"]      # pages thématiques avec un curseur d'année
+ASSISTANT = "AssistantIA"
+# Part de chaque scénario dans le choix des sessions
+SCENARIOS = {"accueil": 0.3, "theme": 0.5, "assistant": 0.2}
+
+THINK_TIME = 2.0        # temps de réflexion moyen entre deux actions (s)
+RUN_TIMEOUT = 120       # une exécution plus longue est comptée en erreur (s)
+SAMPLE_INTERVAL = 1.0   # période d'échantillonnage du serveur (s)
+SERVER_START_TIMEOUT = 60
+
+
+class ScriptError(RuntimeError):
+    """Exception affichée par la page (``st.exception``) ou page introuvable."""
+
+
+# =================
+# Session simulée
+# =================
+class SessionClient:
+    """Une session de navigateur : page courante, widgets affichés et leur état."""
+
+    def __init__(self, url):
+        self.url = url.rstrip("/") + "/_stcore/stream"
+        self.ws = None
+        self.pages = {}         # nom de page → page_script_hash
+        self.page = None
+        self.widgets = {}       # (type, libellé) → proto du widget affiché
+        self.states = {}        # id → WidgetState envoyé à chaque exécution
+        self.cached = set()     # empreintes des messages gardés en cache, comme le navigateur
+
+    async def connect(self):
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+
+    async def close(self):
+        """Ferme la connexion ; la suivante ouvrira une nouvelle session côté serveur."""
+        if self.ws is not None:
+            await self.ws.close()
+        self.ws, self.page, self.widgets, self.states = None, None, {}, {}
+
+    def widget(self, kind, label):
+        """Proto d'un widget affiché par la dernière exécution."""
+        widget = self.widgets.get((kind, label))
+        if widget is None:
+            raise ScriptError(f"Widget absent de la page {self.page} : {kind} « {label} »")
+        return widget
+
+    def set(self, kind, label, **value):
+        """Nouvelle valeur d'un widget de la page courante (``string_value=...``, etc.)."""
+        widget = self.widget(kind, label)
+        state = WidgetState(id=widget.id)
+        for field, v in value.items():
+            if field.endswith("_array_value"):
+                getattr(state, field).data[:] = v
+            else:
+                setattr(state, field, v)
+        self.states[widget.id] = state
+        return widget
+
+    async def run(self, page=None):
+        """Exécute une page (la page courante par défaut) ; renvoie (octets reçus, messages)."""
+        if page is not None and page != self.page:
+            self.page, self.states = page, {}
+        msg = BackMsg()
+        client_state = msg.rerun_script
+        if self.page in self.pages:
+            client_state.page_script_hash = self.pages[self.page]
+        elif self.page not in (None, HOME):
+            client_state.page_name = self.page     # premier passage : chemin d'URL de la page
+        client_state.widget_states.widgets.extend(self.states.values())
+        client_state.cached_message_hashes.extend(self.cached)
+        await self.ws.send(msg.SerializeToString())
+
+        # Les déclencheurs (boutons) ne valent que pour une exécution
+        self.states = {k: s for k, s in self.states.items() if s.WhichOneof("value") != "trigger_value"}
+        self.widgets, received, messages = {}, 0, 0
+        while True:
+            data = await self.ws.recv()
+            received += len(data)
+            messages += 1
+            forward = ForwardMsg()
+            forward.ParseFromString(data)
+            kind = forward.WhichOneof("type")
+            if forward.metadata.cacheable:
+                self.cached.add(forward.hash)
+            if kind == "navigation":
+                self.pages = {p.page_name: p.page_script_hash for p in forward.navigation.app_pages}
+            elif kind == "page_not_found":
+                raise ScriptError(f"Page introuvable : {self.page}")
+            elif kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                self._element(forward.delta.new_element)
+            elif kind == "script_finished" and forward.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                return received, messages
+
+    def _element(self, element):
+        kind = element.WhichOneof("type")
+        if kind == "exception":
+            raise ScriptError(f"{element.exception.type} : {element.exception.message}")
+        widget = getattr(element, kind)
+        if hasattr(widget, "id") and hasattr(widget, "label"):
+            self.widgets.setdefault((kind, widget.label), widget)
+
+
+# ==========
+# Scénarios
+# ==========
+# Chaque scénario est une suite d'actions (nom, page, préparation) ; la
+# préparation modifie les widgets de la page affichée avant l'exécution.
+def home_script(rng):
+    actions = [("accueil.ouverture", HOME, None)]
+    for year in rng.sample(YEARS, k=rng.randint(1, len(YEARS))):
+        actions.append(("accueil.annee", HOME,
+                        lambda c, y=year: c.set("slider", "Choisir une année :", double_array_value=[y])))
+    actions.append(("accueil.animation", HOME,
+                    lambda c: c.set("radio", "Mode d'affichage :", string_value="Animation (toutes les années)")))
+    return actions
+
+
+def theme_script(rng):
+    page = rng.choice(THEME_PAGES)
+
+    def country(client, name):
+        # Jeu de données réduit ou synthétique : un autre pays de la liste
+        options = list(client.widget("selectbox", "Sélectionner un pays :").options)
+        if name not in options and options:
+            name = rng.choice(options)
+        client.set("selectbox", "Sélectionner un pays :", string_value=name)
+
+    actions = [("theme.ouverture", page, None)]
+    for name in rng.sample(COUNTRIES, k=rng.randint(1, 3)):
+        actions.append(("theme.pays", page, lambda c, n=name: country(c, n)))
+    if page in YEAR_PAGES:
+        actions.append(("theme.annee", page, lambda c: c.set(
+            "slider", "Sélectionner une année :", double_array_value=[rng.choice(YEARS)])))
+    return actions
+
+
+def assistant_script(rng):
+    actions = [("assistant.ouverture", ASSISTANT, None)]
+    for question in rng.sample(QUESTIONS, k=rng.randint(1, 3)):
+        actions.append(("assistant.saisie", ASSISTANT,
+                        lambda c, q=question: c.set("text_area", "Posez une question :", string_value=q)))
+        actions.append(("assistant.question", ASSISTANT,
+                        lambda c: c.set("button", "Analyser la question", trigger_value=True)))
+    return actions
+
+
+SCRIPTS = {"accueil": home_script, "theme": theme_script, "assistant": assistant_script}
+
+
+async def analyst(url, rng, deadline, think, results, live):
+    """Boucle d'une session simulée jusqu'à ``deadline`` ; chaque action est ajoutée à ``results``."""
+    client = SessionClient(url)
+    live["sessions"] += 1
+    try:
+        while time.monotonic() < deadline:
+            scenario = rng.choices(list(SCENARIOS), weights=list(SCENARIOS.values()))[0]
+            for action, page, prepare in SCRIPTS[scenario](rng):
+                if time.monotonic() >= deadline:
+                    break
+                start, received, error = time.monotonic(), 0, None
+                try:
+                    if client.ws is None:
+                        await client.connect()
+                    if prepare is not None:
+                        prepare(client)
+                    received, _ = await asyncio.wait_for(client.run(page), RUN_TIMEOUT)
+                except (ScriptError, asyncio.TimeoutError, websockets.exceptions.WebSocketException, OSError) as exc:
+                    error = f"{type(exc).__name__} : {exc}"
+                    await client.close()        # messages en attente ignorés : reconnexion à l'action suivante
+                end = time.monotonic()
+                results.append(dict(action=action, start=start, end=end, seconds=end - start,
+                                    bytes=received, error=error))
+                live["runs"] += 1
+                if error is not None:
+                    break                       # scénario abandonné, on en tire un autre
+                await asyncio.sleep(rng.expovariate(1 / think) if think > 0 else 0)
+    finally:
+        live["sessions"] -= 1
+        await client.close()
+
+
+# =======
+# Serveur
+# =======
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, log_path):
+    """Lance ``streamlit run Home.py`` et attend qu'il réponde ; renvoie le processus."""
+    log = open(log_path, "w", encoding="utf-8")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", os.path.join(BASE_DIR, "Home.py"),
+         "--server.headless", "true", "--server.port", str(port), "--server.address", "127.0.0.1",
+         "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"],
+        cwd=BASE_DIR, stdout=log, stderr=subprocess.STDOUT
+    )
+    log.close()
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Le serveur Streamlit s'est arrêté (voir {log_path})")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"Le serveur Streamlit ne répond pas après {SERVER_START_TIMEOUT} s (voir {log_path})")
+
+
+class ServerMonitor:
+    """Échantillons CPU / mémoire d'un processus, lus dans ``/proc/<pid>``."""
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.ticks = os.sysconf("SC_CLK_TCK")
+        self.page_size = os.sysconf("SC_PAGE_SIZE")
+        self.last = None
+
+    def sample(self):
+        """(cpu %, Mo résidents, threads) depuis l'échantillon précédent ; None si illisible."""
+        try:
+            with open(f"/proc/{self.pid}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            with open(f"/proc/{self.pid}/statm") as f:
+                resident = int(f.read().split()[1])
+        except OSError:
+            return None
+        now, cpu = time.monotonic(), (int(fields[11]) + int(fields[12])) / self.ticks   # utime + stime
+        percent = None
+        if self.last is not None:
+            percent = 100 * (cpu - self.last[1]) / max(now - self.last[0], 1e-9)
+        self.last = (now, cpu)
+        return percent, resident * self.page_size / 2**20, int(fields[17])
+
+
+async def monitor(server, live, timeline, origin, interval, stop):
+    while not stop.is_set():
+        sample = server.sample() if server is not None else None
+        cpu, rss, threads = sample if sample is not None else (None, None, None)
+        timeline.append(dict(t=round(time.monotonic() - origin, 2), sessions=live["sessions"], runs=live["runs"],
+                             cpu_pct=cpu and round(cpu, 1), rss_mb=rss and round(rss, 1), threads=threads))
+        try:
+            await asyncio.wait_for(stop.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+# =======
+# Paliers
+# =======
+def percentiles(seconds):
+    ms = np.asarray(seconds) * 1000
+    if not len(ms):
+        return dict(n=0)
+    return dict(n=len(ms), p50_ms=round(float(np.percentile(ms, 50)), 1),
+                p95_ms=round(float(np.percentile(ms, 95)), 1), p99_ms=round(float(np.percentile(ms, 99)), 1),
+                max_ms=round(float(ms.max()), 1))
+
+
+def summarise_stage(n, results, timeline, ramp, duration):
+    """Débit et latences des actions commencées après la montée en charge."""
+    runs = [r for r in results if r["start"] >= ramp]
+    ok = [r for r in runs if r["error"] is None]
+    window = max(duration - ramp, 1e-9)
+    cpu = [s["cpu_pct"] for s in timeline if s["cpu_pct"] is not None]
+    rss = [s["rss_mb"] for s in timeline if s["rss_mb"] is not None]
+
+    by_action = {}
+    for r in ok:
+        by_action.setdefault(r["action"], []).append(r["seconds"])
+    errors = {}
+    for r in runs:
+        if r["error"] is not None:
+            errors[r["error"]] = errors.get(r["error"], 0) + 1
+
+    return dict(
+        sessions=n, runs=len(runs), errors=len(runs) - len(ok),
+        runs_per_s=round(len(ok) / window, 2), mb_per_s=round(sum(r["bytes"] for r in ok) / 2**20 / window, 2),
+        latency=percentiles([r["seconds"] for r in ok]),
+        actions={action: percentiles(seconds) for action, seconds in sorted(by_action.items())},
+        cpu_mean_pct=round(float(np.mean(cpu)), 1) if cpu else None,
+        cpu_max_pct=round(float(np.max(cpu)), 1) if cpu else None,
+        rss_max_mb=max(rss) if rss else None,
+        error_messages=errors,
+    )
+
+
+async def run_stage(url, n, duration, ramp, think, seed, server, interval):
+    """Un palier de ``n`` sessions pendant ``duration`` secondes, démarrées sur ``ramp`` secondes."""
+    origin = time.monotonic()
+    deadline = origin + duration
+    results, timeline, live = [], [], dict(sessions=0, runs=0)
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(monitor(server, live, timeline, origin, interval, stop))
+
+    async def delayed(k):
+        await asyncio.sleep(ramp * k / n)
+        await analyst(url, random.Random(seed * 10007 + k), deadline, think, results, live)
+
+    await asyncio.gather(*(delayed(k) for k in range(n)))
+    stop.set()
+    await sampler
+
+    for r in results:
+        r["start"], r["end"] = r["start"] - origin, r["end"] - origin
+    summary = summarise_stage(n, results, timeline, ramp, duration)
+    summary["timeline"] = _timeline(results, timeline)
+    return summary
+
+
+def _timeline(results, samples):
+    """Échantillons du serveur complétés du débit et du p95 des actions terminées dans l'intervalle."""
+    previous = 0.0
+    for sample in samples:
+        done = [r["seconds"] for r in results if previous < r["end"] <= sample["t"] and r["error"] is None]
+        sample["runs_per_s"] = round(len(done) / max(sample["t"] - previous, 1e-9), 2) if sample["t"] else 0.0
+        sample["p95_ms"] = round(float(np.percentile(done, 95)) * 1000, 1) if done else None
+        previous = sample["t"]
+    return samples
+
+
+async def warm_up(url):
+    """Ouvre chaque page une fois : chargement des données et caches du serveur hors mesure."""
+    client = SessionClient(url)
+    await client.connect()
+    timings = {}
+    try:
+        for page in [HOME] + THEME_PAGES + [ASSISTANT]:
+            start = time.monotonic()
+            await asyncio.wait_for(client.run(page), RUN_TIMEOUT)
+            timings[page] = round((time.monotonic() - start) * 1000, 1)
+    finally:
+        await client.close()
+    return timings
+
+
+# =======
+# Rapport
+# =======
+def print_stage(stage, every):
+    latency = stage["latency"]
+    print(f"\n=== {stage['sessions']} session(s) : {stage['runs']} exécutions, {stage['errors']} erreurs, "
+          f"{stage['runs_per_s']} exécutions/s, {stage['mb_per_s']} Mo/s")
+    if latency["n"]:
+        print(f"latence p50 {latency['p50_ms']} ms, p95 {latency['p95_ms']} ms, p99 {latency['p99_ms']} ms ; "
+              f"CPU serveur moyen {stage['cpu_mean_pct']} %, max {stage['cpu_max_pct']} % ; "
+              f"mémoire max {stage['rss_max_mb']} Mo")
+    print(f"{'action':<24}{'n':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for action, case in stage["actions"].items():
+        print(f"{action:<24}{case['n']:>6}{case['p50_ms']:>10.1f}{case['p95_ms']:>10.1f}{case['p99_ms']:>10.1f}")
+    for message, count in stage["error_messages"].items():
+        print(f"  erreur ×{count} : {message}")
+
+    # Chronologie regroupée par ``every`` échantillons : moyennes, sauf p95 et mémoire (maximum)
+    print(f"{'t (s)':>7}{'sessions':>10}{'exéc./s':>9}{'p95 ms':>9}{'CPU %':>8}{'Mo':>8}")
+    timeline = stage["timeline"][1:]
+    for k in range(0, len(timeline), max(1, every)):
+        chunk = timeline[k:k + max(1, every)]
+        p95 = [s["p95_ms"] for s in chunk if s["p95_ms"] is not None]
+        cpu = [s["cpu_pct"] for s in chunk if s["cpu_pct"] is not None]
+        rss = [s["rss_mb"] for s in chunk if s["rss_mb"] is not None]
+        print(f"{chunk[-1]['t']:>7.0f}{chunk[-1]['sessions']:>10}"
+              f"{np.mean([s['runs_per_s'] for s in chunk]):>9.1f}"
+              f"{max(p95) if p95 else '-':>9}{round(float(np.mean(cpu)), 1) if cpu else '-':>8}"
+              f"{max(rss) if rss else '-':>8}")
+
+
+def print_overview(stages):
+    print(f"\n{'sessions':>9}{'exéc./s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'erreurs':>9}{'CPU %':>8}{'Mo':>8}")
+    for stage in stages:
+        latency = stage["latency"]
+        print(f"{stage['sessions']:>9}{stage['runs_per_s']:>9.2f}{latency.get('p50_ms', '-'):>9}"
+              f"{latency.get('p95_ms', '-'):>9}{latency.get('p99_ms', '-'):>9}{stage['errors']:>9}"
+              f"{stage['cpu_mean_pct'] if stage['cpu_mean_pct'] is not None else '-':>8}"
+              f"{stage['rss_max_mb'] if stage['rss_max_mb'] is not None else '-':>8}")
+
+
+async def _main(args, url, pid):
+    server = ServerMonitor(pid) if pid else None
+    warm = await warm_up(url)
+    print("Préchauffage (ms) : " + ", ".join(f"{page} {ms}" for page, ms in warm.items()))
+
+    stages = []
+    for n in args.sessions:
+        ramp = min(args.ramp, args.duration / 2)
+        stage = await run_stage(url, n, args.duration, ramp, args.think, args.seed, server, args.interval)
+        stages.append(stage)
+        print_stage(stage, args.print_every)
+    return warm, stages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Test de charge local du dashboard Beyond GDP")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 10, 20],
+                        help="paliers de sessions simultanées (défaut : %(default)s)")
+    parser.add_argument("--duration", type=float, default=60, help="durée de chaque palier en s (défaut : %(default)s)")
+    parser.add_argument("--ramp", type=float, default=10,
+                        help="montée en charge en s, exclue des statistiques (défaut : %(default)s)")
+    parser.add_argument("--think", type=float, default=THINK_TIME,
+                        help="temps de réflexion moyen entre deux actions en s, 0 = aucun (défaut : %(default)s)")
+    parser.add_argument("--seed", type=int, default=0, help="graine des scénarios (défaut : %(default)s)")
+    parser.add_argument("--interval", type=float, default=SAMPLE_INTERVAL,
+                        help="période d'échantillonnage du serveur en s (défaut : %(default)s)")
+    parser.add_argument("--print-every", type=int, default=5,
+                        help="échantillons regroupés par ligne de chronologie affichée (défaut : %(default)s)")
+    parser.add_argument("--url", help="serveur déjà lancé (http://hôte:port) ; sinon un serveur local est démarré")
+    parser.add_argument("--pid", type=int, help="processus du serveur déjà lancé, pour le suivi CPU / mémoire")
+    parser.add_argument("--server-log", default="loadtest_server.log",
+                        help="journal du serveur lancé (défaut : %(default)s)")
+    parser.add_argument("--output", default="loadtest.json", help="fichier JSON produit (défaut : %(default)s)")
+    args = parser.parse_args(argv)
+
+    process = None
+    if args.url:
+        url, pid = args.url.replace("http://", "ws://").replace("https://", "wss://"), args.pid
+    else:
+        port = _free_port()
+        process = start_server(port, args.server_log)
+        url, pid = f"ws://127.0.0.1:{port}", process.pid
+        print(f"Serveur Streamlit lancé sur le port {port} (pid {pid}, journal : {args.server_log})")
+
+    try:
+        warm, stages = asyncio.run(_main(args, url, pid))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=30)
+
+    print_overview(stages)
+    report = dict(environment=environment(data=False), settings=dict(
+        sessions=args.sessions, duration=args.duration, ramp=args.ramp, think=args.think,
+        seed=args.seed, scenarios=SCENARIOS, cpu_count=os.cpu_count()
+    ), warm_up_ms=warm, stages=stages)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nRésultats sauvegardés : {args.output}")
+
+
+if __name__ == "__main__":
+    main()
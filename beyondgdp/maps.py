@@ -0,0 +1,54 @@
+"""Cartes choroplèthes animées, construites une fois par processus.
+
+Au lieu de reconstruire une carte à chaque mouvement de slider (rerun complet
+du script côté serveur), toutes les années sont envoyées en une seule figure
+Plotly animée : le défilement des années se fait dans le navigateur.
+"""
+
+import plotly.express as px # type: ignore
+
+from beyondgdp.caching import sampled_lru_cache
+from beyondgdp.cube import map_locations
+from beyondgdp.entities import COUNTRY
+
+
+@sampled_lru_cache(maxsize=16)
+def animated_choropleth(cube, indicator, title, decimals=None, start_year=None,
+                        color_scale="Plasma"):
+    """Carte animée d'un indicateur, une image par année (pays réels uniquement).
+
+    ``title`` peut contenir ``{year}``. ``decimals`` arrondit les valeurs
+    envoyées au navigateur pour réduire la taille du graphique. La figure est
+    partagée entre les sessions : elle ne doit pas être modifiée après coup.
+    """
+    df = cube.frame(indicators=[indicator], kind=COUNTRY).sort_values(["year", "country"], kind="stable")
+
+    # float64 avant arrondi : un float32 arrondi se sérialise avec des décimales parasites
+    df["value"] = df["value"].astype("float64")
+    if decimals is not None:
+        df["value"] = df["value"].round(decimals)
+
+    fig = px.choropleth(
+        df,
+        **map_locations(cube),
+        color="value",
+        hover_name="country",
+        animation_frame="year",
+        # Échelle de couleurs fixe : les années restent comparables entre elles
+        range_color=(df["value"].min(), df["value"].max()),
+        color_continuous_scale=color_scale,
+        projection="natural earth"
+    )
+
+    # Titre propre à chaque année, mis à jour par l'animation
+    for frame in fig.frames:
+        frame.layout = dict(title=dict(text=title.format(year=frame.name)))
+
+    # Image affichée au chargement
+    years = [frame.name for frame in fig.frames]
+    start = years.index(str(start_year)) if str(start_year) in years else len(years) - 1
+    fig.data[0].update(fig.frames[start].data[0].to_plotly_json())
+    fig.layout.sliders[0].active = start
+    fig.update_layout(title=dict(text=title.format(year=years[start])))
+
+    return fig
@@ -0,0 +1,133 @@
+"""Repérage des pays et indicateurs cités dans une question, en une seule passe.
+
+Tous les libellés connus (noms de pays du jeu de données, alias français des
+pays et des indicateurs) sont compilés une fois par processus dans un
+automate d'Aho–Corasick. Une question est alors parcourue caractère par
+caractère, quel que soit le nombre d'alias : le coût ne dépend que de la
+longueur de la question et du nombre de mentions trouvées.
+"""
+
+import unicodedata
+from functools import lru_cache
+
+from beyondgdp.aliases import COUNTRY_ALIASES, INDICATOR_ALIASES
+from beyondgdp.entities import COUNTRY
+
+INDICATOR = "indicator"
+
+
+def normalise(text):
+    """Forme canonique d'un texte avant recherche : minuscules, sans accents, apostrophes droites.
+
+    « États-Unis » et « etats-unis » ont ainsi la même forme ; les exposants et
+    indices sont ramenés à leur chiffre (« CO₂ » → « co2 »).
+    """
+    text = unicodedata.normalize("NFKD", text.lower().replace("’", "'"))
+    return "".join(char for char in text if not unicodedata.combining(char))
+
+
+class AliasMatcher:
+    """Automate d'Aho–Corasick sur un dictionnaire ``motif → valeur``.
+
+    ``find`` renvoie les mentions sans chevauchement, la plus longue
+    l'emportant à position de départ égale (« corée du sud » plutôt que
+    « corée »). Un motif qui commence ou finit par une lettre ou un chiffre
+    doit être délimité par des frontières de mot : « eau » ne se trouve pas
+    dans « niveau ».
+    """
+
+    def __init__(self, patterns):
+        self.goto = [{}]        # transitions de chaque état
+        self.fail = [0]         # lien d'échec (plus long suffixe propre reconnu)
+        self.out = [[]]         # motifs (longueur, valeur) se terminant dans l'état
+
+        for pattern, value in patterns.items():
+            pattern = normalise(pattern)
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                nxt = self.goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][char] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                state = nxt
+            if not self.out[state]:                 # premier motif déclaré gagnant
+                self.out[state] = [(len(pattern), value)]
+
+        self._link()
+
+    def _link(self):
+        """Liens d'échec en largeur ; chaque état hérite des sorties de son lien."""
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for char, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and char not in self.goto[f]:
+                    f = self.fail[f]
+                target = self.goto[f].get(char, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def _scan(self, text):
+        """Toutes les occurrences (début, fin, valeur), chevauchements compris."""
+        state = 0
+        for end, char in enumerate(text, start=1):
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            for length, value in self.out[state]:
+                yield end - length, end, value
+
+    def find(self, text):
+        """Mentions (début, fin, valeur) sans chevauchement, de gauche à droite."""
+        text = normalise(text)
+        hits = [
+            (start, end, value) for start, end, value in self._scan(text)
+            if _bounded(text, start, end)
+        ]
+        hits.sort(key=lambda hit: (hit[0], hit[0] - hit[1]))
+
+        mentions, last_end = [], 0
+        for start, end, value in hits:
+            if start >= last_end:
+                mentions.append((start, end, value))
+                last_end = end
+        return mentions
+
+
+def _bounded(text, start, end):
+    """Vrai si la mention n'est pas collée à une lettre ou un chiffre voisin."""
+    if text[start].isalnum() and start > 0 and text[start - 1].isalnum():
+        return False
+    if text[end - 1].isalnum() and end < len(text) and text[end].isalnum():
+        return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def entity_patterns(cube):
+    """Libellés normalisés des pays et indicateurs du cube → ``(type, nom)``.
+
+    Les alias pointant vers un pays ou un indicateur absent du cube sont ignorés.
+    """
+    patterns = {}
+    for alias, name in COUNTRY_ALIASES.items():
+        if name in cube.country_index:
+            patterns.setdefault(normalise(alias), (COUNTRY, name))
+    for name in cube.countries:
+        patterns.setdefault(normalise(name), (COUNTRY, name))
+    for alias, name in INDICATOR_ALIASES.items():
+        if name in cube.indicator_index:
+            patterns.setdefault(normalise(alias), (INDICATOR, name))
+    return patterns
+
+
+@lru_cache(maxsize=None)
+def entity_matcher(cube):
+    """Automate partagé des pays et indicateurs du cube : valeurs ``(type, nom)``."""
+    return AliasMatcher(entity_patterns(cube))
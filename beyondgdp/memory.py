@@ -0,0 +1,251 @@
+"""Mémoire occupée par le processus, ses caches et les sessions Streamlit.
+
+Les données et les objets dérivés (cube, index, figures, réponses) sont
+conservés dans des caches ``functools.lru_cache`` partagés par toutes les
+sessions du processus ; chaque session ne garde en propre que l'état de ses
+widgets. Le rapport distingue donc :
+
+- la mémoire résidente du processus (actuelle et maximale) ;
+- pour chaque cache ``lru_cache`` du paquet, ses compteurs (``cache_info``)
+  et, pour les caches à valeur unique par jeu de données (données, cube,
+  index de l'assistant, classements), la taille approximative de cette
+  valeur ; un objet partagé (le cube, par exemple) n'est compté qu'une fois,
+  dans le premier cache qui le contient. Les caches de réponses et de
+  figures, indexés par question ou par pays (``beyondgdp.caching.sampled_lru_cache``), sont
+  estimés : taille moyenne de leurs dernières valeurs × nombre d'entrées ;
+- la taille de l'état de chaque session active (``st.session_state``).
+
+Utilisation :
+
+    python -m beyondgdp.memory --warm      # rapport JSON d'un processus ayant chargé les données
+
+Le même rapport est affiché par la page « Mémoire » (serveur lancé avec
+``BEYONDGDP_PROFILE=1``) et servi par ``/memory`` dans ``beyondgdp.api``.
+"""
+
+import argparse
+import gc
+import json
+import os
+import resource
+import sys
+import types
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Objets partagés par tout le programme, jamais comptés dans un cache
+_SKIP = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+# Modules dont les caches sont parcourus en premier (données brutes, cube)
+_OWNERS = ["beyondgdp.data", "beyondgdp.cube"]
+# Caches mesurés : une seule valeur par cube, relue par un appel qui tombe dans le cache
+# (ou, pour les données, retrouvée sans appel au chargeur ; ``None`` si absente)
+_MEASURED = {
+    "beyondgdp.data.load_data": lambda function, cube: _loaded_frame(cube),
+    "beyondgdp.cube.load_cube": lambda function, cube: cube,
+    "beyondgdp.matcher.entity_patterns": lambda function, cube: function(cube),
+    "beyondgdp.matcher.entity_matcher": lambda function, cube: function(cube),
+    "beyondgdp.fuzzy.fuzzy_matcher": lambda function, cube: function(cube),
+    "beyondgdp.autocomplete.completion_trie": lambda function, cube: function(cube),
+    "beyondgdp.search.indicator_search": lambda function, cube: function(cube),
+    "beyondgdp.ranking.rank_tables": lambda function, cube: function(cube),
+}
+
+
+def _loaded_frame(cube):
+    """DataFrame dont le cube est issu, s'il est encore chargé ; le CSV n'est jamais relu."""
+    from beyondgdp.data import loaded_data
+
+    return loaded_data(cube.path) if cube.path is not None else None
+
+
+# ================
+# Taille des objets
+# ================
+def _plotly_dict(fig):
+    """Données d'un objet Plotly à mesurer.
+
+    Ses dictionnaires internes s'ils existent (sans copie), sinon sa forme
+    publique ``to_plotly_json()``, une copie de taille comparable.
+    """
+    try:
+        return [fig._data, fig._layout] + [frame._props for frame in getattr(fig, "_frame_objs", ())]
+    except AttributeError:      # attributs privés absents (autre version de Plotly, trace seule)
+        return fig.to_plotly_json()
+
+
+def deep_size(obj, seen=None):
+    """Taille approximative (octets) d'un objet et de tout ce qu'il référence.
+
+    Les objets déjà présents dans ``seen`` (``id → objet`` : l'objet y reste
+    référencé, son ``id`` ne peut donc pas être réattribué) ne sont pas
+    recomptés ; tableaux NumPy et objets pandas sont mesurés par leurs propres
+    méthodes, les figures Plotly par leur dictionnaire de données.
+    """
+    seen = {} if seen is None else seen
+    total, stack = 0, [obj]
+    while stack:
+        o = stack.pop()
+        if id(o) in seen or isinstance(o, _SKIP):
+            continue
+        seen[id(o)] = o
+        if isinstance(o, (pd.DataFrame, pd.Series, pd.Index)):
+            usage = o.memory_usage(deep=True)
+            total += int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+        elif isinstance(o, np.ndarray):
+            total += o.nbytes if o.base is None else 0
+            if o.dtype == object:
+                stack.extend(o.ravel().tolist())
+            elif o.base is not None:
+                stack.append(o.base)
+        elif hasattr(o, "to_plotly_json"):
+            stack.append(_plotly_dict(o))
+        else:
+            total += sys.getsizeof(o)
+            stack.extend(gc.get_referents(o))
+    return total
+
+
+# =========
+# Processus
+# =========
+def process_memory():
+    """Mémoire résidente actuelle et maximale du processus (Mo)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+    try:
+        with open("/proc/self/statm") as f:
+            rss_mb = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        rss_mb = None
+    return dict(rss_mb=rss_mb and round(rss_mb, 1), peak_rss_mb=round(peak_mb, 1))
+
+
+# ======
+# Caches
+# ======
+def cached_functions():
+    """(nom, fonction) des ``lru_cache`` des modules du paquet déjà importés."""
+    modules = sorted(
+        (name for name in list(sys.modules) if name == "beyondgdp" or name.startswith("beyondgdp.")),
+        key=lambda name: (_OWNERS.index(name) if name in _OWNERS else len(_OWNERS), name)
+    )
+    found, functions = set(), []
+    for name in modules:
+        for attr, value in vars(sys.modules[name]).items():
+            if hasattr(value, "cache_info") and callable(value) and id(value) not in found:
+                found.add(id(value))
+                functions.append((f"{value.__module__}.{value.__qualname__}", value))
+    return functions
+
+
+def _estimated_size(samples, count, seen):
+    """Taille (octets) de ``count`` valeurs estimée sur un échantillon, hors objets déjà comptés."""
+    sizes = [deep_size(sample, dict(seen)) for sample in samples]
+    return sum(sizes) / len(sizes) * count
+
+
+def cache_report(sizes=True, cube=None):
+    """Statistiques de chaque cache : appels, entrées et Mo approximatifs.
+
+    ``cube`` est le cube servi par le processus (celui de ``load_cube()``) ;
+    sans lui, seuls les caches échantillonnés sont estimés. Une valeur n'est
+    mesurée que si son cache est déjà rempli (l'appel qui la relit ne
+    construit rien, mais compte comme un succès) ; le DataFrame des données
+    n'est mesuré que s'il est chargé depuis le fichier du cube. Les caches de
+    ``sampled_lru_cache`` sont estimés (``estimated`` vrai) ; ``mb`` vaut
+    ``None`` pour les autres.
+    """
+    seen, report = {}, []
+    for name, function in cached_functions():
+        info = function.cache_info()
+        entry = dict(name=name, hits=info.hits, misses=info.misses, entries=info.currsize, maxsize=info.maxsize)
+        if sizes:
+            samples = function.samples() if hasattr(function, "samples") and info.currsize else []
+            measured = name in _MEASURED and info.currsize and cube is not None
+            value = _MEASURED[name](function, cube) if measured else None
+            if samples:
+                entry["mb"] = round(_estimated_size(samples, info.currsize, seen) / 2**20, 3)
+            else:
+                entry["mb"] = round(deep_size(value, seen) / 2**20, 3) if value is not None else None
+            entry["estimated"] = bool(samples)
+        report.append(entry)
+    return report
+
+
+# ========
+# Sessions
+# ========
+def session_report():
+    """Taille de l'état de chaque session Streamlit active ; liste vide hors serveur Streamlit."""
+    try:
+        from streamlit.runtime import Runtime  # type: ignore
+
+        if not Runtime.exists():
+            return []
+        infos = Runtime.instance()._session_mgr.list_active_sessions()
+    except Exception:       # API interne de Streamlit : absente ou modifiée
+        return []
+
+    report = []
+    for info in infos:
+        state = info.session.session_state
+        # get_stats() de Streamlit ne renvoie qu'un nombre de clés sans server.enableExpensiveMemoryStats
+        size = deep_size(dict(state.filtered_state))
+        report.append(dict(session=info.session.id, runs=info.script_run_count,
+                           keys=len(state.filtered_state), kb=round(size / 2**10, 1)))
+    return report
+
+
+def memory_report(sizes=True, cube=None):
+    """Rapport complet, sérialisable en JSON (voir ``cache_report`` pour ``cube``).
+
+    ``caches_partial`` est vrai lorsque ``caches_mb`` omet des caches remplis
+    mais non mesurés (mesure désactivée ou cube absent).
+    """
+    sessions = session_report()
+    caches = cache_report(sizes, cube)
+    return dict(
+        time=datetime.now().isoformat(timespec="seconds"),
+        pid=os.getpid(),
+        process=process_memory(),
+        caches=caches,
+        caches_mb=round(sum(c.get("mb") or 0 for c in caches), 2),
+        # Total minoré : des caches remplis n'ont pas pu être mesurés
+        caches_partial=any(c["entries"] and c.get("mb") is None for c in caches),
+        sessions=sessions,
+        sessions_kb=round(sum(s["kb"] for s in sessions), 1),
+    )
+
+
+def _warm_up():
+    """Charge les données et construit les index partagés, comme au premier passage des pages ; renvoie le cube."""
+    from beyondgdp.assistant import smart_query
+    from beyondgdp.autocomplete import completion_trie
+    from beyondgdp.cube import load_cube
+
+    cube = load_cube()
+    completion_trie(cube)
+    smart_query("Top 10 des pays pour le PIB par habitant en 2020", cube)
+    return cube
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rapport mémoire JSON du processus")
+    parser.add_argument("--warm", action="store_true",
+                        help="charge d'abord les données et les index partagés")
+    parser.add_argument("--output", help="fichier JSON (défaut : sortie standard)")
+    args = parser.parse_args(argv)
+
+    cube = _warm_up() if args.warm else None
+    text = json.dumps(memory_report(cube=cube), ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
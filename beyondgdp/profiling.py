@@ -0,0 +1,111 @@
+"""Mesure du temps passé dans chaque section des pages.
+
+Activée par la variable d'environnement ``BEYONDGDP_PROFILE`` :
+
+    BEYONDGDP_PROFILE=1 streamlit run Home.py
+
+Chaque exécution d'une page est alors découpée en sections successives
+(chargement, filtrage, calcul, construction des figures, envoi par
+``st.plotly_chart``) : ``lap(nom)`` clôt la section en cours, commencée au
+``lap`` précédent. Le découpage est affiché dans un panneau de la barre
+latérale et ajouté, une ligne JSON par exécution, à un journal tournant
+(``logs/timings.log`` par défaut, ou ``BEYONDGDP_PROFILE_LOG``).
+
+Désactivée, la mesure se réduit à un test par section.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+
+from beyondgdp.data import BASE_DIR
+
+ENABLED = os.environ.get("BEYONDGDP_PROFILE", "").lower() not in ("", "0", "false", "non")
+LOG_PATH = os.environ.get("BEYONDGDP_PROFILE_LOG") or os.path.join(BASE_DIR, "logs", "timings.log")
+LOG_MAX_BYTES = 5 * 2**20
+LOG_BACKUPS = 3
+
+_local = threading.local()      # exécution en cours, propre au thread de chaque session
+_logger = None
+_logger_lock = threading.Lock()
+
+
+class Run:
+    """Sections mesurées d'une exécution de page, dans l'ordre."""
+
+    def __init__(self, page):
+        self.page = page
+        self.start = self.last = time.perf_counter()
+        self.spans = []         # (nom, secondes)
+
+    def lap(self, name):
+        now = time.perf_counter()
+        self.spans.append((name, now - self.last))
+        self.last = now
+
+
+def lap(name):
+    """Clôt la section ``name`` de la page en cours (sans effet si la mesure est désactivée)."""
+    if ENABLED:
+        run = getattr(_local, "run", None)
+        if run is not None:
+            run.lap(name)
+
+
+def start(page):
+    """Début de l'exécution d'une page."""
+    if ENABLED:
+        _local.run = Run(page)
+
+
+def finish():
+    """Fin de l'exécution : ligne de journal et panneau de la barre latérale."""
+    run = getattr(_local, "run", None) if ENABLED else None
+    if run is None:
+        return
+    _local.run = None
+    total = time.perf_counter() - run.start
+    _log(run, total)
+    _panel(run, total)
+
+
+def _get_logger():
+    global _logger
+    with _logger_lock:
+        if _logger is not None:
+            return _logger
+        os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+        logger = logging.getLogger("beyondgdp.profiling")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        handler = RotatingFileHandler(LOG_PATH, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS,
+                                      encoding="utf-8")
+        logger.addHandler(handler)
+        _logger = logger
+    return _logger
+
+
+def _log(run, total):
+    _get_logger().info(json.dumps(dict(
+        time=datetime.now().isoformat(timespec="milliseconds"),
+        page=run.page,
+        total_ms=round(total * 1000, 2),
+        spans=[[name, round(seconds * 1000, 2)] for name, seconds in run.spans],
+    ), ensure_ascii=False))
+
+
+def _panel(run, total):
+    import pandas as pd
+    import streamlit as st  # type: ignore
+
+    table = pd.DataFrame(run.spans, columns=["section", "ms"])
+    table["ms"] = (table["ms"] * 1000).round(1)
+    table["part (%)"] = (100 * table["ms"] / (total * 1000)).round(1)
+
+    with st.sidebar.expander(f"⏱️ Temps d'exécution : {total * 1000:.0f} ms", expanded=False):
+        st.caption(f"Dernière exécution de « {run.page} », sections dans l'ordre de la page.")
+        st.dataframe(table, hide_index=True, use_container_width=True)
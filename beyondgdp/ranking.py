@@ -0,0 +1,87 @@
+"""Classements précalculés par (indicateur, année), pour les pays réels.
+
+Un seul tri du cube, fait au premier classement demandé, donne pour chaque
+couple (indicateur, année) l'ordre des pays du plus élevé au plus faible et
+le rang de chaque pays. Un top-k n'est alors qu'une tranche de ``order`` et
+le rang d'un pays une lecture de ``ranks`` : le coût d'une réponse ne dépend
+plus du nombre d'entités.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from beyondgdp.entities import COUNTRY
+
+
+class RankTables:
+    """``order`` (indicateurs, années, pays) : positions du cube triées par valeur décroissante,
+    les ``counts[i, y]`` premières étant renseignées. ``ranks`` (pays, indicateurs, années) :
+    rang 1 = valeur la plus élevée, 0 = valeur manquante ou entité hors classement.
+    """
+
+    def __init__(self, cube, kind=COUNTRY):
+        self.cube = cube
+        positions = cube.country_positions(kind=kind)
+        values = cube.values[positions]                         # (pays, indicateurs, années)
+        filled = ~np.isnan(values)
+
+        # Tri décroissant, valeurs manquantes reléguées en fin
+        key = np.where(filled, -values, np.inf)
+        order = np.argsort(key, axis=0, kind="stable")
+
+        ranks = np.empty(order.shape, dtype=np.int32)
+        np.put_along_axis(ranks, order, np.arange(1, len(positions) + 1)[:, None, None], axis=0)
+        ranks[~filled] = 0
+
+        self.counts = filled.sum(axis=0).astype(np.int32)                 # (indicateurs, années)
+        self.order = positions[order].transpose(1, 2, 0).copy()           # (indicateurs, années, pays)
+        self.ranks = np.zeros(cube.values.shape, dtype=np.int32)
+        self.ranks[positions] = ranks
+
+        for array in (self.counts, self.order, self.ranks):
+            array.setflags(write=False)
+
+    def top(self, indicator, year, k, lowest=False):
+        """Positions du cube des ``k`` premiers (ou derniers) pays, dans l'ordre du classement."""
+        i, y = self.cube.indicator_index[indicator], self.cube.year_index[int(year)]
+        n = self.counts[i, y]
+        k = min(k, n)
+        if lowest:
+            return self.order[i, y, n - k:n][::-1]
+        return self.order[i, y, :k]
+
+    def rank(self, country, indicator, year):
+        """(rang, nombre de pays classés) ; rang 0 si le pays n'a pas de valeur."""
+        i, y = self.cube.indicator_index[indicator], self.cube.year_index[int(year)]
+        return int(self.ranks[self.cube.country_index[country], i, y]), int(self.counts[i, y])
+
+
+def percentile(rank, n):
+    """Part (%) des pays classés dont la valeur est inférieure."""
+    return 100.0 * (n - rank) / n
+
+
+def _quantile(rank, n, q):
+    """Groupe du pays parmi ``q`` groupes de même taille, de 1 (valeurs les plus faibles) à ``q``.
+
+    Le premier du classement est toujours dans le groupe ``q`` ; le dernier
+    dans le groupe 1 dès que ``n >= q``.
+    """
+    return -(-q * (n - rank + 1) // n)         # ⌈q × (n − rang + 1) / n⌉
+
+
+def decile(rank, n):
+    """Décile du pays, de 1 (valeurs les plus faibles) à 10 (les plus élevées)."""
+    return _quantile(rank, n, 10)
+
+
+def quartile(rank, n):
+    """Quartile du pays, de 1 (valeurs les plus faibles) à 4 (les plus élevées)."""
+    return _quantile(rank, n, 4)
+
+
+@lru_cache(maxsize=None)
+def rank_tables(cube):
+    """Tables de classement partagées des pays réels du cube."""
+    return RankTables(cube)
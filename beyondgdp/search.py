@@ -0,0 +1,68 @@
+"""Index inversé mot → indicateurs pour la recherche de repli de l'assistant.
+
+Quand aucun alias n'est reconnu, l'assistant cherche les mots de la question
+dans les libellés officiels des indicateurs. Les libellés sont découpés une
+fois par processus en mots normalisés ; chaque mot pointe vers les
+indicateurs qui le contiennent, pondéré par son IDF : un mot présent dans un
+seul indicateur (« gini ») pèse plus qu'un mot partagé (« capita »), et les
+mots vides (« of », « de », « % ») sont ignorés.
+"""
+
+import math
+import re
+from functools import lru_cache
+
+from beyondgdp.matcher import normalise
+
+WORD = re.compile(r"\w+")
+
+STOPWORDS = {
+    # anglais
+    "a", "an", "and", "as", "at", "by", "for", "from", "in", "of", "on", "or", "per", "the", "to", "with",
+    # français
+    "au", "aux", "d", "de", "des", "du", "en", "et", "l", "la", "le", "les", "par", "pour", "quel",
+    "quelle", "sur", "un", "une",
+}
+
+
+def tokenize(text):
+    """Mots normalisés d'un texte, sans mots vides ni nombres (années, seuils)."""
+    return [
+        word for word in WORD.findall(normalise(text))
+        if word not in STOPWORDS and not word.isdigit()
+    ]
+
+
+class WordIndex:
+    """Index inversé ``mot → {libellé: poids}`` sur une liste de libellés."""
+
+    def __init__(self, labels):
+        self.labels = list(labels)
+
+        postings = {}
+        for label in self.labels:
+            for word in set(tokenize(label)):
+                postings.setdefault(word, []).append(label)
+
+        n = len(self.labels)
+        self.idf = {word: math.log(1 + n / len(found)) for word, found in postings.items()}
+        self.postings = postings
+
+    def search(self, text, limit=None):
+        """Libellés contenant au moins un mot du texte, du meilleur score au moins bon.
+
+        Le score d'un libellé est la somme des IDF des mots distincts trouvés.
+        """
+        scores = {}
+        for word in set(tokenize(text)):
+            for label in self.postings.get(word, ()):
+                scores[label] = scores.get(label, 0.0) + self.idf[word]
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit] if limit else ranked
+
+
+@lru_cache(maxsize=None)
+def indicator_search(cube):
+    """Index partagé des libellés d'indicateurs du cube."""
+    return WordIndex(cube.indicators)
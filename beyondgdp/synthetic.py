@@ -0,0 +1,229 @@
+"""Jeux de données synthétiques à l'échelle du WDI, pour les tests de montée en charge.
+
+Deux fichiers peuvent être produits, de même structure que les vrais :
+
+- le CSV long du dashboard (``data_dashboard_BeyondGDP.csv``) ;
+- le dump large ``WDICSV.csv`` (une ligne par entité × indicateur, une
+  colonne par année) que lit ``beyondgdp.ingestion``.
+
+Les entités sont les pays cités par l'assistant (codes ISO3 réels), les
+agrégats WDI, puis des économies fictives ; les indicateurs sont ceux de
+``VARIABLES_SELECTION``, complétés d'indicateurs fictifs. Les lacunes imitent
+celles du WDI : séries complètes à quelques trous près (PIB, espérance de
+vie), séries récentes (PM2.5), enquêtes irrégulières (Gini, pauvreté),
+publications ponctuelles (capital humain), entités sans aucune donnée pour un
+indicateur. Le tirage est entièrement déterminé par ``--seed``.
+
+Utilisation :
+
+    python -m beyondgdp.synthetic --preset 10x --long data_10x.csv --wide WDICSV_10x.csv
+    python -m beyondgdp.synthetic --entities 266 --indicators 400 --start 1960 --end 2023 --long data.csv
+
+Le CSV long se charge à la place du vrai via la variable d'environnement
+``BEYONDGDP_DATA`` (dashboard, assistant, banc d'essai).
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from beyondgdp.entities import WDI_AGGREGATES
+from beyondgdp.ingestion import ID_COLUMNS, OUTPUT_COLUMNS, VARIABLES_SELECTION, YEAR_MAX, YEAR_MIN
+
+# Pays reconnus par l'assistant : nom WDI → ISO3
+REAL_COUNTRIES = {
+    "Algeria": "DZA", "Argentina": "ARG", "Australia": "AUS", "Austria": "AUT", "Bangladesh": "BGD",
+    "Belgium": "BEL", "Brazil": "BRA", "Bulgaria": "BGR", "Cameroon": "CMR", "Canada": "CAN",
+    "Chile": "CHL", "China": "CHN", "Colombia": "COL", "Cote d'Ivoire": "CIV", "Croatia": "HRV",
+    "Czechia": "CZE", "Denmark": "DNK", "Egypt, Arab Rep.": "EGY", "Estonia": "EST", "Ethiopia": "ETH",
+    "Finland": "FIN", "France": "FRA", "Germany": "DEU", "Ghana": "GHA", "Hungary": "HUN",
+    "Iceland": "ISL", "India": "IND", "Indonesia": "IDN", "Iran, Islamic Rep.": "IRN", "Iraq": "IRQ",
+    "Ireland": "IRL", "Italy": "ITA", "Japan": "JPN", "Kenya": "KEN", "Korea, Rep.": "KOR",
+    "Latvia": "LVA", "Lithuania": "LTU", "Mali": "MLI", "Mexico": "MEX", "Morocco": "MAR",
+    "Netherlands": "NLD", "New Zealand": "NZL", "Nigeria": "NGA", "Norway": "NOR", "Pakistan": "PAK",
+    "Paraguay": "PRY", "Peru": "PER", "Poland": "POL", "Portugal": "PRT", "Qatar": "QAT",
+    "Romania": "ROU", "Russian Federation": "RUS", "Saudi Arabia": "SAU", "Senegal": "SEN", "Serbia": "SRB",
+    "Slovak Republic": "SVK", "Slovenia": "SVN", "South Africa": "ZAF", "Spain": "ESP", "Sweden": "SWE",
+    "Switzerland": "CHE", "Thailand": "THA", "Tunisia": "TUN", "Turkiye": "TUR", "Ukraine": "UKR",
+    "United Arab Emirates": "ARE", "United Kingdom": "GBR", "United States": "USA", "Uruguay": "URY",
+    "Venezuela, RB": "VEN", "Viet Nam": "VNM",
+}
+
+# Profils de lacunes
+DENSE = "dense"         # série quasi complète
+RECENT = "recent"       # série commençant tardivement (satellites, nouvelles méthodes)
+SURVEY = "survey"       # enquêtes irrégulières (Gini, pauvreté)
+PERIODIC = "periodic"   # publications ponctuelles (indice de capital humain)
+
+PROFILES = {
+    "SI.POV.GINI": SURVEY,
+    "SI.POV.DDAY": SURVEY,
+    "HD.HCI.OVRL": PERIODIC,
+    "EN.ATM.PM25.MC.M3": RECENT,
+}
+# Profils des indicateurs fictifs
+PROFILE_WEIGHTS = {DENSE: 0.5, RECENT: 0.2, SURVEY: 0.25, PERIODIC: 0.05}
+PERIODIC_YEARS = [2010, 2012, 2017, 2018, 2020]
+
+MISSING_ENTITY = 0.10   # part des entités sans aucune donnée pour un indicateur
+MISSING_VALUE = 0.03    # trous isolés dans une série complète
+
+# Entités × indicateurs × années (217 économies + 49 agrégats dans le WDI)
+PRESETS = {
+    "base": (266, len(VARIABLES_SELECTION), YEAR_MIN, YEAR_MAX),
+    "10x": (266, 10 * len(VARIABLES_SELECTION), YEAR_MIN, YEAR_MAX),
+    "100x": (266, 100 * len(VARIABLES_SELECTION), YEAR_MIN, YEAR_MAX),
+    "wdi": (266, 1496, 1960, 2023),
+}
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+# ===================
+# Entités, indicateurs
+# ===================
+def make_entities(n):
+    """(nom, code) des ``n`` entités, triées par nom comme dans le WDI."""
+    entities = list(REAL_COUNTRIES.items()) + [(name, code) for code, (name, _) in WDI_AGGREGATES.items()]
+    for k in range(max(0, n - len(entities))):
+        entities.append((f"Synthetic economy {k + 1:04d}", "Z" + DIGITS[k // 36 % 36] + DIGITS[k % 36]))
+    return sorted(entities[:n])
+
+
+def make_indicators(n, rng):
+    """(code, nom, profil) des ``n`` indicateurs : la sélection du dashboard, puis des indicateurs fictifs."""
+    indicators = [(code, name, PROFILES.get(code, DENSE)) for code, name in VARIABLES_SELECTION.items()]
+    profiles = rng.choice(list(PROFILE_WEIGHTS), size=max(0, n - len(indicators)),
+                          p=list(PROFILE_WEIGHTS.values()))
+    for k, profile in enumerate(profiles):
+        indicators.append((f"SYN.{k + 1:05d}", f"Synthetic indicator {k + 1:05d} ({profile})", profile))
+    return indicators[:n]
+
+
+# =======
+# Valeurs
+# =======
+class Generator:
+    """Tirage des séries entité par entité, avec des paramètres fixes par indicateur."""
+
+    def __init__(self, n_entities, n_indicators, start, end, seed=0):
+        self.rng = np.random.default_rng(seed)
+        self.entities = make_entities(n_entities)
+        self.indicators = make_indicators(n_indicators, self.rng)
+        self.years = np.arange(start, end + 1)
+
+        n = len(self.indicators)
+        self.profiles = np.array([profile for _, _, profile in self.indicators])
+        self.scale = np.exp(self.rng.uniform(0, 9, size=n))             # ordres de grandeur variés
+        self.growth = self.rng.normal(0.01, 0.015, size=n)
+        # Première année publiée des séries récentes
+        self.first_year = np.where(self.profiles == RECENT, self.rng.integers(1990, 2011, size=n), start)
+
+    def block(self):
+        """Valeurs (indicateurs, années) de l'entité suivante ; NaN = valeur manquante."""
+        rng, years = self.rng, self.years
+        n, t = len(self.indicators), np.arange(len(years))
+
+        level = self.scale * rng.lognormal(0, 0.5, size=n)
+        growth = self.growth + rng.normal(0, 0.01, size=n)
+        noise = rng.normal(0, 0.03, size=(n, len(years))).cumsum(axis=1)    # marche aléatoire
+        values = level[:, None] * np.exp(growth[:, None] * t + noise)
+
+        observed = rng.random((n, len(years))) >= MISSING_VALUE
+        # Chaque entité commence sa série un peu plus tard ou plus tôt
+        observed &= years >= (self.first_year + rng.integers(0, 10, size=n))[:, None]
+
+        survey = self.profiles == SURVEY
+        observed[survey] &= rng.random((survey.sum(), len(years))) < rng.uniform(0.05, 0.5, size=(survey.sum(), 1))
+        observed[self.profiles == PERIODIC] &= np.isin(years, PERIODIC_YEARS)
+
+        observed &= (rng.random(n) >= MISSING_ENTITY)[:, None]
+        return np.where(observed, values, np.nan)
+
+    def __iter__(self):
+        """(nom, code, valeurs) de chaque entité, dans l'ordre du fichier."""
+        for name, code in self.entities:
+            yield name, code, self.block()
+
+
+# ========
+# Écriture
+# ========
+def write(generator, long_path=None, wide_path=None, float_format="%.6g"):
+    """Écrit le CSV long et/ou le dump large, entité par entité ; renvoie le nombre de valeurs."""
+    codes = [code for code, _, _ in generator.indicators]
+    names = np.array([name for _, name, _ in generator.indicators], dtype=object)
+    years = generator.years
+
+    outputs = {}
+    for path in (long_path, wide_path):
+        if path and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+    if long_path:
+        outputs["long"] = open(long_path, "w", encoding="utf-8", newline="")
+        pd.DataFrame(columns=OUTPUT_COLUMNS).to_csv(outputs["long"], index=False)
+    if wide_path:
+        outputs["wide"] = open(wide_path, "w", encoding="utf-8", newline="")
+        pd.DataFrame(columns=ID_COLUMNS + [str(y) for y in years]).to_csv(outputs["wide"], index=False)
+
+    n_values = 0
+    try:
+        for name, code, values in generator:
+            if "long" in outputs:
+                i, y = np.nonzero(~np.isnan(values))
+                pd.DataFrame({
+                    "Country Name": name, "Country Code": code, "Indicator Name": names[i],
+                    "Year": years[y], "Value": values[i, y],
+                }).to_csv(outputs["long"], index=False, header=False, float_format=float_format)
+                n_values += len(i)
+            if "wide" in outputs:
+                wide = pd.DataFrame(values, columns=[str(y) for y in years])
+                wide.insert(0, "Country Name", name)
+                wide.insert(1, "Country Code", code)
+                wide.insert(2, "Indicator Name", names)
+                wide.insert(3, "Indicator Code", codes)
+                wide.to_csv(outputs["wide"], index=False, header=False, float_format=float_format)
+                if "long" not in outputs:
+                    n_values += int((~np.isnan(values)).sum())
+    finally:
+        for f in outputs.values():
+            f.close()
+    return n_values
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Génère un jeu de données synthétique au format WDI")
+    parser.add_argument("--preset", choices=list(PRESETS), default="base",
+                        help="taille prédéfinie (défaut : %(default)s) : " + ", ".join(
+                            f"{k} = {e} entités × {i} indicateurs × {s}–{t}" for k, (e, i, s, t) in PRESETS.items()))
+    parser.add_argument("--entities", type=int, help="nombre d'entités (remplace le préréglage)")
+    parser.add_argument("--indicators", type=int, help="nombre d'indicateurs (remplace le préréglage)")
+    parser.add_argument("--start", type=int, help="première année (remplace le préréglage)")
+    parser.add_argument("--end", type=int, help="dernière année (remplace le préréglage)")
+    parser.add_argument("--seed", type=int, default=0, help="graine du tirage (défaut : %(default)s)")
+    parser.add_argument("--long", dest="long_path", help="CSV long au format du dashboard")
+    parser.add_argument("--wide", dest="wide_path", help="dump large au format WDICSV.csv")
+    args = parser.parse_args(argv)
+    if not args.long_path and not args.wide_path:
+        parser.error("indiquer au moins --long ou --wide")
+
+    n_entities, n_indicators, start, end = PRESETS[args.preset]
+    generator = Generator(
+        args.entities or n_entities, args.indicators or n_indicators,
+        args.start or start, args.end or end, seed=args.seed
+    )
+
+    t0 = time.perf_counter()
+    n_values = write(generator, args.long_path, args.wide_path)
+    print(f"{len(generator.entities)} entités × {len(generator.indicators)} indicateurs × "
+          f"{len(generator.years)} années : {n_values:,} valeurs en {time.perf_counter() - t0:.1f} s")
+    for path in (args.long_path, args.wide_path):
+        if path:
+            print(f"Fichier sauvegardé : {path} ({os.path.getsize(path) / 2**20:.1f} Mo)")
+
+
+if __name__ == "__main__":
+    main()
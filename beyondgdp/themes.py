@@ -0,0 +1,186 @@
+"""Moteur commun des pages thématiques (économie, santé, éducation…).
+
+Chaque page décrit son thème dans un ``ThemeSpec`` — indicateurs, libellés,
+couleurs, textes — et fournit la fonction qui dessine son graphique de
+comparaison internationale. ``render_theme_page`` enchaîne ensuite les mêmes
+sections pour tous les thèmes, à partir du cube et des figures partagés.
+"""
+
+import streamlit as st # type: ignore
+
+from beyondgdp import profiling
+from beyondgdp.assets import banner_src
+from beyondgdp.cube import load_cube
+from beyondgdp.entities import COUNTRY
+from beyondgdp.figures import correlation_figure, evolution_figure
+
+GDP = "GDP per capita (current US$)"
+
+FOOTER_HTML = """
+    <div style="
+        width: 100%;
+        background-color: #009EDB;
+        padding: 22px 0;
+        margin-top: 50px;
+        text-align: center;
+        color: white;
+        font-size: 15px;
+        font-weight: 500;
+    ">
+        Analyse réalisée dans une démarche pédagogique inspirée des travaux de l’UNCTAD —
+        <a href="https://unctad.org" target="_blank" style="color: white; text-decoration: underline;">
+            www.unctad.org
+        </a>
+        <br>
+        <span style="font-size: 14px; font-weight: 400;">
+            Contact — clarapierreuse@outlook.fr
+        </span>
+    </div>
+    """
+
+
+class ThemeSpec:
+    """Description d'une page thématique.
+
+    ``indicators`` associe code WDI → libellé (le PIB en premier), ``labels``
+    libellé → nom court affiché dans la matrice de corrélation, ``colors``
+    libellé → couleur des courbes normalisées. ``definitions`` est une liste
+    de paires (titre, texte), une colonne par paire, titrées en
+    ``definition_heading`` (``"h4"`` par défaut). ``title_below_banner`` place
+    le titre sous la bannière plutôt qu'à côté. ``comparison`` dessine le
+    graphique de comparaison internationale : ``comparison(cube, countries)``.
+    """
+
+    def __init__(self, page_title, page_icon, banner, title, indicators, labels, colors,
+                 definitions, why_title, why_text, evolution_title, line_title,
+                 relations_title, comparison_title, comparison, conclusion_title, conclusion_html,
+                 definition_heading="h4", title_below_banner=False):
+        self.page_title = page_title
+        self.page_icon = page_icon
+        self.banner = banner
+        self.title = title
+        self.indicators = dict(indicators)
+        self.labels = dict(labels)
+        self.colors = dict(colors)
+        self.definitions = list(definitions)
+        self.why_title = why_title
+        self.why_text = why_text
+        self.evolution_title = evolution_title
+        self.line_title = line_title
+        self.relations_title = relations_title
+        self.comparison_title = comparison_title
+        self.comparison = comparison
+        self.conclusion_title = conclusion_title
+        self.conclusion_html = conclusion_html
+        self.definition_heading = definition_heading
+        self.title_below_banner = title_below_banner
+
+    # Clés de cache des figures partagées (tuples hachables, stables d'un rerun à l'autre)
+    @property
+    def indicator_names(self):
+        return tuple(self.indicators.values())
+
+    @property
+    def label_pairs(self):
+        return tuple((ind, self.labels[ind]) for ind in self.indicators.values())
+
+    @property
+    def color_pairs(self):
+        return tuple(self.colors.items())
+
+
+def _centered(tag, text):
+    st.markdown(f"<{tag} style='text-align: center;'>{text}</{tag}>", unsafe_allow_html=True)
+
+
+def render_theme_page(spec):
+    """Dessine une page thématique complète à partir de son ``ThemeSpec``."""
+    st.set_page_config(page_title=spec.page_title, page_icon=spec.page_icon, layout="wide")
+    profiling.start(spec.page_title)
+
+    # Cube partagé entre toutes les pages
+    cube = load_cube()
+    profiling.lap("chargement")
+
+    # ================
+    # TITRE AVEC IMAGE
+    # ================
+    # Titre renvoyé à la ligne sous la bannière si demandé
+    wrap = " flex-wrap: wrap; text-align: center;" if spec.title_below_banner else ""
+    title_style = " flex: 1 1 100%; text-align: center;" if spec.title_below_banner else ""
+    st.markdown(
+        f"""
+        <div style="display: flex; justify-content: center; align-items: center; gap: 12px; margin-top:20px; margin-bottom:10px;{wrap}">
+            <img src="{banner_src(spec.banner)}" style="height:55px;">
+            <h1 style="margin:0; padding:0;{title_style}">{spec.title}</h1>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+    st.markdown("---")
+
+    # ===========================
+    # DÉFINITIONS DES INDICATEURS
+    # ===========================
+    for col, (heading, text) in zip(st.columns(len(spec.definitions)), spec.definitions):
+        with col:
+            _centered(spec.definition_heading, heading)
+            st.markdown(text)
+    st.markdown("---")
+
+    # ===============================
+    # IMPORTANCE DE LA CONFRONTATION
+    # ===============================
+    _centered("h3", spec.why_title)
+    _centered("p", spec.why_text)
+    st.markdown("---")
+    profiling.lap("textes")
+
+    # ===============================
+    # GRAPHIQUE D'ÉVOLUTION COMPARATIVE (NORMALISÉE)
+    # ===============================
+    _centered("h3", spec.evolution_title)
+
+    countries = cube.countries_with_data(spec.indicator_names, kind=COUNTRY)
+    selected_country = st.selectbox(
+        "Sélectionner un pays :",
+        countries,
+        index=countries.index("France") if "France" in countries else 0
+    )
+
+    fig_line = evolution_figure(cube, spec.indicator_names, spec.color_pairs, spec.line_title, selected_country)
+    profiling.lap("évolution : filtre et figure")
+    st.plotly_chart(fig_line, use_container_width=True)
+    profiling.lap("évolution : affichage")
+    st.markdown("---")
+
+    # ===============================
+    # DOUBLE VISUEL : MATRICE + COMPARAISON INTERNATIONALE
+    # ===============================
+    _centered("h3", spec.relations_title)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        _centered("h4", "Matrice de corrélation")
+        fig_corr = correlation_figure(cube, spec.label_pairs, selected_country)
+        profiling.lap("corrélation : calcul et figure")
+        st.plotly_chart(fig_corr, use_container_width=True)
+        profiling.lap("corrélation : affichage")
+
+    with col2:
+        _centered("h4", spec.comparison_title)
+        spec.comparison(cube, countries)
+
+    st.markdown("---")
+
+    # ==========
+    # CONCLUSION
+    # ==========
+    _centered("h3", spec.conclusion_title)
+    st.markdown(spec.conclusion_html, unsafe_allow_html=True)
+
+    # Bannière bas de page
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
+    profiling.lap("conclusion")
+    profiling.finish()
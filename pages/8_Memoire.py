@@ -0,0 +1,76 @@
+import json
+
+import pandas as pd
+import streamlit as st # type: ignore
+
+from beyondgdp import load_cube, profiling
+from beyondgdp.memory import memory_report
+
+# CONFIGURATION
+
+st.set_page_config(page_title="Mémoire - Beyond GDP", page_icon="🧮", layout="wide")
+
+# AJOUT DU FOND
+
+st.markdown("""
+<style>
+.stApp {
+    background-color: #E8F2FD;
+}
+</style>
+""", unsafe_allow_html=True)
+
+# =========
+# INTERFACE
+# =========
+st.markdown("<h1 style='text-align: center;'>Mémoire du serveur</h1>", unsafe_allow_html=True)
+st.markdown("---")
+
+# Diagnostic réservé aux exécutions instrumentées
+if not profiling.ENABLED:
+    st.info("Page de diagnostic désactivée : lancer le serveur avec `BEYONDGDP_PROFILE=1` pour l'afficher.")
+    st.stop()
+
+st.markdown("""
+<p style="font-size:14px; text-align:justify;">
+Page de diagnostic : mémoire résidente du processus Streamlit, taille des caches partagés par toutes
+les sessions (données, cube, index de l’assistant, réponses, figures) et état propre à chaque session
+ouverte. Un objet présent dans plusieurs caches n’est compté qu’une fois, dans le premier ; la taille
+des caches de réponses et de figures est estimée d’après leurs dernières valeurs (colonne « estimated »).
+</p>
+""", unsafe_allow_html=True)
+
+sizes = st.toggle("Mesurer la taille des caches", value=False,
+                  help="Le parcours des objets en cache peut prendre quelques secondes sur un gros jeu de données.")
+st.button("Actualiser")
+
+report = memory_report(sizes, load_cube())
+
+# Processus
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("Mémoire résidente", f"{report['process']['rss_mb']} Mo")
+col2.metric("Pic de mémoire résidente", f"{report['process']['peak_rss_mb']} Mo")
+# Total minoré (préfixe « ≥ ») si des caches remplis n'ont pas pu être mesurés
+col3.metric("Caches partagés", (f"≥ {report['caches_mb']} Mo" if report["caches_partial"] else f"{report['caches_mb']} Mo")
+            if sizes else "—")
+col4.metric("Sessions actives", f"{len(report['sessions'])} ({report['sessions_kb']} Ko)")
+
+# Caches
+st.markdown("### Caches partagés")
+caches = pd.DataFrame(report["caches"])
+if sizes and not caches.empty:
+    caches = caches.sort_values("mb", ascending=False, na_position="last")
+st.dataframe(caches, hide_index=True, use_container_width=True)
+
+# Sessions
+st.markdown("### Sessions")
+if report["sessions"]:
+    st.dataframe(pd.DataFrame(report["sessions"]), hide_index=True, use_container_width=True)
+else:
+    st.info("Aucune session active (page exécutée hors du serveur Streamlit).")
+
+st.download_button(
+    "Télécharger le rapport (JSON)",
+    json.dumps(report, ensure_ascii=False, indent=2),
+    file_name=f"memoire_{report['pid']}.json", mime="application/json"
+)
@@ -0,0 +1,23 @@
+"""Cube de test : jeu synthétique réduit, tiré une fois par session de tests."""
+
+import pytest
+
+from beyondgdp.cube import load_cube
+from beyondgdp.ingestion import VARIABLES_SELECTION
+from beyondgdp.synthetic import Generator, write
+
+# Pays réels et agrégats WDI de ``beyondgdp.synthetic``, sans économie fictive
+N_ENTITIES = 120
+
+
+@pytest.fixture(scope="session")
+def data_path(tmp_path_factory):
+    """CSV long synthétique, au format de data_dashboard_BeyondGDP.csv."""
+    path = tmp_path_factory.mktemp("data") / "data_dashboard_BeyondGDP.csv"
+    write(Generator(N_ENTITIES, len(VARIABLES_SELECTION), 1990, 2022, seed=0), long_path=str(path))
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def cube(data_path):
+    return load_cube(data_path)
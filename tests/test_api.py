@@ -0,0 +1,94 @@
+import json
+import socket
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import pytest
+
+from beyondgdp.api import PooledHTTPServer
+
+MULTI_INDICATOR = "pib et inflation de la france entre 2010 et 2012"
+
+
+@pytest.fixture(scope="module")
+def server(cube):
+    server = PooledHTTPServer(("127.0.0.1", 0), cube, workers=2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def _get(url):
+    try:
+        with urllib.request.urlopen(url) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.load(exc)
+
+
+def test_ask_multi_indicator_series(server):
+    status, payload = _get(f"{server}/ask?figure=0&q={urllib.parse.quote(MULTI_INDICATOR)}")
+    assert status == 200
+    assert [row["year"] for row in payload["table"]] == [2010, 2011, 2012]
+    assert "GDP per capita (current US$) | France" in payload["table"][0]
+
+
+def _post(url, body):
+    request = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.load(exc)
+
+
+@pytest.mark.parametrize("body", [b'"PIB de la France en 2010"', b"[1, 2]", b"null"])
+def test_ask_post_rejects_non_object_body(server, body):
+    status, payload = _post(f"{server}/ask", body)
+    assert status == 400 and "error" in payload
+
+
+def test_ask_post(server):
+    status, payload = _post(f"{server}/ask?figure=0", json.dumps({"question": "PIB France 2010"}).encode())
+    assert status == 200 and payload["intent"]["countries"] == ["France"]
+
+
+def test_panel_requires_a_filter(server):
+    assert _get(f"{server}/panel")[0] == 400
+    assert _get(f"{server}/panel?start=2000&end=2010")[0] == 400
+    status, rows = _get(f"{server}/panel?country=France&indicator=pib&start=2010&end=2012")
+    assert status == 200 and rows
+    assert {row["year"] for row in rows} <= {2010, 2011, 2012}
+    assert {(row["country"], row["indicator"]) for row in rows} == {("France", "GDP per capita (current US$)")}
+
+
+def _raw(server, request):
+    """Réponse brute (ligne de statut) d'une requête HTTP envoyée telle quelle."""
+    host, port = urllib.parse.urlsplit(server).netloc.split(":")
+    with socket.create_connection((host, int(port)), timeout=5) as sock:
+        sock.sendall(request)
+        return sock.recv(4096).split(b"\r\n", 1)[0]
+
+
+@pytest.mark.parametrize("length, status", [(b"-1", b"400"), (b"abc", b"400"), (b"100000000", b"413")])
+def test_ask_post_rejects_bad_content_length(server, length, status):
+    line = _raw(server, b"POST /ask HTTP/1.1\r\nHost: x\r\nContent-Length: " + length + b"\r\n\r\n")
+    assert status in line
+
+
+def test_idle_connections_do_not_block_workers(server):
+    host, port = urllib.parse.urlsplit(server).netloc.split(":")
+    # Autant de connexions inactives que de workers
+    idle = [socket.create_connection((host, int(port))) for _ in range(2)]
+    try:
+        start = time.perf_counter()
+        assert _get(f"{server}/health")[0] == 200
+        assert time.perf_counter() - start < 5
+    finally:
+        for sock in idle:
+            sock.close()
@@ -0,0 +1,27 @@
+import base64
+import io
+import os
+
+from PIL import Image # type: ignore
+
+from beyondgdp.assets import BANNER_HEIGHT, IMG_PATH, PIXEL_RATIO, banner_png, banner_src
+
+
+def test_banner_is_resized_to_display_height_and_lighter():
+    path = os.path.join(IMG_PATH, "RubanSante.png")
+    png = banner_png(path)
+    with Image.open(io.BytesIO(png)) as img, Image.open(path) as original:
+        assert img.height == BANNER_HEIGHT * PIXEL_RATIO
+        # Proportions conservées, à l'arrondi près
+        assert abs(img.width - original.width * img.height / original.height) <= 1
+        assert img.mode == "P"
+    assert len(png) < os.path.getsize(path)
+
+
+def test_banner_src_is_a_cached_data_uri():
+    src = banner_src("RubanEnv.png")
+    prefix = "data:image/png;base64,"
+    assert src.startswith(prefix)
+    with Image.open(io.BytesIO(base64.b64decode(src[len(prefix):]))) as img:
+        assert img.format == "PNG"
+    assert banner_src("RubanEnv.png") is src
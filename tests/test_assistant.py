@@ -0,0 +1,193 @@
+import numpy as np
+import pytest
+
+from beyondgdp.assistant import (
+    MAX, MIN, NO_DATA, RANK, RESULT_CACHE_SIZE, Intent, cache_stats, cached_execute, execute, parse_question,
+    smart_query,
+)
+from beyondgdp.entities import COUNTRY
+from beyondgdp.ranking import decile, quartile, rank_tables
+
+GDP = "GDP per capita (current US$)"
+LIFE = "Life expectancy at birth (years)"
+
+
+# ===========================
+# Analyse : question → Intent
+# ===========================
+@pytest.mark.parametrize("question, expected", [
+    ("PIB par habitant en France en 2010",
+     Intent(("France",), (GDP,), (2010,))),
+    ("Espérance de vie au Japon et en Inde depuis 1990",
+     Intent(("India", "Japan"), (LIFE,), (), (1990, None), True)),
+    ("Évolution du PIB par habitant de la Chine entre 2000 et 2020",
+     Intent(("China",), (GDP,), (), (2000, 2020), True)),
+    ("Top 10 des pays pour le PIB par habitant en 2020",
+     Intent((), (GDP,), (2020,), aggregation=MAX, limit=10)),
+    ("Les 5 pays avec l'espérance de vie la plus faible en 2010",
+     Intent((), (LIFE,), (2010,), aggregation=MIN, limit=5)),
+    # Nombre avant ou après « premiers » / « derniers »
+    ("Les 3 premiers PIB 2020",
+     Intent((), (GDP,), (2020,), aggregation=MAX, limit=3)),
+    ("premiers 3 PIB 2020",
+     Intent((), (GDP,), (2020,), aggregation=MAX, limit=3)),
+    ("les derniers 3 Gini 2020",
+     Intent((), ("Gini index",), (2020,), aggregation=MIN, limit=3)),
+    ("Rang de la France pour le PIB par habitant en 2018",
+     Intent(("France",), (GDP,), (2018,), aggregation=RANK)),
+    ("Allemangne PIB 2010",
+     Intent(("Germany",), (GDP,), (2010,))),
+    # Mots des libellés officiels jamais corrigés : « index » n'est pas « Inde »
+    ("Gini index de la France en 2015",
+     Intent(("France",), ("Gini index",), (2015,))),
+    ("Human capital index du Japon en 2020",
+     Intent(("Japan",), ("Human capital index (0–1 scale)",), (2020,))),
+    # « % PIB » est l'unité de l'indicateur, pas un second indicateur
+    ("Dépenses de santé (% PIB) en Allemagne en 2018",
+     Intent(("Germany",), ("Current health expenditure (% of GDP)",), (2018,))),
+    ("Investissement en % du PIB en Chine en 2008",
+     Intent(("China",), ("Gross capital formation (% of GDP)",), (2008,))),
+    ("PIB et inflation de la France entre 2010 et 2012",
+     Intent(("France",), (GDP, "Inflation, consumer prices (annual %)"), (), (2010, 2012), True)),
+])
+def test_parse_question(cube, question, expected):
+    assert parse_question(question, cube) == expected
+
+
+def test_parse_question_ignores_wording(cube):
+    assert (parse_question("PIB de la France et du Japon en 2015", cube)
+            == parse_question("pib du japon et de la france en 2015", cube))
+
+
+# ===========================
+# Classements
+# ===========================
+def _cross_section(cube, indicator, year):
+    return cube.frame(indicators=[indicator], years=[year], kind=COUNTRY).dropna(subset=["value"])
+
+
+@pytest.mark.parametrize("aggregation, limit", [(MAX, 10), (MIN, 5)])
+def test_top_matches_sorted_cross_section(cube, aggregation, limit):
+    answer = execute(Intent((), (GDP,), (2020,), aggregation=aggregation, limit=limit), cube)
+    d = _cross_section(cube, GDP, 2020)
+    expected = d.nlargest(limit, "value") if aggregation == MAX else d.nsmallest(limit, "value")
+    assert answer.table["country"].tolist() == expected["country"].tolist()
+
+
+def test_ranks_match_cross_section(cube):
+    answer = execute(Intent(("France", "Japan"), (GDP,), (2015,), aggregation=RANK), cube)
+    d = _cross_section(cube, GDP, 2015)
+    for row in answer.table.itertuples():
+        value = d.loc[d["country"] == row.country, "value"].iloc[0]
+        assert row.rank == 1 + (d["value"] > value).sum()
+        assert row.out_of == len(d)
+        assert row.percentile == pytest.approx(100 * (d["value"] < value).sum() / len(d), abs=0.05)
+
+
+def test_rank_tables_exclude_aggregates(cube):
+    tables = rank_tables(cube)
+    aggregates = np.flatnonzero(cube.entity_types != COUNTRY)
+    assert len(aggregates) and not tables.ranks[aggregates].any()
+
+
+@pytest.mark.parametrize("question, column, word", [
+    ("Quel est le quartile de la France pour le PIB par habitant en 2020 ?", "quartile", "quartile"),
+    ("Dans quel décile se situe la France pour le PIB par habitant en 2020 ?", "decile", "décile"),
+    ("Rang de la France pour le PIB par habitant en 2020", "decile", "décile"),
+    ("Dans quel percentile est la France pour le PIB par habitant en 2020 ?", None, "percentile"),
+])
+def test_ranks_report_requested_quantile(cube, question, column, word):
+    answer = execute(parse_question(question, cube), cube)
+    extra = set(answer.table.columns) - {"country", "indicator", "year", "value", "rank", "out_of", "percentile"}
+    assert extra == ({column} if column else set())
+    assert word in answer.text
+
+
+def test_quartile_bounds():
+    assert [quartile(rank, 8) for rank in range(1, 9)] == [4, 4, 3, 3, 2, 2, 1, 1]
+    assert quartile(1, 1) == 4 and quartile(5, 5) == 1
+
+
+@pytest.mark.parametrize("n", [1, 9, 10, 11, 20, 199])
+def test_decile_and_quartile_bounds(n):
+    # Premier et dernier classés aux extrémités, groupes de taille croissante avec le rang
+    for quantile, q in ((decile, 10), (quartile, 4)):
+        groups = [quantile(rank, n) for rank in range(1, n + 1)]
+        assert groups[0] == q and groups == sorted(groups, reverse=True)
+        assert set(groups) <= set(range(1, q + 1))
+        if n >= q:
+            assert groups[-1] == 1
+    assert [decile(rank, 20) for rank in range(1, 21)] == [q for q in range(10, 0, -1) for _ in range(2)]
+
+
+def test_lowest_ranks_count_from_the_lowest_value(cube):
+    answer = execute(parse_question("Quel pays a le Gini le plus faible en 2020 ?", cube), cube)
+    d = _cross_section(cube, "Gini index", 2020)
+    assert answer.table["country"].tolist() == [d.nsmallest(1, "value")["country"].iloc[0]]
+    assert answer.table["rank"].tolist() == [1]
+    answer = execute(Intent((), (GDP,), (2020,), aggregation=MIN, limit=5), cube)
+    assert answer.table["rank"].tolist() == [1, 2, 3, 4, 5]
+
+
+# ===========================
+# Périodes et séries temporelles
+# ===========================
+@pytest.mark.parametrize("question, period", [
+    ("PIB par habitant de la France entre 2005 et 2010", (2005, 2010)),
+    ("PIB par habitant de la France de 2005 à 2010", (2005, 2010)),
+    ("PIB par habitant de la France 2005-2010", (2005, 2010)),
+    ("PIB par habitant de la France depuis 2015", (2015, None)),
+])
+def test_parse_period(cube, question, period):
+    intent = parse_question(question, cube)
+    assert intent.period == period and intent.series and intent.years == ()
+
+
+def test_series_table_covers_requested_period(cube):
+    answer = execute(Intent(("France", "Germany"), (GDP,), (), (2005, 2010), True), cube)
+    assert list(answer.table.columns) == ["France", "Germany"]
+    assert answer.table.index.min() >= 2005 and answer.table.index.max() <= 2010
+    assert answer.figure is not None and "2005" in answer.text
+
+
+def test_open_period_runs_to_latest_year(cube):
+    answer = execute(Intent(("France",), (GDP,), (), (2015, None), True), cube)
+    d = cube.frame(countries=["France"], indicators=[GDP]).dropna(subset=["value"])
+    assert answer.table.index.max() == d["year"].max()
+
+
+def test_series_without_years_returns_whole_history(cube):
+    answer = execute(parse_question("Évolution du PIB par habitant de la France", cube), cube)
+    d = cube.frame(countries=["France"], indicators=[GDP]).dropna(subset=["value"])
+    assert answer.table["France"].dropna().index.tolist() == d["year"].tolist()
+
+
+def test_multi_indicator_series_has_one_column_per_pair(cube):
+    answer = execute(Intent(("France",), (GDP, LIFE), (), (2010, 2012), True), cube)
+    assert set(answer.table.columns) == {(GDP, "France"), (LIFE, "France")}
+    assert {f"{GDP} | France", "year"} <= set(answer.records()[0])
+
+
+def test_period_outside_cube_has_no_data(cube):
+    answer = execute(Intent(("France",), (GDP,), (), (1800, 1850), True), cube)
+    assert answer.table is None and answer.text == NO_DATA
+
+
+# ===========================
+# Cache des réponses
+# ===========================
+def test_same_intent_is_answered_from_cache(cube):
+    cached_execute.cache_clear()
+    first = smart_query("PIB de la France et du Japon en 2015", cube)
+    second = smart_query("pib du japon et de la france en 2015", cube)
+    assert second is first
+    stats = cache_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+    assert stats["maxsize"] == RESULT_CACHE_SIZE
+
+
+def test_different_intents_are_cached_separately(cube):
+    cached_execute.cache_clear()
+    a = smart_query("PIB de la France en 2015", cube)
+    b = smart_query("PIB de la France en 2016", cube)
+    assert a is not b and cache_stats()["size"] == 2
@@ -0,0 +1,51 @@
+from beyondgdp.autocomplete import (
+    MAX_SUGGESTIONS, YEAR, PrefixTrie, Suggestion, apply_suggestion, completion_trie, suggest,
+)
+from beyondgdp.entities import COUNTRY
+from beyondgdp.matcher import INDICATOR
+
+
+def test_trie_keeps_first_entries_once_per_target():
+    trie = PrefixTrie(size=2)
+    trie.insert("france", Suggestion("France", COUNTRY, "France"))
+    trie.insert("francais", Suggestion("Français", COUNTRY, "France"))
+    trie.insert("fidji", Suggestion("Fidji", COUNTRY, "Fiji"))
+    trie.insert("finlande", Suggestion("Finlande", COUNTRY, "Finland"))
+    assert [s.label for s in trie.complete("f")] == ["France", "Fidji"]
+    assert [s.label for s in trie.complete("fra")] == ["France"]
+    assert trie.complete("x") == []
+
+
+def test_suggest_completes_last_fragment(cube):
+    position, found = suggest("PIB de la Fr", cube)
+    assert position == 10 and found[0] == Suggestion("France", COUNTRY, "France")
+    text = apply_suggestion("PIB de la Fr", position, found[0])
+    assert text == "PIB de la France "
+    assert suggest(text, cube) == (len(text), [])
+
+
+def test_suggest_prefers_longest_fragment(cube):
+    position, found = suggest("Quelle est espérance de", cube)
+    assert position == 11 and found[0].kind == INDICATOR and found[0].label == "espérance de vie"
+    _, found = suggest("Corée du", cube)
+    assert found[0].label == "Corée du Sud"
+
+
+def test_suggest_completes_after_elision(cube):
+    # « l'espérance de » : le fragment commence après l'apostrophe
+    position, found = suggest("Quelle est l'espérance de", cube)
+    assert position == 13 and found[0].label == "espérance de vie"
+    position, found = suggest("PIB de l'In", cube)
+    assert position == 9 and found[0] == Suggestion("Inde", COUNTRY, "India")
+
+
+def test_suggest_recent_years_first(cube):
+    _, found = suggest("PIB de la France en 20", cube)
+    years = [int(s.name) for s in found]
+    assert all(s.kind == YEAR for s in found) and len(found) == MAX_SUGGESTIONS
+    assert years == sorted(years, reverse=True) and years[0] == int(cube.years.max())
+
+
+def test_completion_trie_is_shared(cube):
+    assert completion_trie(cube) is completion_trie(cube)
+    assert suggest("", cube) == (0, [])
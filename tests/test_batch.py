@@ -0,0 +1,46 @@
+import csv
+import json
+
+import pytest
+
+from beyondgdp import batch
+
+MULTI_INDICATOR = "pib et inflation de la france entre 2010 et 2012"
+
+
+@pytest.fixture
+def shared_cube(cube, monkeypatch):
+    monkeypatch.setattr(batch, "load_cube", lambda: cube)
+    return cube
+
+
+def test_read_questions_skips_blank_and_comment_lines(tmp_path):
+    path = tmp_path / "questions.txt"
+    path.write_text("# lot de test\nPIB France 2010\n\n  \nGini Brésil 2015\n", encoding="utf-8")
+    assert batch.read_questions(str(path)) == [(2, "PIB France 2010"), (5, "Gini Brésil 2015")]
+
+
+def test_answer_row_records_intent_and_table(cube):
+    row = batch.answer_row(3, MULTI_INDICATOR, cube)
+    assert row["status"] == "ok" and row["index"] == 3
+    assert row["countries"] == "France" and row["years"] == "2010-2012"
+    assert [record["year"] for record in json.loads(row["table"])] == [2010, 2011, 2012]
+
+
+def test_answer_row_logs_errors_instead_of_raising(cube):
+    row = batch.answer_row(1, None, cube)
+    assert row["status"] == "erreur" and row["answer"].startswith("AttributeError")
+    assert set(row) == set(batch.COLUMNS)
+
+
+def test_batch_writes_one_csv_row_per_question(shared_cube, tmp_path):
+    output = tmp_path / "out" / "answers.csv"
+    questions = [(1, MULTI_INDICATOR), (2, "PIB par habitant en France en 2010"), (4, "Bonjour")]
+    summary = batch.run_batch(questions, str(output), workers=2, log=None)
+    assert summary["questions"] == 3 and summary["errors"] == 0
+    with open(output, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == batch.COLUMNS
+    assert sorted((int(row["index"]), row["question"]) for row in rows) == questions
+    single = next(row for row in rows if row["index"] == "2")
+    assert "France" in single["answer"] and single["years"] == "2010"
@@ -0,0 +1,47 @@
+import pytest
+
+from beyondgdp import benchmark
+
+
+def test_summarise_reports_percentiles_in_ms():
+    case = benchmark.summarise([0.001, 0.002, 0.003, 0.010], peak_mb=1.234)
+    assert case["n"] == 4 and case["max_ms"] == pytest.approx(10)
+    assert case["p50_ms"] == pytest.approx(2.5) and case["mean_ms"] == pytest.approx(4)
+    assert case["peak_mb"] == 1.23 and case["rss_mb"] > 0
+
+
+def test_measure_runs_setup_before_each_call():
+    events = []
+    durations = benchmark.measure([lambda: events.append("call")] * 3, setup=lambda: events.append("setup"))
+    assert len(durations) == 3 and events == ["setup", "call"] * 3
+
+
+def test_compare_skips_error_and_missing_cases(capsys):
+    results = {"a": dict(p50_ms=2.0), "b": dict(error="boom"), "c": dict(p50_ms=1.0)}
+    previous = {"a": dict(p50_ms=4.0), "b": dict(p50_ms=1.0)}
+    benchmark.compare(results, previous)
+    lines = capsys.readouterr().out.strip().splitlines()
+    assert len(lines) == 2 and lines[1].startswith("a") and lines[1].endswith("0.50×")
+
+
+def test_bench_pages_records_failures_and_keeps_going(tmp_path):
+    broken = tmp_path / "broken.py"
+    broken.write_text("raise ValueError('page cassée')\n", encoding="utf-8")
+    working = tmp_path / "working.py"
+    working.write_text(
+        "import streamlit as st\n"
+        "country = st.selectbox('Pays', ['France', 'Japan'])\n"
+        "st.write(country)\n",
+        encoding="utf-8",
+    )
+    results = benchmark.bench_pages(["Japan", "Narnia"], [2020], pages=[str(broken), str(working)])
+    assert "page cassée" in results["page.broken"]["error"]
+    assert results["page.working.first"]["n"] == 1
+    assert results["page.working.sweep"]["n"] == 1
+
+
+def test_bench_assistant_cases(cube, monkeypatch):
+    monkeypatch.setattr(benchmark, "load_cube", lambda: cube)
+    results = benchmark.bench_assistant(benchmark.QUESTIONS[:3], repeat=2)
+    assert set(results) == {"assistant.parse", "assistant.smart_query_cold", "assistant.smart_query_warm"}
+    assert all(case["n"] == 6 for case in results.values())
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from beyondgdp.correlation import correlation_matrices
+
+GDP = "GDP per capita (current US$)"
+LIFE = "Life expectancy at birth (years)"
+INDICATORS = (GDP, LIFE, "Inflation, consumer prices (annual %)", "Urban population (% of total population)")
+
+
+@pytest.mark.parametrize("method", ["pearson", "spearman"])
+@pytest.mark.parametrize("country", ["France", "Brazil", "India"])
+def test_correlation_matches_dataframe_corr(cube, method, country):
+    corr, overlap = correlation_matrices(cube, INDICATORS, method).frames(country)
+    wide = (cube.frame(countries=[country], indicators=list(INDICATORS))
+            .pivot(index="year", columns="indicator", values="value")
+            .reindex(columns=list(INDICATORS)).astype(np.float64))
+    expected = wide.corr(method=method)
+    pd.testing.assert_frame_equal(corr.astype(np.float64), expected, check_names=False, atol=1e-4)
+    assert overlap.to_numpy().diagonal().tolist() == wide.notna().sum().tolist()
+
+
+def test_correlation_matrices_cover_every_country_once(cube):
+    matrices = correlation_matrices(cube, INDICATORS)
+    assert matrices.r.shape == (len(cube.countries), len(INDICATORS), len(INDICATORS))
+    assert correlation_matrices(cube, INDICATORS) is matrices
+    # Matrices symétriques, diagonale à 1 dès que la série varie
+    r = matrices.r[cube.country_index["France"]]
+    np.testing.assert_array_equal(np.isnan(r), np.isnan(r.T))
+    assert np.allclose(np.diagonal(r)[~np.isnan(np.diagonal(r))], 1.0)
+
+
+def test_correlation_matrices_skip_unknown_indicators_and_methods(cube):
+    assert correlation_matrices(cube, (GDP, "Unknown indicator", LIFE)).indicators == [GDP, LIFE]
+    with pytest.raises(ValueError):
+        correlation_matrices(cube, INDICATORS, "kendall")
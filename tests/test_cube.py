@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from beyondgdp.cube import IndicatorCube, map_locations
+from beyondgdp.data import load_data
+
+GDP = "GDP per capita (current US$)"
+GINI = "Gini index"
+
+
+def test_frame_round_trips_the_dataset(cube, data_path):
+    df = load_data(data_path)
+    frame = cube.frame()
+    assert len(frame) == len(df)
+    key = ["country", "indicator", "year"]
+    expected = df.astype({"country": str, "indicator": str, "year": int}).sort_values(key)
+    got = frame.astype({"year": int}).sort_values(key)
+    np.testing.assert_array_equal(got["value"].to_numpy(), expected["value"].to_numpy())
+
+
+def test_series_and_cross_section_read_the_cube(cube, data_path):
+    df = load_data(data_path)
+    series = cube.series("France", GDP)
+    rows = df[(df["country"] == "France") & (df["indicator"] == GDP)].sort_values("year")
+    assert series.index.tolist() == rows["year"].tolist()
+    np.testing.assert_array_equal(series.to_numpy(), rows["value"].to_numpy())
+
+    section = cube.cross_section(GDP, 2010)
+    rows = df[(df["indicator"] == GDP) & (df["year"] == 2010)]
+    assert dict(zip(section.index, section)) == dict(zip(rows["country"].astype(str), rows["value"]))
+
+
+def test_panel_and_frame_keep_requested_order(cube):
+    panel = cube.panel(["Japan", "France"], [GINI, GDP], [2000, 2001])
+    assert panel.shape == (2, 2, 2)
+    assert np.array_equal(panel[1, 1], cube.values[cube.country_index["France"], cube.indicator_index[GDP],
+                                                   [cube.year_index[2000], cube.year_index[2001]]],
+                          equal_nan=True)
+    frame = cube.frame(countries=["France"], indicators=[GINI, GDP], years=range(1990, 2023))
+    assert frame["indicator"].drop_duplicates().tolist() == [i for i in (GINI, GDP) if i in set(frame["indicator"])]
+    # Libellés inconnus ignorés, valeurs manquantes exclues
+    assert cube.frame(countries=["Atlantis"]).empty
+    assert frame["value"].notna().all()
+
+
+def test_cube_is_read_only(cube):
+    with pytest.raises(ValueError):
+        cube.values[0, 0, 0] = 1.0
+
+
+def test_countries_with_data(cube):
+    names = cube.countries_with_data([GDP])
+    assert names == sorted(names)
+    has_gdp = ~np.isnan(cube.values[:, cube.indicator_index[GDP]]).all(axis=1)
+    assert names == [c for c, keep in zip(cube.countries, has_gdp) if keep]
+
+
+def test_iso3_codes_follow_the_countries(cube):
+    frame = cube.frame(countries=["France", "Japan"])
+    assert dict(zip(frame["country"], frame["iso3"])) == {"France": "FRA", "Japan": "JPN"}
+    assert cube.iso3[cube.iso3_index["DEU"]] == "DEU" and cube.countries[cube.iso3_index["DEU"]] == "Germany"
+    assert map_locations(cube) == dict(locations="iso3", locationmode="ISO-3")
+
+
+def test_cube_without_codes_falls_back_to_names(cube):
+    df = cube.frame(countries=["France"], indicators=[GDP]).drop(columns="iso3")
+    df = df.astype({"country": "category", "indicator": "category"})
+    bare = IndicatorCube.from_frame(df)
+    assert not bare.has_iso3 and "iso3" not in bare.frame().columns
+    assert map_locations(bare) == dict(locations="country", locationmode="country names")
+
+
+def test_normalisation_matches_groupby_transform(cube):
+    frame = cube.frame(countries=["France", "Brazil", "India"], normalised=True)
+    # Calcul des anciennes pages : min-max par série, série constante ramenée à 0
+    expected = frame.groupby(["country", "indicator"])["value"].transform(
+        lambda x: (x - x.min()) / (x.max() - x.min()) if x.max() > x.min() else 0 * x
+    )
+    np.testing.assert_allclose(frame["value_norm"], expected, atol=1e-5)
+    lo, hi = cube.series_min[cube.country_index["France"]], cube.series_max[cube.country_index["France"]]
+    assert (np.isnan(lo) == np.isnan(hi)).all() and (lo[~np.isnan(lo)] <= hi[~np.isnan(hi)]).all()
+
+
+def test_constant_series_normalise_to_zero():
+    values = np.array([[[2.0, 2.0, np.nan], [np.nan, np.nan, np.nan]]], dtype=np.float32)
+    cube = IndicatorCube(values, ["A"], ["x", "y"], [2000, 2001, 2002])
+    assert cube.normalised[0, 0, :2].tolist() == [0.0, 0.0] and np.isnan(cube.normalised[0, 0, 2])
+    assert np.isnan(cube.series_min[0, 1]) and np.isnan(cube.normalised[0, 1]).all()
@@ -0,0 +1,27 @@
+import pandas as pd
+
+from beyondgdp.data import DTYPES, iso3_lookup, load_data, loaded_data, read_dataset
+
+
+def test_read_dataset_is_typed_and_complete(data_path):
+    df = read_dataset(data_path)
+    assert list(df.columns) == list(DTYPES)
+    assert {col: str(df[col].dtype) for col in df.columns} == DTYPES
+    assert df["value"].notna().all()
+    raw = pd.read_csv(data_path)
+    assert len(df) == raw["Value"].notna().sum()
+
+
+def test_read_dataset_tolerates_padded_headers_and_missing_codes(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text(" Country Name,Indicator Name , Year,Value \n"
+                    "France,Gini index,2015,32.7\nFrance,Gini index,2016,\n", encoding="utf-8")
+    df = read_dataset(str(path))
+    assert list(df.columns) == ["country", "indicator", "year", "value"]
+    assert len(df) == 1 and iso3_lookup(df) == {}
+
+
+def test_load_data_is_shared(data_path):
+    df = load_data(data_path)
+    assert load_data(data_path) is df and loaded_data(data_path) is df
+    assert iso3_lookup(df)["France"] == "FRA"
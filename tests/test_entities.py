@@ -0,0 +1,30 @@
+import pytest
+
+from beyondgdp.entities import COUNTRY, INCOME, REGION, WDI_AGGREGATES, classify_entities, entity_type
+
+
+@pytest.mark.parametrize("name, iso3, expected", [
+    ("France", "FRA", COUNTRY),
+    ("High income", "HIC", INCOME),
+    ("High income", None, INCOME),             # CSV sans codes : repli sur le libellé
+    ("Arab World", "ARB", REGION),
+    ("Middle East, North Africa, Afghanistan & Pakistan", None, REGION),
+    ("Synthetic economy 0001", "Z01", COUNTRY),
+])
+def test_entity_type(name, iso3, expected):
+    assert entity_type(name, iso3) == expected
+
+
+def test_classify_entities_aligns_with_names():
+    assert classify_entities(["France", "Arab World"]) == [COUNTRY, REGION]
+    assert classify_entities(["France", "Arab World"], ["FRA", "ARB"]) == [COUNTRY, REGION]
+
+
+def test_cube_keeps_aggregates_out_of_country_lists(cube):
+    aggregates = {name for name, _ in WDI_AGGREGATES.values()}
+    countries = cube.entities(COUNTRY)
+    assert countries and not aggregates & set(countries)
+    assert aggregates & set(cube.countries)
+    assert set(cube.countries_with_data(kind=COUNTRY)) <= set(countries)
+    frame = cube.frame(years=[2010], kind=COUNTRY)
+    assert set(frame["country"]) <= set(countries)
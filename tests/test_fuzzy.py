@@ -0,0 +1,43 @@
+import pytest
+
+from beyondgdp.entities import COUNTRY
+from beyondgdp.fuzzy import FuzzyIndex, edit_distance, fuzzy_matcher, max_distance
+from beyondgdp.matcher import normalise
+
+PATTERNS = {"allemagne": "DEU", "inde": "IND", "coree du sud": "KOR"}
+
+
+@pytest.mark.parametrize("a, b, distance", [
+    ("allemagne", "allemagne", 0),
+    ("allemangne", "allemagne", 1),
+    ("alemagne", "allemagne", 1),
+    ("chien", "chat", 3),
+])
+def test_edit_distance(a, b, distance):
+    assert edit_distance(a, b, 5) == distance
+
+
+def test_edit_distance_stops_past_limit():
+    assert edit_distance("allemagne", "espagne", 1) == 2
+    assert edit_distance("a", "abcdef", 2) == 3
+    assert [max_distance(word) for word in ("inde", "allemagne", "republique tcheque")] == [1, 2, 3]
+
+
+def test_misspellings_resolve_to_closest_label():
+    index = FuzzyIndex(PATTERNS)
+    assert index.find("pib de l'allemangne") == [(9, 19, "DEU")]
+    assert [value for _, _, value in index.find("pib de la coree du sudd")] == ["KOR"]
+
+
+def test_covered_filler_and_vocabulary_words_are_never_corrected():
+    index = FuzzyIndex(PATTERNS, words={"index"})
+    assert index.find("gini index") == []
+    assert index.find("allemangne", covered=[(0, 10)]) == []
+    assert index.find("pays plus") == []
+
+
+def test_fuzzy_matcher_keeps_official_label_words(cube):
+    matcher = fuzzy_matcher(cube)
+    assert "index" in matcher.vocabulary and "capita" in matcher.vocabulary
+    assert matcher.find(normalise("Allemangne")) == [(0, 10, (COUNTRY, "Germany"))]
+    assert fuzzy_matcher(cube) is matcher
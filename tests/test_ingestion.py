@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+
+from beyondgdp.ingestion import OUTPUT_COLUMNS, VARIABLES_SELECTION, build_dataset
+from beyondgdp.synthetic import Generator, write
+
+
+@pytest.fixture(scope="module")
+def wide_path(tmp_path_factory):
+    """Petit dump WDICSV.csv : indicateurs de la sélection et indicateurs fictifs, 1975–2023."""
+    path = tmp_path_factory.mktemp("wdi") / "WDICSV.csv"
+    write(Generator(40, len(VARIABLES_SELECTION) + 10, 1975, 2023, seed=1), wide_path=str(path))
+    return str(path)
+
+
+def _long(wide_path, year_min=1980, year_max=2023):
+    wide = pd.read_csv(wide_path)
+    wide = wide[wide["Indicator Code"].isin(VARIABLES_SELECTION)]
+    years = [c for c in wide.columns[4:] if year_min <= int(c) <= year_max]
+    return wide.melt(id_vars=list(wide.columns[:4]), value_vars=years,
+                     var_name="Year", value_name="Value").dropna(subset=["Value"])
+
+
+@pytest.mark.parametrize("chunksize", [7, 100_000])
+def test_build_dataset_matches_one_shot_melt(wide_path, tmp_path, chunksize):
+    output = tmp_path / "data.csv"
+    n_rows = build_dataset(wide_path, str(output), chunksize=chunksize)
+    df = pd.read_csv(output)
+    expected = _long(wide_path)
+
+    assert list(df.columns) == OUTPUT_COLUMNS and n_rows == len(df) == len(expected)
+    assert set(df["Indicator Name"]) <= set(VARIABLES_SELECTION.values())
+    assert df["Year"].between(1980, 2023).all()
+    key = ["Country Code", "Indicator Name", "Year"]
+    pd.testing.assert_series_equal(df.sort_values(key)["Value"].reset_index(drop=True),
+                                   expected.sort_values(key)["Value"].astype(float).reset_index(drop=True),
+                                   check_names=False)
+
+
+def test_build_dataset_writes_header_without_matches(wide_path, tmp_path):
+    output = tmp_path / "data.csv"
+    assert build_dataset(wide_path, str(output), selection={"XX.NONE": "None"}) == 0
+    assert list(pd.read_csv(output).columns) == OUTPUT_COLUMNS
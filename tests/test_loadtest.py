@@ -0,0 +1,79 @@
+import glob
+import os
+import random
+
+import pytest
+from streamlit.testing.v1 import AppTest # type: ignore
+
+from beyondgdp import loadtest
+from beyondgdp.data import BASE_DIR
+
+WIDGETS = ["slider", "radio", "selectbox", "text_area", "button"]
+
+
+def _page_file(page):
+    if page == loadtest.HOME:
+        return os.path.join(BASE_DIR, "Home.py")
+    return glob.glob(os.path.join(BASE_DIR, "pages", f"*_{page}.py"))[0]
+
+
+@pytest.fixture(scope="module")
+def page_widgets():
+    """Widgets affichés par chaque page à sa première exécution : (type, libellé) → proto."""
+    widgets = {}
+    for page in [loadtest.HOME] + loadtest.THEME_PAGES + [loadtest.ASSISTANT]:
+        at = AppTest.from_file(_page_file(page), default_timeout=120).run()
+        assert not at.exception
+        widgets[page] = {(kind, el.label): el.proto for kind in WIDGETS for el in at.get(kind)}
+    return widgets
+
+
+@pytest.mark.parametrize("scenario", list(loadtest.SCRIPTS))
+@pytest.mark.parametrize("seed", range(5))
+def test_scenarios_only_touch_widgets_the_pages_show(page_widgets, scenario, seed):
+    # Les libellés des scénarios doivent suivre ceux des pages
+    client = loadtest.SessionClient("ws://127.0.0.1:1")
+    actions = loadtest.SCRIPTS[scenario](random.Random(seed))
+    assert actions[0][0] == f"{scenario}.ouverture" and actions[0][2] is None
+    for _, page, prepare in actions:
+        client.page, client.widgets = page, page_widgets[page]
+        if prepare is not None:
+            prepare(client)
+    assert client.states or len(actions) == 1
+
+
+def test_home_script_ends_on_animation():
+    actions = loadtest.home_script(random.Random(0))
+    names = [name for name, _, _ in actions]
+    assert names[0] == "accueil.ouverture" and names[-1] == "accueil.animation"
+    assert set(names[1:-1]) == {"accueil.annee"}
+
+
+def test_missing_widget_is_a_script_error():
+    client = loadtest.SessionClient("ws://127.0.0.1:1")
+    with pytest.raises(loadtest.ScriptError):
+        client.set("slider", "Choisir une année :", double_array_value=[2020])
+
+
+def test_stage_summary_ignores_ramp_and_counts_errors():
+    results = [
+        dict(action="a", start=0.5, end=1.0, seconds=0.5, bytes=100, error=None),     # montée en charge
+        dict(action="a", start=2.0, end=2.1, seconds=0.1, bytes=2**20, error=None),
+        dict(action="b", start=3.0, end=3.3, seconds=0.3, bytes=2**20, error=None),
+        dict(action="b", start=4.0, end=9.0, seconds=5.0, bytes=0, error="ScriptError : x"),
+    ]
+    timeline = [dict(t=1.0, cpu_pct=50.0, rss_mb=100.0), dict(t=2.0, cpu_pct=None, rss_mb=None)]
+    stage = loadtest.summarise_stage(3, results, timeline, ramp=1.0, duration=11.0)
+    assert (stage["runs"], stage["errors"], stage["runs_per_s"], stage["mb_per_s"]) == (3, 1, 0.2, 0.2)
+    assert set(stage["actions"]) == {"a", "b"} and stage["latency"]["max_ms"] == 300.0
+    assert stage["cpu_mean_pct"] == 50.0 and stage["rss_max_mb"] == 100.0
+    assert stage["error_messages"] == {"ScriptError : x": 1}
+    assert loadtest.percentiles([]) == dict(n=0)
+
+
+def test_timeline_adds_throughput_per_interval():
+    results = [dict(end=0.5, seconds=0.2, error=None), dict(end=1.5, seconds=0.4, error=None),
+               dict(end=1.8, seconds=1.0, error="erreur")]
+    samples = loadtest._timeline(results, [dict(t=1.0), dict(t=2.0), dict(t=3.0)])
+    assert [s["runs_per_s"] for s in samples] == [1.0, 1.0, 0.0]
+    assert [s["p95_ms"] for s in samples] == [200.0, 400.0, None]
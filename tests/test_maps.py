@@ -0,0 +1,31 @@
+from beyondgdp.entities import COUNTRY
+from beyondgdp.maps import animated_choropleth
+
+GDP = "GDP per capita (current US$)"
+
+
+def test_animation_has_one_frame_per_year_with_data(cube):
+    fig = animated_choropleth(cube, GDP, "PIB en {year}", start_year=2010)
+    years = sorted(cube.frame(indicators=[GDP], kind=COUNTRY)["year"].unique())
+    assert [int(frame.name) for frame in fig.frames] == years
+    assert fig.frames[0].layout.title.text == f"PIB en {years[0]}"
+    # Ouverture sur l'année demandée, échelle de couleurs commune à toutes les années
+    start = years.index(2010)
+    assert fig.layout.sliders[0].active == start and fig.layout.title.text == "PIB en 2010"
+    assert list(fig.data[0].locations) == list(fig.frames[start].data[0].locations)
+    assert fig.layout.coloraxis.cmin is not None and fig.layout.coloraxis.cmax is not None
+
+
+def test_animation_keys_on_iso3_and_excludes_aggregates(cube):
+    fig = animated_choropleth(cube, GDP, "{year}")
+    locations = {code for frame in fig.frames for code in frame.data[0].locations}
+    assert "FRA" in locations and "WLD" not in locations
+    assert fig.data[0].locationmode == "ISO-3"
+
+
+def test_animation_rounds_values_and_is_cached(cube):
+    fig = animated_choropleth(cube, GDP, "{year}", decimals=0)
+    assert all(float(v).is_integer() for frame in fig.frames for v in frame.data[0].z)
+    assert animated_choropleth(cube, GDP, "{year}", decimals=0) is fig
+    # Sans année demandée : dernière année disponible
+    assert fig.layout.sliders[0].active == len(fig.frames) - 1
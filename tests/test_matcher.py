@@ -0,0 +1,30 @@
+from beyondgdp.entities import COUNTRY
+from beyondgdp.matcher import INDICATOR, AliasMatcher, entity_matcher, normalise
+
+
+def test_normalise_strips_case_accents_and_quotes():
+    assert normalise("États-Unis") == normalise("etats-unis") == "etats-unis"
+    assert normalise("CO₂ de l’Inde") == "co2 de l'inde"
+
+
+def test_longest_match_wins_without_overlap():
+    matcher = AliasMatcher({"corée": "KOR?", "corée du sud": "KOR", "sud": "S"})
+    assert matcher.find("PIB de la Corée du Sud") == [(10, 22, "KOR")]
+    assert [value for _, _, value in matcher.find("corée et sud")] == ["KOR?", "S"]
+
+
+def test_patterns_respect_word_boundaries():
+    matcher = AliasMatcher({"eau": "water", "inde": "IND"})
+    assert matcher.find("le niveau de l'Indonésie") == []
+    assert [value for _, _, value in matcher.find("l'eau en Inde")] == ["water", "IND"]
+
+
+def test_first_declared_pattern_wins():
+    matcher = AliasMatcher({"France": "a", "france": "b", "": "ignoré"})
+    assert matcher.find("France") == [(0, 6, "a")]
+
+
+def test_entity_matcher_finds_countries_and_indicators(cube):
+    values = [value for _, _, value in entity_matcher(cube).find("PIB de la France")]
+    assert values == [(INDICATOR, "GDP per capita (current US$)"), (COUNTRY, "France")]
+    assert entity_matcher(cube) is entity_matcher(cube)
@@ -0,0 +1,57 @@
+from beyondgdp.assistant import smart_query
+from beyondgdp.cube import IndicatorCube
+from beyondgdp.caching import SAMPLE_SIZE, sampled_lru_cache
+from beyondgdp.memory import cache_report, deep_size, memory_report
+from beyondgdp.ranking import rank_tables
+
+
+def test_cache_report_measures_shared_objects_once(cube):
+    smart_query("Top 10 des pays pour le PIB par habitant en 2020", cube)
+    report = {entry["name"]: entry for entry in cache_report(cube=cube)}
+
+    assert report["beyondgdp.cube.load_cube"]["mb"] > 0
+    # Données du fichier du cube, pas celles de DATA_PATH
+    assert report["beyondgdp.data.load_data"]["mb"] > 0
+    assert report["beyondgdp.ranking.rank_tables"]["mb"] > 0
+    assert not report["beyondgdp.cube.load_cube"]["estimated"]
+    # Caches indexés par question : taille estimée sur leurs dernières réponses
+    assert report["beyondgdp.assistant.cached_execute"]["entries"] >= 1
+    assert report["beyondgdp.assistant.cached_execute"]["mb"] > 0
+    assert report["beyondgdp.assistant.cached_execute"]["estimated"]
+    # Le cube, déjà compté, ne l'est pas une seconde fois dans les classements qui le référencent
+    alone = deep_size(rank_tables(cube)) / 2**20
+    assert report["beyondgdp.ranking.rank_tables"]["mb"] < alone - report["beyondgdp.cube.load_cube"]["mb"] / 2
+
+
+def test_cache_report_never_loads_data_for_a_cube_without_file(cube):
+    other = IndicatorCube(cube.values, cube.countries, cube.indicators, cube.years)
+    report = {entry["name"]: entry for entry in cache_report(cube=other)}
+    assert report["beyondgdp.data.load_data"]["mb"] is None
+
+
+def test_memory_report_without_cube_measures_nothing(cube):
+    report = memory_report()
+    assert all(entry["mb"] is None for entry in report["caches"] if not entry["estimated"])
+    assert report["caches_partial"]
+    assert report["process"]["peak_rss_mb"] > 0
+
+
+def test_deep_size_counts_shared_objects_once():
+    shared = list(range(1000))
+    seen = {}
+    first = deep_size(shared, seen)
+    assert first > 0 and deep_size([shared], seen) < first
+
+
+def test_sampled_lru_cache_keeps_recent_distinct_values():
+    @sampled_lru_cache(maxsize=None)
+    def square(n):
+        return [n * n]
+
+    for n in list(range(SAMPLE_SIZE + 2)) + [0, 0]:
+        square(n)
+    samples = square.samples()
+    assert len(samples) == SAMPLE_SIZE and samples[-1] == [0]
+    assert square.cache_info().currsize == SAMPLE_SIZE + 2
+    square.cache_clear()
+    assert square.samples() == [] and square.cache_info().currsize == 0
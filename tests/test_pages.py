@@ -0,0 +1,34 @@
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest # type: ignore
+
+from beyondgdp.data import BASE_DIR
+
+THEME_PAGES = ["1_Economie.py", "2_Sante.py", "3_Education.py",
+               "4_Environnement.py", "5_Inegalites.py", "6_Societe.py"]
+
+
+def _run(page):
+    at = AppTest.from_file(os.path.join(BASE_DIR, "pages", page), default_timeout=120)
+    return at.run()
+
+
+@pytest.mark.parametrize("page", THEME_PAGES)
+def test_theme_page_renders(page):
+    at = _run(page)
+    assert not at.exception
+    html = [md.value for md in at.markdown]
+    # Bannière intégrée en data URI, définitions titrées en h4 par défaut
+    assert any("data:image/png;base64," in value for value in html)
+    assert any(value.startswith("<h4") for value in html)
+    assert len(at.get("plotly_chart")) >= 2
+
+
+def test_theme_page_follows_country_selection():
+    at = _run("2_Sante.py")
+    box = at.selectbox[0]
+    assert box.value == "France"
+    other = next(option for option in box.options if option != "France")
+    at = box.select(other).run()
+    assert not at.exception and at.selectbox[0].value == other
@@ -0,0 +1,59 @@
+import json
+import logging
+
+import pytest
+from streamlit.testing.v1 import AppTest # type: ignore
+
+from beyondgdp import profiling
+
+PAGE = """
+import time
+from beyondgdp import profiling
+
+profiling.start("Page de test")
+time.sleep(0.01)
+profiling.lap("chargement")
+profiling.lap("figures")
+profiling.finish()
+"""
+
+
+@pytest.fixture
+def enabled(tmp_path, monkeypatch):
+    """Mesure activée, journal dans un répertoire temporaire."""
+    log_path = tmp_path / "logs" / "timings.log"
+    monkeypatch.setattr(profiling, "ENABLED", True)
+    monkeypatch.setattr(profiling, "LOG_PATH", str(log_path))
+    monkeypatch.setattr(profiling, "_logger", None)
+    yield log_path
+    logger = logging.getLogger("beyondgdp.profiling")
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def test_run_records_sections_in_order():
+    run = profiling.Run("Accueil")
+    run.lap("chargement")
+    run.lap("carte")
+    assert [name for name, _ in run.spans] == ["chargement", "carte"]
+    assert all(seconds >= 0 for _, seconds in run.spans)
+
+
+def test_disabled_profiling_is_a_no_op(monkeypatch):
+    monkeypatch.setattr(profiling, "ENABLED", False)
+    profiling.start("Accueil")
+    profiling.lap("chargement")
+    profiling.finish()
+    assert getattr(profiling._local, "run", None) is None
+
+
+def test_enabled_profiling_logs_and_shows_panel(enabled):
+    at = AppTest.from_string(PAGE).run()
+    assert not at.exception
+    assert at.sidebar.expander[0].label.startswith("⏱️ Temps d'exécution")
+    assert at.sidebar.dataframe[0].value["section"].tolist() == ["chargement", "figures"]
+
+    record = json.loads(enabled.read_text(encoding="utf-8").splitlines()[-1])
+    assert record["page"] == "Page de test" and [name for name, _ in record["spans"]] == ["chargement", "figures"]
+    assert record["spans"][0][1] >= 10 and record["total_ms"] >= record["spans"][0][1]
@@ -0,0 +1,31 @@
+from beyondgdp.search import WordIndex, indicator_search, tokenize
+
+LABELS = [
+    "GDP per capita (current US$)",
+    "GNI per capita (current US$)",
+    "Gini index",
+]
+
+
+def test_tokenize_drops_stopwords_and_numbers():
+    assert tokenize("Quel est le PIB per capita de l'Inde en 2015 ?") == ["est", "pib", "capita", "inde"]
+
+
+def test_rare_words_outweigh_shared_ones():
+    index = WordIndex(LABELS)
+    assert index.idf["gini"] > index.idf["capita"]
+    ranked = index.search("gni per capita")
+    assert ranked[0][0] == "GNI per capita (current US$)"
+    assert {label for label, _ in ranked} == set(LABELS[:2])
+
+
+def test_search_limit_and_no_match():
+    index = WordIndex(LABELS)
+    assert len(index.search("capita current", limit=1)) == 1
+    assert index.search("espérance de vie") == []
+
+
+def test_indicator_search_is_shared(cube):
+    index = indicator_search(cube)
+    assert index is indicator_search(cube)
+    assert set(index.labels) == set(cube.indicators)
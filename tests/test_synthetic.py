@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from beyondgdp.entities import WDI_AGGREGATES
+from beyondgdp.ingestion import ID_COLUMNS, OUTPUT_COLUMNS, VARIABLES_SELECTION
+from beyondgdp.synthetic import PERIODIC, PERIODIC_YEARS, REAL_COUNTRIES, Generator, make_entities, write
+
+
+def test_entities_are_real_then_aggregates_then_synthetic():
+    n = len(REAL_COUNTRIES) + len(WDI_AGGREGATES) + 50
+    entities = make_entities(n)
+    names, codes = zip(*entities)
+    assert len(entities) == n and list(names) == sorted(names)
+    assert len(set(codes)) == n and all(len(code) == 3 for code in codes)
+    assert set(REAL_COUNTRIES.items()) <= set(entities)
+    assert sum(name.startswith("Synthetic economy") for name in names) == 50
+
+
+def test_generator_dimensions_and_indicators():
+    gen = Generator(30, len(VARIABLES_SELECTION) + 20, 2000, 2010, seed=1)
+    assert len(gen.entities) == 30 and list(gen.years) == list(range(2000, 2011))
+    assert [name for _, name, _ in gen.indicators[:len(VARIABLES_SELECTION)]] == list(VARIABLES_SELECTION.values())
+    blocks = [values for _, _, values in gen]
+    assert len(blocks) == 30 and all(values.shape == (len(gen.indicators), 11) for values in blocks)
+    # Publications ponctuelles : uniquement les années prévues
+    periodic = gen.profiles == PERIODIC
+    for values in blocks:
+        observed = ~np.isnan(values[periodic])
+        assert not observed[:, ~np.isin(gen.years, PERIODIC_YEARS)].any()
+
+
+@pytest.mark.parametrize("seed, same", [(7, True), (8, False)])
+def test_seed_determines_output(tmp_path, seed, same):
+    write(Generator(20, 15, 2000, 2005, seed=7), long_path=str(tmp_path / "a.csv"))
+    write(Generator(20, 15, 2000, 2005, seed=seed), long_path=str(tmp_path / "b.csv"))
+    a, b = (tmp_path / "a.csv").read_bytes(), (tmp_path / "b.csv").read_bytes()
+    assert (a == b) is same
+
+
+def test_long_and_wide_files_hold_the_same_values(tmp_path):
+    long_path, wide_path = tmp_path / "long.csv", tmp_path / "out" / "wide.csv"
+    n_values = write(Generator(25, 12, 1995, 2005, seed=3), long_path=str(long_path), wide_path=str(wide_path))
+
+    long = pd.read_csv(long_path)
+    wide = pd.read_csv(wide_path)
+    assert list(long.columns) == OUTPUT_COLUMNS and list(wide.columns[:len(ID_COLUMNS)]) == ID_COLUMNS
+    assert len(long) == n_values and not long["Value"].isna().any()
+
+    melted = (wide.drop(columns="Indicator Code")
+              .melt(id_vars=["Country Name", "Country Code", "Indicator Name"], var_name="Year", value_name="Value")
+              .dropna(subset=["Value"]))
+    melted["Year"] = melted["Year"].astype(int)
+    key = ["Country Code", "Indicator Name", "Year"]
+    merged = long.merge(melted, on=key, suffixes=("_long", "_wide"), validate="one_to_one")
+    assert len(merged) == len(long) == len(melted)
+    assert np.allclose(merged["Value_long"], merged["Value_wide"])